@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: Player objects vs. a columnar PlayerTable
+
+    python -m benchmarks.player_memory --players 100000
+"""
+
+import gc
+import random
+import tracemalloc
+
+import click
+
+from config.settings import NFL_TEAMS, VALID_POSITIONS
+from src.models.contract import Contract
+from src.models.player import Player
+from src.models.player_table import PlayerTable
+
+
+def build_players(count: int, seed: int = 0):
+    """A synthetic pool, two thirds of it under contract"""
+    rng = random.Random(seed)
+    players = []
+    for i in range(count):
+        player = Player(f"Player {i}", rng.choice(NFL_TEAMS), rng.choice(VALID_POSITIONS))
+        if i % 3:
+            player.contract = Contract(player.name, round(rng.uniform(1, 60), 2), rng.randint(1, 5))
+            player.roster_status = 'active'
+        player.fantasy_points = round(rng.uniform(0, 350), 1)
+        players.append(player)
+    return players
+
+
+def measure(build):
+    """Peak traced bytes allocated while building (and keeping) an object"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+@click.command()
+@click.option('--players', 'count', default=100_000, help="Players in the pool")
+@click.option('--seed', default=0, help="Seed for the synthetic pool")
+def main(count, seed):
+    """Compare the memory held by a player pool as objects and as columns"""
+    players, object_bytes = measure(lambda: build_players(count, seed))
+    table, table_bytes = measure(lambda: PlayerTable.from_players(players))
+
+    # Names and NFL teams are shared with the objects above, count the table's own lists too
+    print(f"{count:,} players")
+    print(f"  Player objects: {object_bytes / 1e6:8.2f} MB ({object_bytes / count:6.1f} B/player)")
+    print(f"  PlayerTable:    {table_bytes / 1e6:8.2f} MB ({table_bytes / count:6.1f} B/player), "
+          f"numeric columns {table.nbytes / 1e6:.2f} MB")
+    print(f"  Ratio:          {object_bytes / table_bytes:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
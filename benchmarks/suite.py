@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the model hot paths
+
+    python -m benchmarks.suite --sizes small,medium --output results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+
+Every benchmark runs against synthetic leagues of each requested size.
+Results are saved as JSON and, given a baseline file, compared against it.
+Timings only compare on the machine that made them, so baselines aren't
+checked in: record one with --output benchmarks/baseline.json before
+making changes, then compare against it.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import click
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, NFL_TEAMS
+from src.models.contract import Contract
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+from src.services.offseason import OffseasonEngine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Size name -> (teams, players in the league including free agents)
+SIZES = {
+    'small': (4, 1_000),
+    'medium': (12, 10_000),
+    'large': (32, 100_000),
+}
+
+ROSTER_POSITIONS = ["QB", "QB", "RB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "WR", "WR",
+                    "WR", "TE", "TE", "TE", "K", "D/ST", "RB", "WR", "WR", "QB", "TE", "RB", "WR"]
+POOL_POSITIONS = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "K", "D/ST"]
+ROOKIES_PER_TEAM = 4
+
+
+def build_league(num_teams: int, num_players: int, seed: int = 0) -> League:
+    """Synthetic league: full active rosters, rookies on the practice squad, the rest free agents
+
+    Salaries are skewed toward cheap deals, like a real cap, and fantasy
+    points are spread so every position has top performers and holdouts.
+    """
+    rng = random.Random(seed)
+    league = League(2025, max_teams=num_teams)
+    made = 0
+
+    def new_player(position: str) -> Player:
+        nonlocal made
+        player = Player(f"Player {made}", rng.choice(NFL_TEAMS), position)
+        player.fantasy_points = round(rng.uniform(0, 350), 1)
+        made += 1
+        return player
+
+    for t in range(num_teams):
+        team = Team(f"Team {t+1}", draft_position=t+1)
+        team.wins = rng.randint(0, LEAGUE_SETTINGS['regular_season_weeks'])
+        league.add_team(team)
+
+        for position in ROSTER_POSITIONS:
+            if made >= num_players:
+                break
+            player = new_player(position)
+            player.set_contract(Contract(player.name, round(1 + 59 * rng.random() ** 3, 2), rng.randint(1, 5)))
+            if not team.can_afford(player):
+                player.contract.current_salary = player.contract.initial_salary = 1.0
+            team.add_player(player)
+
+        for _ in range(ROOKIES_PER_TEAM):
+            if made >= num_players:
+                break
+            player = new_player(rng.choice(POOL_POSITIONS))
+            player.set_contract(Contract(player.name, 1.0, 3, is_rookie=True))
+            team.add_player(player, 'practice_squad')
+
+    league.add_free_agents([new_player(rng.choice(POOL_POSITIONS)) for _ in range(num_players - made)])
+    return league
+
+
+def _quiet(function: Callable) -> Callable:
+    """Silence a model method's progress prints while it's timed"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function()
+    return run
+
+
+# Benchmark name -> (league -> callable to time, whether the callable mutates the league).
+# Mutating benchmarks get a freshly built league for every round.
+BENCHMARKS: Dict[str, Tuple[Callable[[League], Callable], bool]] = {
+    'team_salary_used': (lambda league: lambda: [t.get_total_salary_used() for t in league.teams], False),
+    'position_averages': (lambda league: league._calculate_position_averages, False),
+    'process_holdouts': (lambda league: _quiet(league._process_holdouts), True),
+    'draft_order': (lambda league: league._determine_rookie_draft_order, False),
+    'advance_season': (lambda league: _quiet(league.advance_season), True),
+    'offseason_engine': (lambda league: OffseasonEngine(league, verbose=False).advance_season, True),
+}
+
+
+def time_call(function: Callable, rounds: int, min_time: float = 0.05) -> Dict[str, float]:
+    """Per-call timings over several rounds, looping fast calls so each round takes min_time"""
+    function() # Warm up
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+
+    times = [elapsed / number]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return _summarize(times, number)
+
+
+def time_fresh(setup: Callable[[], Callable], rounds: int) -> Dict[str, float]:
+    """Per-call timings of a mutating call, each round on a freshly set up state"""
+    times = []
+    for _ in range(rounds):
+        function = setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return _summarize(times, 1)
+
+
+def time_cli_startup(rounds: int) -> Dict[str, float]:
+    """Wall time of `python main.py --help` in a fresh interpreter"""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), '--help'],
+                       check=True, capture_output=True, cwd=ROOT)
+        times.append(time.perf_counter() - start)
+    return _summarize(times, 1)
+
+
+def _summarize(times: List[float], number: int) -> Dict[str, float]:
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'rounds': len(times),
+        'number': number,
+    }
+
+
+def run_suite(sizes: List[str], names: Optional[List[str]] = None, rounds: int = 5,
+              fresh_rounds: int = 3, seed: int = 0, log: Callable[[str], None] = print) -> Dict[str, Dict]:
+    """Run the benchmarks on every size
+
+    Returns:
+        'name[size]' -> timing summary in seconds per call
+    """
+    names = names or list(BENCHMARKS) + ['cli_startup']
+    results: Dict[str, Dict] = {}
+
+    if 'cli_startup' in names:
+        results['cli_startup'] = time_cli_startup(rounds)
+        log(f"cli_startup: {results['cli_startup']['median'] * 1e3:.1f} ms")
+
+    for size in sizes:
+        num_teams, num_players = SIZES[size]
+        start = time.perf_counter()
+        league = build_league(num_teams, num_players, seed)
+        log(f"[{size}] built {num_teams} teams, {num_players:,} players in {time.perf_counter() - start:.2f}s")
+
+        for name in names:
+            if name not in BENCHMARKS:
+                continue
+            setup, mutates = BENCHMARKS[name]
+            if mutates:
+                timing = time_fresh(lambda: setup(build_league(num_teams, num_players, seed)), fresh_rounds)
+            else:
+                timing = time_call(setup(league), rounds)
+            results[f"{name}[{size}]"] = timing
+            log(f"  {name}: {_format_seconds(timing['median'])}")
+
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            tolerance: float = 0.2) -> List[Tuple[str, float, float, float, str]]:
+    """Compare median timings to a baseline run
+
+    Returns:
+        (benchmark, baseline median, current median, ratio, verdict) for every
+        benchmark in both runs; verdict is 'slower' or 'faster' past the
+        tolerance, '' otherwise
+    """
+    rows = []
+    for key, timing in results.items():
+        if key not in baseline:
+            continue
+        before, after = baseline[key]['median'], timing['median']
+        ratio = after / before if before else float('inf')
+        verdict = 'slower' if ratio > 1 + tolerance else 'faster' if ratio < 1 - tolerance else ''
+        rows.append((key, before, after, ratio, verdict))
+    return rows
+
+
+def environment() -> Dict[str, str]:
+    """Where the results came from"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=ROOT).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+@click.command()
+@click.option('--sizes', default='small,medium,large', help="Comma-separated league sizes: small, medium, large")
+@click.option('--only', default=None, help="Comma-separated benchmark names (default: all)")
+@click.option('--rounds', default=5, help="Timed rounds per benchmark")
+@click.option('--fresh-rounds', default=3, help="Rounds for benchmarks that rebuild the league every round")
+@click.option('--seed', default=0, help="Seed for the synthetic leagues")
+@click.option('--output', type=click.Path(dir_okay=False), default=None, help="Save results as JSON")
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), default=None,
+              help="Compare against a saved results file")
+@click.option('--tolerance', default=0.2, help="Relative change that counts as slower or faster")
+@click.option('--fail-on-regression', is_flag=True, help="Exit with status 1 if anything got slower")
+def main(sizes, only, rounds, fresh_rounds, seed, output, baseline, tolerance, fail_on_regression):
+    """Time the model hot paths on synthetic leagues"""
+    size_names = [s.strip() for s in sizes.split(',') if s.strip()]
+    unknown = set(size_names) - set(SIZES)
+    if unknown:
+        raise click.BadParameter(f"Unknown sizes: {sorted(unknown)}", param_hint='--sizes')
+    names = [n.strip() for n in only.split(',')] if only else None
+
+    results = run_suite(size_names, names, rounds, fresh_rounds, seed)
+    report = {'environment': environment(), 'results': results}
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {output}")
+
+    if baseline:
+        with open(baseline, encoding='utf-8') as f:
+            rows = compare(results, json.load(f)['results'], tolerance)
+
+        print(f"\n{'benchmark':32} {'baseline':>12} {'current':>12} {'ratio':>7}")
+        for key, before, after, ratio, verdict in rows:
+            print(f"{key:32} {_format_seconds(before):>12} {_format_seconds(after):>12} {ratio:6.2f}x {verdict}")
+
+        if fail_on_regression and any(verdict == 'slower' for *_, verdict in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ LEAGUE_SETTINGS = {
     'teams': 12,
     'regular_season_weeks': 14,
     'playoff_weeks': 3,
+    'playoff_teams': 6,
     
     # Financial
     'salary_cap': 1006,
@@ -25,6 +26,12 @@ LEAGUE_SETTINGS = {
     # Draft settings
     'rookie_draft_rounds': 5,
     'auction_draft': True,
+    'rookie_lottery_balls': [30, 22, 18, 14, 10, 6],  # ping pong balls, worst record first
+    'rookie_contract_years': 3,
+    'rookie_round_salaries': [10.0, 6.0, 4.0, 2.0, 1.0],  # rookie contract salary by round
+
+    # Holdouts: players finishing in the top N at their position can hold out
+    'holdout_thresholds': {'QB': 5, 'TE': 5, 'RB': 10, 'WR': 15},
 }
 
 # Salary multipliers for roster status
@@ -61,3 +68,42 @@ ROSTER_REQUIREMENTS = {
         'FLEX_WR_TE': 1,
     }
 }
+
+# Free agent auction draft
+AUCTION_SETTINGS = {
+    'min_bid': 1.0,
+    'bid_increment': 1.0,
+    'contract_years': 3,
+}
+
+# Blind bidding for unrestricted free agents
+FREE_AGENCY_SETTINGS = {
+    'min_bid': 1.0,
+    'max_contract_years': 5,
+}
+
+# Franchise and transition tags on expiring contracts
+TAG_SETTINGS = {
+    'franchise_tags_per_team': 1,
+    'transition_tags_per_team': 1,
+}
+
+# Persistent league storage used by the CLI between invocations
+STORAGE_SETTINGS = {
+    'db_path': 'league.db',
+}
+
+# Append-only league transaction log and its snapshots
+TRANSACTION_LOG_SETTINGS = {
+    'directory': 'league_log',
+    'snapshot_interval': 500,   # events between periodic snapshots
+    'segment_events': 10_000,   # events per JSONL segment file
+}
+
+# Sleeper data source and its on-disk response cache
+SLEEPER_SETTINGS = {
+    'base_url': 'https://api.sleeper.app/v1',
+    'cache_dir': '.cache/sleeper',
+    'cache_ttl_seconds': 6 * 60 * 60,
+    'cache_max_bytes': 256 * 1024 * 1024,
+}
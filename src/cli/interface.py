@@ -4,31 +4,129 @@ La Liga Lebowski Fantasy Football Simulator CLI
 Basic interface for testing league functionality
 """
 
+from typing import TYPE_CHECKING
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich import print
 
-from src.models.player import Player
-from src.models.team import Team
-from src.models.league import League
-from src.models.contract import Contract
+from src.utils.instrumentation import Profiler, phase
+
+if TYPE_CHECKING:
+    import cProfile
+    from src.data.store import LeagueStore
+    from src.models.league import League
+
+# Commands import rich, the models and services when they run, so --help and
+# quick queries from scripts don't pay for what they don't use
+
+
+class _LazyConsole:
+    """Rich console created on first use"""
 
-console = Console()
+    def __init__(self):
+        self._console = None
+
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
 
 @click.group()
+@click.option('--db', envvar='LALIGA_DB', default=None,
+              help="Path to the league database (defaults to league.db)")
+@click.option('--profile', is_flag=True, help="Print a per-phase timing breakdown after the command")
+@click.option('--profile-stats', type=click.Path(dir_okay=False), default=None,
+              help="Run the command under cProfile and dump pstats output to this file")
 @click.pass_context
-def cli(ctx):
+def cli(ctx, db, profile, profile_stats):
     """La Liga Lebowski Fantasy Football Simulator"""
     ctx.ensure_object(dict)
-    # Initialize league
-    ctx.obj['league'] = League(2025)
+    ctx.obj['db'] = db
+
+    # Reports run when the command finishes, cProfile's first
+    if profile:
+        profiler = Profiler().start()
+        ctx.call_on_close(lambda: _report_profile(profiler))
+    if profile_stats:
+        import cProfile
+        stats_profile = cProfile.Profile()
+        stats_profile.enable()
+        ctx.call_on_close(lambda: _dump_profile_stats(stats_profile, profile_stats))
+
+
+def _store(ctx) -> 'LeagueStore':
+    """The league database, opened on first use"""
+    if 'store' not in ctx.obj:
+        from src.data.store import LeagueStore
+        ctx.obj['store'] = LeagueStore(ctx.obj['db'])
+    return ctx.obj['store']
+
+
+def _load_league(ctx) -> 'League':
+    """Load the persisted league, or start a fresh one if none is saved"""
+    from src.models.league import League
+
+    with phase('LeagueStore.load'):
+        league = _store(ctx).load()
+    return league if league is not None else League(2025)
+
+
+def _save_league(ctx, league: 'League'):
+    """Persist league state so the next command picks it up"""
+    with phase('LeagueStore.save'):
+        _store(ctx).save(league)
+
+
+def _report_profile(profiler: Profiler):
+    """Print where the command spent its time, by hooked phase"""
+    from rich.table import Table
+
+    profiler.stop()
+
+    table = Table(title=f"Profile ({profiler.wall_time * 1e3:,.1f} ms wall)")
+    table.add_column("Category")
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Mean (us)", justify="right")
+    table.add_column("% Wall", justify="right")
+
+    for row in profiler.summary():
+        share = row['total'] / profiler.wall_time if profiler.wall_time else 0.0
+        table.add_row(row['category'], row['name'], f"{row['calls']:,}", f"{row['total'] * 1e3:,.2f}",
+                      f"{row['mean'] * 1e6:,.1f}", f"{share:.1%}")
+    console.print(table)
+
+
+def _dump_profile_stats(stats_profile: 'cProfile.Profile', path: str):
+    """Save cProfile output for pstats/snakeviz and print the top functions"""
+    import io
+    import pstats
+
+    stats_profile.disable()
+    stats_profile.dump_stats(path)
+
+    stream = io.StringIO()
+    pstats.Stats(stats_profile, stream=stream).sort_stats('cumulative').print_stats(15)
+    console.print(stream.getvalue(), markup=False, highlight=False)
+    console.print(f"Saved cProfile stats to {path}")
+
 
 @cli.command()
 @click.pass_context
 def setup_demo(ctx):
     """Set up a demo league with sample teams and players"""
-    league = ctx.obj['league']
+    from src.models.contract import Contract
+    from src.models.league import League
+    from src.models.player import Player
+    from src.models.team import Team
+
+    # Always start from scratch, replacing any saved league
+    league = League(2025)
 
     # Create some demo teams
     team_names = ["Team Alpha", "Team Beta", "Team Gamma", "Team Delta"]
@@ -61,14 +159,59 @@ def setup_demo(ctx):
         except Exception as e:
             console.print(f"Error adding {name}: {e}")
 
+    _save_league(ctx, league)
     console.print(f"\nDemo league setup complete with {len(league.teams)} teams!")
 
 
+@cli.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--rejects', 'reject_path', default=None,
+              help="Where to write rejected rows (defaults to PATH.rejects.jsonl)")
+@click.option('--batch-size', default=1000, show_default=True, help="Players built per batch")
+@click.pass_context
+def import_players(ctx, path, reject_path, batch_size):
+    """Import players and contracts from a CSV or JSONL file"""
+    from src.data.player_loader import PlayerLoader
+
+    league = _load_league(ctx)
+    reject_path = reject_path or f"{path}.rejects.jsonl"
+    loader = PlayerLoader(path, reject_path, batch_size)
+
+    rostered = 0
+    for batch in loader:
+        free_agents = []
+        for player, row in batch:
+            if not row['fantasy_team']:
+                free_agents.append(player)
+                continue
+
+            team = league.get_team_by_name(row['fantasy_team'])
+            if not team:
+                loader.reject(row['line'], row, f"Unknown fantasy team: {row['fantasy_team']}")
+                continue
+
+            try:
+                team.add_player(player, row['roster_status'])
+                rostered += 1
+            except ValueError as e:
+                loader.reject(row['line'], row, str(e))
+
+        league.add_free_agents(free_agents)
+
+    _save_league(ctx, league)
+    console.print(f"Imported {loader.loaded} players ({rostered} rostered, "
+                  f"{loader.loaded - rostered} free agents)")
+    if loader.rejects.count:
+        console.print(f"Rejected {loader.rejects.count} rows, see {reject_path}")
+
+
 @cli.command()
 @click.pass_context
 def league_status(ctx):
     """Show current league status"""
-    league = ctx.obj['league']
+    from rich.table import Table
+
+    league = _load_league(ctx)
     stats = league.get_league_stats()
 
     console.print(f"\n[bold]La Liga Lebwoski - {stats['season_year']}[/bold]")
@@ -109,8 +252,9 @@ def league_status(ctx):
 @click.pass_context
 def team_roster(ctx, team_name):
     """Show detailed roster for a specific team"""
-    league = ctx.obj['league']
-    team = league.get_team_by_name(team_name)
+    from rich.table import Table
+
+    team = _store(ctx).load_team(team_name)
 
     if not team:
         console.print(f" Team '{team_name}' not found")
@@ -151,7 +295,7 @@ def team_roster(ctx, team_name):
 @click.pass_context
 def advance_season(ctx):
     """Advance the league to the next season"""
-    league = ctx.obj['league']
+    league = _load_league(ctx)
 
     console.print(f"Advancing from {league.season_year} season...")
 
@@ -162,17 +306,69 @@ def advance_season(ctx):
     old_cap = league.current_salary_cap
     league.advance_season()
     new_cap = league.current_salary_cap
+    _save_league(ctx, league)
 
     console.print(f"Season advanced to {league.season_year}")
     console.print(f"Salary cap increased from ${old_cap:,.2f} to ${new_cap:,.2f}")
 
-    # Show any cap violations
+    # Show any cap violations and the cheapest way to fix them
     violations = league._validate_salary_caps()
     if violations:
+        from src.services.cap_compliance import CapComplianceSolver
+
         console.print(f"Salary cap violations detected:")
-        for team in violations:
-            overage = team.get_total_salary_used() - team.salary_cap
-            console.print(f"    {team.name}: ${overage:,.2f} over cap")
+        for plan in CapComplianceSolver(league).solve(violations):
+            console.print(f"    {plan['team'].name}: ${plan['overage']:,.2f} over cap")
+            _print_cap_plan(plan, indent="        ")
+        console.print("Run 'fix-cap --apply' to make these moves")
+
+
+@cli.command()
+@click.argument('team_name', required=False)
+@click.option('--apply', 'apply_moves', is_flag=True, help="Make the moves instead of just listing them")
+@click.pass_context
+def fix_cap(ctx, team_name, apply_moves):
+    """Find the cheapest roster moves to get over-cap teams under the cap"""
+    from src.services.cap_compliance import CapComplianceSolver
+
+    league = _load_league(ctx)
+    teams = league.teams
+    if team_name:
+        team = league.get_team_by_name(team_name)
+        if not team:
+            console.print(f"Team '{team_name}' not found")
+            return
+        teams = [team]
+
+    solver = CapComplianceSolver(league)
+    plans = solver.solve(teams)
+    if not plans:
+        console.print("All teams are under the salary cap")
+        return
+
+    for plan in plans:
+        console.print(f"\n[bold]{plan['team'].name}[/bold]: ${plan['overage']:,.2f} over cap")
+        _print_cap_plan(plan, indent="    ")
+        if apply_moves and plan['feasible']:
+            solver.apply(plan)
+
+    if apply_moves:
+        _save_league(ctx, league)
+        console.print("\nMoves applied")
+
+
+def _print_cap_plan(plan: dict, indent: str):
+    """List a cap plan's moves"""
+    if not plan['feasible']:
+        console.print(f"{indent}No combination of moves gets under the cap")
+        return
+
+    labels = {'cut': "Cut", 'practice_squad': "Move to practice squad", 'IR': "Move to IR",
+              'reject_holdout': "Reject holdout of"}
+    for move in plan['moves']:
+        console.print(f"{indent}{labels[move['move']]} {move['player'].name} "
+                      f"(saves ${move['savings']:,.2f}, {move['value_lost']:.1f} pts)")
+    console.print(f"{indent}Total: saves ${plan['savings']:,.2f}, {plan['value_lost']:.1f} pts given up")
 
 
 @cli.command()
@@ -182,31 +378,31 @@ def advance_season(ctx):
 @click.pass_context
 def extend_player(ctx, team_name, player_name, years):
     """Extend a player's contract"""
-    league = ctx.obj['league']
-    team = league.get_team_by_name(team_name)
+    from src.models.registry import PlayerRegistry
+
+    store = _store(ctx)
+    team = store.load_team(team_name)
 
     if not team:
         console.print(f"Team '{team_name}' not found")
         return
 
-    # Find player on team
-    player = None
+    # Find player on team, through a registry of just this roster
+    registry = PlayerRegistry()
     for roster_list in team.roster.values():
         for p in roster_list:
-            if p.name.lower() == player_name.lower():
-                player = p
-                break
-        if player:
-            break
-    
-    if not player:
+            registry.add(p)
+    matches = registry.query(name=player_name, fantasy_team=team.name)
+    if not matches:
         console.print(f"Player '{player_name}' not found on {team_name}")
         return
+    player = matches[0]
 
     try:
         old_salary = player.get_current_salary()
-        salary_increase = player.extend_contract(years)
+        salary_increase = team.extend_player_contract(player, years)
         new_salary = player.get_current_salary()
+        store.save_team(team)
 
         console.print(f"Extended {player.name} for {years} additional years")
         console.print(f"Salary: ${old_salary:.2f} -> ${new_salary:.2f} (+${salary_increase:.2f})")
@@ -216,16 +412,47 @@ def extend_player(ctx, team_name, player_name, years):
         console.print(f"Cannot extend contract: {e}")
 
 
+@cli.command()
+@click.argument('team_name')
+@click.option('--top', default=3, help="Number of plans to show")
+@click.option('--horizon', default=5, help="Seasons to plan over")
+@click.pass_context
+def plan_extensions(ctx, team_name, top, horizon):
+    """Suggest the extensions that add the most projected points under future caps"""
+    from src.services.extension_planner import ExtensionPlanner
+
+    league = _load_league(ctx)
+    team = league.get_team_by_name(team_name)
+    if not team:
+        console.print(f"Team '{team_name}' not found")
+        return
+
+    plans = ExtensionPlanner(team, horizon=horizon).plan(k=top)
+    if not plans or not plans[0]['extensions']:
+        console.print(f"No extensions for {team.name} fit under the projected caps")
+        return
+
+    for i, plan in enumerate(plans, 1):
+        console.print(f"\n[bold]Plan {i}[/bold]: +{plan['points']:.1f} pts for ${plan['cost']:,.2f} "
+                      f"over {horizon} seasons ({plan['points_per_dollar']:.2f} pts/$)")
+        for player, years in plan['extensions'].items():
+            console.print(f"    Extend {player.name} {years}yr")
+        console.print(f"    Cap space left: " + ", ".join(f"${space:,.0f}" for space in plan['cap_space']))
+
+
 @cli.command()
 @click.pass_context
 def check_holdouts(ctx):
     """Check for potential holdouts across the league"""
-    league = ctx.obj['league']
+    from rich.table import Table
+
+    league = _load_league(ctx)
 
     console.print("Checking for potential holdouts...")
 
-    # Calculate position averages
+    # Calculate position averages and this season's rankings
     position_averages = league._calculate_position_averages()
+    rankings = league.season_rankings or league.rank_season()
 
     holdouts_found = False
     for team in league.teams:
@@ -233,17 +460,19 @@ def check_holdouts(ctx):
 
         for roster_list in team.roster.values():
             for player in roster_list:
-                if player.contract:
-                    pos_avg = position_averages.get(player.position, 0)
-                    if pos_avg > 0:
-                        # Check if player would hold out
-                        current_salary = player.contract.current_salary
-                        threshold = pos_avg * 0.5
-
-                        if (current_salary < threshold and
-                            player.fantasy_points > 0): # Has performance data
-                            demands = pos_avg * 0.75
-                            team_holdouts.append((player, demands))
+                if not player.check_holdout_eligibility(rankings):
+                    continue
+
+                pos_avg = position_averages.get(player.position, 0)
+                if pos_avg > 0:
+                    # Check if player would hold out
+                    current_salary = player.contract.current_salary
+                    threshold = pos_avg * 0.5
+
+                    if (current_salary < threshold and
+                        player.fantasy_points > 0): # Has performance data
+                        demands = pos_avg * 0.75
+                        team_holdouts.append((player, demands))
 
         if team_holdouts:
             holdouts_found = True
@@ -273,27 +502,82 @@ def check_holdouts(ctx):
 
 
 @cli.command()
+@click.option('--rookies', 'rookies_path', type=click.Path(exists=True, dir_okay=False), required=True,
+              help="CSV or JSONL of draft-eligible rookies")
+@click.option('--mock', is_flag=True, help="Show the draft without signing anyone")
 @click.pass_context
-def simulate_draft(ctx):
-    """Simulate a basic rookie draft"""
-    league = ctx.obj['league']
+def simulate_draft(ctx, rookies_path, mock):
+    """Simulate the rookie draft"""
+    from rich.table import Table
+    from src.data.player_loader import PlayerLoader
+    from src.services.rookie_draft import RookieDraft
+
+    league = _load_league(ctx)
 
     if not league.rookie_draft_order:
         console.print("Draft order not set. Run 'advance_season' first.")
         return
 
-    console.print("[bold]Rookie Draft Simulation[/bold]")
-    console.print("Draft Order:")
+    # Uncontracted free agents include veterans whose deals expired, so rookies always come from a file
+    rookies = [player for batch in PlayerLoader(rookies_path) for player, _ in batch]
+
+    picks = RookieDraft(league, rookies).run(apply=not mock)
+    if not mock:
+        _save_league(ctx, league)
+
+    console.print(f"[bold]Rookie Draft {'Mock ' if mock else ''}Results[/bold]")
 
     table = Table()
     table.add_column("Pick", justify="right", style="cyan")
+    table.add_column("Round", justify="right")
     table.add_column("Team", style="magenta")
-    
-    for i, team in enumerate(league.rookie_draft_order, 1):
-        table.add_row(str(i), team.name)
-    
+    table.add_column("Player", style="green")
+    table.add_column("Position")
+    table.add_column("Salary", justify="right")
+    table.add_column("Roster")
+
+    for pick in picks:
+        player = pick['player']
+        table.add_row(
+                str(pick['pick']),
+                str(pick['round']),
+                pick['team'].name,
+                player.name if player else "(forfeited)",
+                player.position if player else "",
+                f"${pick['salary']:.2f}",
+                pick['roster_type'] or ""
+        )
+
     console.print(table)
-    console.print("\n(Full draft simulation coming soon!)")
+
+
+@cli.command()
+@click.option('--draws', default=1_000_000, show_default=True, help="Simulated lotteries to check against")
+@click.option('--seed', type=int, default=None, help="Seed for the simulated lotteries")
+def lottery_odds(draws, seed):
+    """Show rookie lottery pick odds for each lottery seed"""
+    from rich.table import Table
+    from config.settings import LEAGUE_SETTINGS
+    from src.services.rookie_draft import lottery_odds as exact_lottery_odds, simulate_lottery_odds
+
+    balls = LEAGUE_SETTINGS['rookie_lottery_balls']
+    exact = exact_lottery_odds(balls)
+
+    table = Table(title="Rookie Lottery Odds")
+    table.add_column("Seed", justify="right", style="cyan")
+    table.add_column("Balls", justify="right")
+    for pick in range(len(balls)):
+        table.add_column(f"Pick {pick + 1}", justify="right")
+
+    for seed_num, (team_balls, odds) in enumerate(zip(balls, exact), 1):
+        table.add_row(str(seed_num), str(team_balls), *[f"{p:.2%}" for p in odds])
+
+    console.print(table)
+
+    if draws:
+        simulated = simulate_lottery_odds(balls, draws, seed)
+        console.print(f"Largest gap vs {draws:,} simulated lotteries: {abs(simulated - exact).max():.3%}")
+
 
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,187 @@
+import csv
+import json
+import math
+import os
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import VALID_POSITIONS, NFL_TEAMS
+from src.models.contract import Contract
+from src.models.player import Player
+
+# Set lookups for validating every row
+POSITIONS = frozenset(VALID_POSITIONS)
+TEAMS = frozenset(NFL_TEAMS)
+
+TRUE_VALUES = frozenset(["1", "true", "yes", "y", "t"])
+
+# A parsed input row with the line it came from
+Row = Tuple[int, Dict[str, Any]]
+
+
+def read_rows(path: str) -> Iterator[Row]:
+    """Stream rows from a CSV or newline-delimited JSON file"""
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, newline='', encoding='utf-8') as f:
+        if extension == '.csv':
+            # Line 1 is the header
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+        elif extension in ('.jsonl', '.ndjson', '.json'):
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    row = {'_error': f"Invalid JSON: {e.msg}", '_raw': line.rstrip('\n')}
+                yield line_no, row
+        else:
+            raise ValueError(f"Unsupported player file type: {extension} (use .csv or .jsonl)")
+
+
+def validate_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize one raw row, raising ValueError if it can't become a player"""
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+    if '_error' in row:
+        raise ValueError(row['_error'])
+
+    name = str(row.get('name') or '').strip()
+    if not name:
+        raise ValueError("Missing player name")
+
+    position = str(row.get('position') or '').strip().upper()
+    if position not in POSITIONS:
+        raise ValueError(f"Invalid position: {position or '<empty>'}")
+
+    nfl_team = str(row.get('nfl_team') or '').strip().upper()
+    if nfl_team not in TEAMS:
+        raise ValueError(f"Invalid NFL team: {nfl_team or '<empty>'}")
+
+    clean = {
+            'name': name,
+            'position': position,
+            'nfl_team': nfl_team,
+            'rank': _optional(row, 'rank', int),
+            'fantasy_points': _optional(row, 'fantasy_points', float) or 0.0,
+            'salary': _optional(row, 'salary', float),
+            'years': _optional(row, 'years', int),
+            'is_rookie': str(row.get('is_rookie') or '').strip().lower() in TRUE_VALUES,
+            'start_year': _optional(row, 'start_year', int),
+            'fantasy_team': str(row.get('fantasy_team') or '').strip() or None,
+            'roster_status': str(row.get('roster_status') or '').strip() or 'active',
+    }
+
+    if (clean['salary'] is None) != (clean['years'] is None):
+        raise ValueError("Contract needs both salary and years")
+    if clean['salary'] is not None and (clean['salary'] < 0 or clean['years'] <= 0):
+        raise ValueError("Contract salary must be >= 0 and years > 0")
+    if clean['fantasy_team'] and clean['salary'] is None:
+        raise ValueError(f"{name} needs a contract to join {clean['fantasy_team']}")
+
+    return clean
+
+
+def build_player(row: Dict[str, Any]) -> Player:
+    """Build a Player, with a Contract when the row has one, from a validated row"""
+    player = Player(row['name'], row['nfl_team'], row['position'], rank=row['rank'])
+    player.fantasy_points = row['fantasy_points']
+
+    if row['salary'] is not None:
+        player.contract = Contract(row['name'], row['salary'], row['years'],
+                                   is_rookie=row['is_rookie'], start_year=row['start_year'])
+    return player
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[List]:
+    """Group an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class RejectWriter:
+    """Collects rows that failed to load and writes them to a reject file"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+
+    def write(self, line_no: int, row: Dict[str, Any], error: str):
+        """Record a rejected row with the reason it was rejected"""
+        self.count += 1
+        if self.path is None:
+            return
+
+        if self._file is None:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        record = {'line': line_no, 'error': error, 'row': row}
+        self._file.write(json.dumps(record, default=str) + '\n')
+
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PlayerLoader:
+    """Streams a player/contract file into batches of Player objects
+
+    Rows flow through read -> validate -> build generators, so memory use
+    stays flat no matter how large the file is. Invalid rows are sent to
+    the reject writer instead of stopping the load.
+    """
+
+    def __init__(self, path: str, reject_path: Optional[str] = None, batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self.rejects = RejectWriter(reject_path)
+        self.loaded = 0
+
+
+    def __iter__(self) -> Iterator[List[Tuple[Player, Dict[str, Any]]]]:
+        """Yield batches of (player, validated row) pairs"""
+        try:
+            yield from batched(self._build(self._validate(read_rows(self.path))), self.batch_size)
+        finally:
+            self.rejects.close()
+
+
+    def reject(self, line_no: int, row: Dict[str, Any], error: str):
+        """Reject a row that was built but could not be placed (e.g. roster full)"""
+        self.loaded -= 1
+        self.rejects.write(line_no, row, error)
+
+
+    def _validate(self, rows: Iterable[Row]) -> Iterator[Row]:
+        for line_no, row in rows:
+            try:
+                yield line_no, validate_row(row)
+            except ValueError as e:
+                self.rejects.write(line_no, row, str(e))
+
+
+    def _build(self, rows: Iterable[Row]) -> Iterator[Tuple[Player, Dict[str, Any]]]:
+        for line_no, row in rows:
+            self.loaded += 1
+            row['line'] = line_no
+            yield build_player(row), row
+
+
+def _optional(row: Dict[str, Any], field: str, cast):
+    """Cast an optional field, treating empty values as missing"""
+    value = row.get(field)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        result = cast(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Invalid {field}: {value!r}")
+    if isinstance(result, float) and not math.isfinite(result):
+        raise ValueError(f"Invalid {field}: {value!r}")
+    return result
@@ -0,0 +1,369 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, SLEEPER_SETTINGS
+from src.models.registry import normalize_name
+from src.services.scoring import ScoringEngine
+
+# Sleeper stat fields -> SCORING_SETTINGS stat names
+SLEEPER_STAT_COLUMNS = {
+    'pass_td': 'passing_td',
+    'pass_yd': 'passing_yards',
+    'pass_2pt': 'passing_2pt',
+    'pass_int': 'interception',
+    'rush_td': 'rushing_td',
+    'rush_yd': 'rushing_yards',
+    'rush_2pt': 'rushing_2pt',
+    'rec_td': 'receiving_td',
+    'rec_yd': 'receiving_yards',
+    'rec': 'reception',
+    'rec_2pt': 'receiving_2pt',
+    'fum_lost': 'fumble_lost',
+}
+
+
+class HttpBackend:
+    """Fetches raw Sleeper payloads over HTTP"""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0):
+        self.base_url = (base_url or SLEEPER_SETTINGS['base_url']).rstrip('/')
+        self.timeout = timeout
+
+
+    def fetch(self, path: str) -> bytes:
+        try:
+            with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            raise LookupError(f"Sleeper returned {e.code} for {path}") from e
+
+
+class FixtureBackend:
+    """Serves Sleeper-shaped payloads from local JSON files
+
+    A request for /stats/nfl/regular/2024/1 reads
+    <directory>/stats/nfl/regular/2024/1.json.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+
+    def fetch(self, path: str) -> bytes:
+        file_path = os.path.join(self.directory, *path.strip('/').split('/')) + '.json'
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError as e:
+            raise LookupError(f"No fixture for {path}") from e
+
+
+class FixtureServer:
+    """Local stand-in for the Sleeper API that serves a fixture directory
+
+    Use as a context manager and point an HttpBackend at server.url.
+    """
+
+    def __init__(self, directory: str, host: str = '127.0.0.1', port: int = 0):
+        fixtures = FixtureBackend(directory)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                try:
+                    body = fixtures.fetch(self.path.split('?')[0].replace('/v1', '', 1))
+                except LookupError:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # Keep test output quiet
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: Optional[threading.Thread] = None
+
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+    def start(self) -> 'FixtureServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ResponseCache:
+    """Content-addressed on-disk response cache with TTL and size-bounded eviction
+
+    Payloads are stored once under the SHA-256 of their bytes; an index maps
+    each request to its payload digest, fetch time and last use. When the
+    cache grows past max_bytes the least recently used requests are evicted.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None, clock: Callable[[], float] = time.time):
+        self.directory = directory or SLEEPER_SETTINGS['cache_dir']
+        self.ttl = ttl if ttl is not None else SLEEPER_SETTINGS['cache_ttl_seconds']
+        self.max_bytes = max_bytes if max_bytes is not None else SLEEPER_SETTINGS['cache_max_bytes']
+        self.clock = clock
+
+        os.makedirs(os.path.join(self.directory, 'objects'), exist_ok=True)
+        self._index_path = os.path.join(self.directory, 'index.json')
+        self._index: Dict[str, Dict[str, Any]] = self._read_index()
+
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the payload digest for a request, or None if missing or expired"""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+
+        now = self.clock()
+        if now - entry['fetched_at'] > self.ttl or not os.path.exists(self._object_path(entry['digest'])):
+            self._drop(key)
+            self._write_index()
+            return None
+
+        # Persist the use so eviction order holds across processes
+        entry['last_used'] = now
+        self._write_index()
+        return entry['digest']
+
+
+    def read(self, digest: str) -> bytes:
+        with open(self._object_path(digest), 'rb') as f:
+            return f.read()
+
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store a payload for a request and return its digest"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            # Write then rename so readers never see a partial payload
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        now = self.clock()
+        self._index[key] = {'digest': digest, 'size': len(data), 'fetched_at': now, 'last_used': now}
+        self._evict()
+        self._write_index()
+        return digest
+
+
+    def size(self) -> int:
+        """Total bytes of payloads referenced by the index"""
+        return sum(size for size in self._object_sizes().values())
+
+
+    def _evict(self):
+        """Evict least recently used requests until the cache fits in max_bytes"""
+        references = Counter(e['digest'] for e in self._index.values())
+        total = self.size()
+        for key in sorted(self._index, key=lambda k: self._index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            entry = self._index.pop(key)
+            references[entry['digest']] -= 1
+            if not references[entry['digest']]:
+                total -= entry['size']
+                self._remove_object(entry['digest'])
+
+
+    def _drop(self, key: str):
+        entry = self._index.pop(key)
+        # Other requests may share the same content
+        if all(e['digest'] != entry['digest'] for e in self._index.values()):
+            self._remove_object(entry['digest'])
+
+
+    def _remove_object(self, digest: str):
+        try:
+            os.remove(self._object_path(digest))
+        except FileNotFoundError:
+            pass
+
+
+    def _object_sizes(self) -> Dict[str, int]:
+        return {e['digest']: e['size'] for e in self._index.values()}
+
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'objects', f"{digest}.json")
+
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+
+    def _write_index(self):
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+
+class SleeperClient:
+    """Reads Sleeper player and stats payloads through a pluggable backend
+
+    Responses are cached on disk by content, and parsed payloads are kept in
+    memory by digest, so repeat season advances and holdout checks neither
+    re-fetch nor re-parse the same data.
+    """
+
+    def __init__(self, backend=None, cache: Optional[ResponseCache] = None,
+                 scoring: Optional[ScoringEngine] = None):
+        self.backend = backend or HttpBackend()
+        self.cache = cache
+        self.scoring = scoring or ScoringEngine()
+        self.fetch_count = 0
+
+        self._parsed: Dict[str, Any] = {}
+        self._season_points: Dict[int, Dict[str, float]] = {}
+        self._season_names: Dict[int, Dict[str, List[str]]] = {} # Normalized name -> ids with stats
+        self._season_players: Dict[int, Dict[str, Dict[str, Any]]] = {}
+
+
+    def players(self) -> Dict[str, Dict[str, Any]]:
+        """Get all NFL players keyed by Sleeper player id"""
+        return self._get_json('/players/nfl')
+
+
+    def weekly_stats(self, season: int, week: int) -> Dict[str, Dict[str, float]]:
+        """Get one week of regular season stats keyed by Sleeper player id"""
+        return self._get_json(f'/stats/nfl/regular/{season}/{week}')
+
+
+    def season_points(self, season: int) -> Dict[str, float]:
+        """Score a full fantasy season of weekly stats with the league's scoring
+
+        Weeks Sleeper has no stats for count as weeks without games.
+
+        Returns:
+            Sleeper player id -> season fantasy points
+        """
+        if season in self._season_points:
+            return self._season_points[season]
+
+        weeks = LEAGUE_SETTINGS['regular_season_weeks'] + LEAGUE_SETTINGS['playoff_weeks']
+        weekly = [self._weekly_stats_or_empty(season, week) for week in range(1, weeks + 1)]
+        player_ids = sorted({pid for stats in weekly for pid in stats})
+        row_of = {pid: i for i, pid in enumerate(player_ids)}
+
+        # Columnar (players, weeks) arrays in scoring stat names
+        columns = {stat: np.zeros((len(player_ids), weeks)) for stat in SLEEPER_STAT_COLUMNS.values()}
+        for week, stats in enumerate(weekly):
+            for pid, line in stats.items():
+                for sleeper_stat, stat in SLEEPER_STAT_COLUMNS.items():
+                    if sleeper_stat in line:
+                        columns[stat][row_of[pid], week] = line[sleeper_stat]
+
+        points = self.scoring.score_seasons(columns).tolist() if player_ids else []
+        players = self.players()
+        by_name: Dict[str, List[str]] = {}
+        for pid in player_ids:
+            info = players.get(pid)
+            if info and info.get('full_name'):
+                by_name.setdefault(normalize_name(info['full_name']), []).append(pid)
+
+        self._season_names[season] = by_name
+        self._season_players[season] = players
+        self._season_points[season] = dict(zip(player_ids, points))
+        return self._season_points[season]
+
+
+    def apply_season_points(self, league, season: int) -> int:
+        """Set fantasy_points on every league player Sleeper has stats for
+
+        League players are matched to Sleeper players by name, with position
+        and NFL team telling apart Sleeper players who share a name. Players
+        who can't be told apart are left alone.
+
+        Returns:
+            Number of players updated
+        """
+        points = self.season_points(season)
+        players = self._season_players[season]
+
+        updated = 0
+        for name, pids in self._season_names[season].items():
+            for player in league.players.find_by_name(name):
+                pid = self._match(player, pids, players)
+                if pid is not None:
+                    player.fantasy_points = points[pid]
+                    updated += 1
+        return updated
+
+
+    def _weekly_stats_or_empty(self, season: int, week: int) -> Dict[str, Dict[str, float]]:
+        try:
+            return self.weekly_stats(season, week)
+        except LookupError:
+            return {}
+
+
+    @staticmethod
+    def _match(player, pids: List[str], players: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """The one Sleeper id among same-named players that fits a league player, if any"""
+        if len(pids) == 1:
+            return pids[0]
+        for fits in (lambda info: info.get('position') == player.position and info.get('team') == player.nfl_team,
+                     lambda info: info.get('position') == player.position):
+            matches = [pid for pid in pids if fits(players[pid])]
+            if len(matches) == 1:
+                return matches[0]
+        return None
+
+
+    def _get_json(self, path: str) -> Any:
+        digest = self.cache.get(path) if self.cache else None
+        if digest is None:
+            data = self.backend.fetch(path)
+            self.fetch_count += 1
+            digest = self.cache.put(path, data) if self.cache else hashlib.sha256(data).hexdigest()
+        else:
+            data = None
+
+        if digest not in self._parsed:
+            if data is None:
+                data = self.cache.read(digest)
+            self._parsed[digest] = json.loads(data)
+        return self._parsed[digest]
@@ -0,0 +1,338 @@
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import STORAGE_SETTINGS
+from src.models.contract import Contract
+from src.models.player import Player
+from src.models.team import Team
+from src.models.league import League
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS league (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    season_year INTEGER NOT NULL,
+    current_salary_cap REAL NOT NULL,
+    current_phase TEXT NOT NULL,
+    current_week INTEGER NOT NULL,
+    rookie_draft_order TEXT NOT NULL,
+    auction_nomination_order TEXT NOT NULL,
+    season_stats TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS teams (
+    name TEXT PRIMARY KEY,
+    slot INTEGER NOT NULL,
+    draft_position INTEGER,
+    salary_cap REAL NOT NULL,
+    dead_money REAL NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    roster_team TEXT,
+    roster_type TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    nfl_team TEXT NOT NULL,
+    position TEXT NOT NULL,
+    rank INTEGER,
+    fantasy_team TEXT,
+    roster_status TEXT NOT NULL,
+    fantasy_points REAL NOT NULL,
+    position_rank_end_of_season INTEGER,
+    is_holdout INTEGER NOT NULL,
+    holdout_demands REAL,
+    is_retired INTEGER NOT NULL,
+    season_stats TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS players_by_team ON players (roster_team, roster_type, slot);
+
+CREATE TABLE IF NOT EXISTS contracts (
+    player_id INTEGER PRIMARY KEY REFERENCES players (id),
+    player_name TEXT NOT NULL,
+    initial_salary REAL NOT NULL,
+    total_years INTEGER NOT NULL,
+    years_remaining INTEGER NOT NULL,
+    is_rookie INTEGER NOT NULL,
+    start_year INTEGER NOT NULL,
+    current_salary REAL NOT NULL,
+    has_been_extended INTEGER NOT NULL,
+    is_franchise_tagged INTEGER NOT NULL,
+    is_transition_tagged INTEGER NOT NULL
+);
+"""
+
+# Pseudo roster type for players sitting in League.free_agents
+FREE_AGENT_POOL = 'free_agents'
+
+PLAYER_COLUMNS = ("id, roster_team, roster_type, slot, name, nfl_team, position, rank, "
+                  "fantasy_team, roster_status, fantasy_points, position_rank_end_of_season, "
+                  "is_holdout, holdout_demands, is_retired, season_stats")
+
+CONTRACT_COLUMNS = ("player_name, initial_salary, total_years, years_remaining, is_rookie, "
+                    "start_year, current_salary, has_been_extended, is_franchise_tagged, "
+                    "is_transition_tagged")
+
+
+class LeagueStore:
+    """Persists league state in a SQLite database between CLI invocations"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or STORAGE_SETTINGS['db_path']
+
+
+    def exists(self) -> bool:
+        """Check if a league has been saved to this store"""
+        if not os.path.exists(self.path):
+            return False
+
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT 1 FROM league WHERE id = 1").fetchone() is not None
+        finally:
+            conn.close()
+
+
+    def save(self, league: League):
+        """Replace the stored league with the given league state"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM contracts")
+                conn.execute("DELETE FROM players")
+                conn.execute("DELETE FROM teams")
+                conn.execute("DELETE FROM league")
+
+                conn.execute(
+                        "INSERT INTO league VALUES (1, ?, ?, ?, ?, ?, ?, ?)",
+                        (league.season_year,
+                         league.current_salary_cap,
+                         league.current_phase,
+                         league.current_week,
+                         json.dumps([t.name for t in league.rookie_draft_order]),
+                         json.dumps([t.name for t in league.auction_nomination_order]),
+                         json.dumps(league.season_stats))
+                )
+
+                for slot, team in enumerate(league.teams):
+                    self._insert_team(conn, team, slot)
+
+                # Signed free agents can linger in the pool list, their roster row wins
+                rostered = {id(p) for team in league.teams
+                            for roster_list in team.roster.values() for p in roster_list}
+                free_agents = [p for p in league.free_agents if id(p) not in rostered]
+                for slot, player in enumerate(free_agents):
+                    self._insert_player(conn, player, None, FREE_AGENT_POOL, slot)
+        finally:
+            conn.close()
+
+
+    def save_team(self, team: Team):
+        """Rewrite a single team's row and roster, leaving the rest of the league untouched"""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT slot FROM teams WHERE name = ?", (team.name,)).fetchone()
+                if row is None:
+                    raise ValueError(f"Team '{team.name}' has not been saved to this league")
+
+                self._delete_team_players(conn, team.name)
+                conn.execute("DELETE FROM teams WHERE name = ?", (team.name,))
+                self._insert_team(conn, team, row['slot'])
+        finally:
+            conn.close()
+
+
+    def load(self) -> Optional[League]:
+        """Load the full league, or None if nothing has been saved yet"""
+        if not os.path.exists(self.path):
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM league WHERE id = 1").fetchone()
+            if row is None:
+                return None
+
+            league = League(row['season_year'])
+            league.current_salary_cap = row['current_salary_cap']
+            league.current_phase = row['current_phase']
+            league.current_week = row['current_week']
+            league.season_stats.update(json.loads(row['season_stats']))
+
+            teams = {}
+            for team_row in conn.execute("SELECT * FROM teams ORDER BY slot"):
+                team = _build_team(team_row)
+                teams[team.name] = team
+
+            free_agents = []
+            for roster_team, roster_type, player in self._iter_players(conn):
+                if roster_team is None:
+                    free_agents.append(player)
+                else:
+                    teams[roster_team].roster[roster_type].append(player)
+
+            # Add fully built teams so the league indexes their rosters
+            league.max_teams = max(league.max_teams, len(teams))
+            for team in teams.values():
+                team.rebuild_cap_ledger()
+                salary_cap = team.salary_cap
+                league.add_team(team)
+                team.salary_cap = salary_cap
+
+            for player in free_agents:
+                league.add_free_agent(player)
+
+            league.rookie_draft_order = [teams[n] for n in json.loads(row['rookie_draft_order'])]
+            league.auction_nomination_order = [teams[n] for n in json.loads(row['auction_nomination_order'])]
+            return league
+        finally:
+            conn.close()
+
+
+    def load_team(self, name: str) -> Optional[Team]:
+        """Load a single team and its roster without touching the rest of the league"""
+        if not os.path.exists(self.path):
+            return None
+
+        conn = self._connect()
+        try:
+            team_row = conn.execute("SELECT * FROM teams WHERE name = ?", (name,)).fetchone()
+            if team_row is None:
+                return None
+
+            team = _build_team(team_row)
+            for _, roster_type, player in self._iter_players(conn, team.name):
+                team.roster[roster_type].append(player)
+            team.rebuild_cap_ledger()
+            return team
+        finally:
+            conn.close()
+
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        return conn
+
+
+    def _insert_team(self, conn: sqlite3.Connection, team: Team, slot: int):
+        conn.execute(
+                "INSERT INTO teams VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (team.name, slot, team.draft_position, team.salary_cap,
+                 team.dead_money, team.wins, team.losses)
+        )
+
+        for roster_type, roster_list in team.roster.items():
+            for player_slot, player in enumerate(roster_list):
+                self._insert_player(conn, player, team.name, roster_type, player_slot)
+
+
+    def _insert_player(self, conn: sqlite3.Connection, player: Player,
+                       roster_team: Optional[str], roster_type: str, slot: int):
+        cursor = conn.execute(
+                f"INSERT INTO players ({PLAYER_COLUMNS}) VALUES ({', '.join('?' * 16)})",
+                _player_row(player, roster_team, roster_type, slot)
+        )
+
+        if player.contract:
+            conn.execute(
+                    f"INSERT INTO contracts (player_id, {CONTRACT_COLUMNS}) VALUES ({', '.join('?' * 11)})",
+                    (cursor.lastrowid,) + _contract_row(player.contract)
+            )
+
+
+    def _delete_team_players(self, conn: sqlite3.Connection, team_name: str):
+        conn.execute("DELETE FROM contracts WHERE player_id IN "
+                     "(SELECT id FROM players WHERE roster_team = ?)", (team_name,))
+        conn.execute("DELETE FROM players WHERE roster_team = ?", (team_name,))
+
+
+    def _iter_players(self, conn: sqlite3.Connection, team_name: Optional[str] = None):
+        """Yield (roster_team, roster_type, player) in stored roster order"""
+        query = (f"SELECT p.*, c.player_name AS c_player_name, {_prefixed_contract_columns()} "
+                 "FROM players p LEFT JOIN contracts c ON c.player_id = p.id")
+        params: Tuple = ()
+        if team_name is not None:
+            query += " WHERE p.roster_team = ?"
+            params = (team_name,)
+        query += " ORDER BY p.roster_team, p.roster_type, p.slot"
+
+        for row in conn.execute(query, params):
+            yield row['roster_team'], row['roster_type'], _build_player(row)
+
+
+def player_record(player: Player) -> Dict[str, Any]:
+    """A player and their contract as a flat, JSON-ready dict in stored column names"""
+    record = dict(zip(PLAYER_COLUMNS.split(", "), _player_row(player, None, '', 0)))
+    for field in ('roster_team', 'roster_type', 'slot'):
+        del record[field]
+
+    contract_row = _contract_row(player.contract) if player.contract else (None,) * 10
+    record.update(zip((f"c_{col}" for col in CONTRACT_COLUMNS.split(", ")), contract_row))
+    return record
+
+
+def build_player(record: Dict[str, Any]) -> Player:
+    """Rebuild a player from player_record()"""
+    return _build_player(record)
+
+
+def _prefixed_contract_columns() -> str:
+    return ", ".join(f"c.{col} AS c_{col}" for col in CONTRACT_COLUMNS.split(", ")
+                     if col != 'player_name')
+
+
+def _player_row(player: Player, roster_team: Optional[str], roster_type: str, slot: int) -> Tuple:
+    return (player.player_id, roster_team, roster_type, slot, player.name, player.nfl_team, player.position,
+            player.rank, player.fantasy_team, player.roster_status, player.fantasy_points,
+            player.position_rank_end_of_season, int(player.is_holdout), player.holdout_demands,
+            int(player.is_retired), json.dumps(player.season_stats))
+
+
+def _contract_row(contract: Contract) -> Tuple:
+    return (contract.player_name, contract.initial_salary, contract.total_years,
+            contract.years_remaining, int(contract.is_rookie), contract.start_year,
+            contract.current_salary, int(contract.has_been_extended),
+            int(contract.is_franchise_tagged), int(contract.is_transition_tagged))
+
+
+def _build_team(row: sqlite3.Row) -> Team:
+    team = Team(row['name'], draft_position=row['draft_position'])
+    team.salary_cap = row['salary_cap']
+    team.dead_money = row['dead_money']
+    team.wins = row['wins']
+    team.losses = row['losses']
+    return team
+
+
+def _build_player(row: sqlite3.Row) -> Player:
+    player = Player(row['name'], row['nfl_team'], row['position'], rank=row['rank'])
+    player.player_id = row['id']
+    player.fantasy_team = row['fantasy_team']
+    player.roster_status = row['roster_status']
+    player.fantasy_points = row['fantasy_points']
+    player.position_rank_end_of_season = row['position_rank_end_of_season']
+    player.is_holdout = bool(row['is_holdout'])
+    player.holdout_demands = row['holdout_demands']
+    player.is_retired = bool(row['is_retired'])
+    player.season_stats = json.loads(row['season_stats'])
+
+    if row['c_player_name'] is not None:
+        contract = Contract(row['c_player_name'], row['c_initial_salary'], row['c_total_years'],
+                            is_rookie=bool(row['c_is_rookie']), start_year=row['c_start_year'])
+        contract.years_remaining = row['c_years_remaining']
+        contract.current_salary = row['c_current_salary']
+        contract.has_been_extended = bool(row['c_has_been_extended'])
+        contract.is_franchise_tagged = bool(row['c_is_franchise_tagged'])
+        contract.is_transition_tagged = bool(row['c_is_transition_tagged'])
+        player.contract = contract
+
+    return player
+
@@ -0,0 +1,314 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config.settings import TRANSACTION_LOG_SETTINGS
+from src.data.store import LeagueStore, build_player, player_record
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+
+
+# Events that bring players into the league log their full record, the rest refer to them by id
+FULL_RECORD_EVENTS = frozenset(['add_team', 'add_free_agents', 'add_player'])
+
+
+class TransactionLog:
+    """Append-only log of league mutations with periodic snapshots
+
+    Events are written one JSON object per line to numbered segment files.
+    Every snapshot_interval events, and after every advance_season, the
+    whole league is saved as a LeagueStore snapshot, so rebuilding the league
+    at any event only replays from the nearest snapshot before it.
+
+    Layout:
+        <directory>/segments/<first seq>.jsonl
+        <directory>/snapshots/<seq>.db
+    """
+
+    def __init__(self, directory: Optional[str] = None, snapshot_interval: Optional[int] = None,
+                 segment_events: Optional[int] = None, clock: Callable[[], float] = time.time):
+        self.directory = directory or TRANSACTION_LOG_SETTINGS['directory']
+        self.snapshot_interval = snapshot_interval or TRANSACTION_LOG_SETTINGS['snapshot_interval']
+        self.segment_events = segment_events or TRANSACTION_LOG_SETTINGS['segment_events']
+        self.clock = clock
+        self.league: Optional[League] = None
+
+        self._segment_dir = os.path.join(self.directory, 'segments')
+        self._snapshot_dir = os.path.join(self.directory, 'snapshots')
+        os.makedirs(self._segment_dir, exist_ok=True)
+        os.makedirs(self._snapshot_dir, exist_ok=True)
+
+        self._segments = self._list(self._segment_dir, '.jsonl')
+        self._snapshots = self._list(self._snapshot_dir, '.db')
+        self.last_seq, self._segment_size = self._scan_last_segment()
+        self._file = None
+        self._suspended = 0
+        self._batched = 0
+
+
+    def attach(self, league: League):
+        """Start recording a league's mutations, snapshotting it first if the log has no baseline"""
+        self.league = league
+        league.transaction_log = self
+        for team in league.teams:
+            team._log = self
+
+        if not self._snapshots or self._snapshots[-1] != self.last_seq:
+            self.snapshot()
+
+
+    def detach(self):
+        """Stop recording and close the current segment"""
+        if self.league is not None:
+            self.league.transaction_log = None
+            for team in self.league.teams:
+                team._log = None
+            self.league = None
+        self.close()
+
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+    def record(self, event_type: str, **data) -> Optional[int]:
+        """Append an event, returning its sequence number (None while suspended)"""
+        if self._suspended:
+            return None
+
+        if self._file is None or self._segment_size >= self.segment_events:
+            self._open_segment(self.last_seq + 1)
+
+        self.last_seq += 1
+        event = {'seq': self.last_seq, 'ts': self.clock(),
+                 'season': self.league.season_year if self.league else None, 'type': event_type}
+        full = event_type in FULL_RECORD_EVENTS
+        event.update({key: _encode(value, full) for key, value in data.items()})
+
+        self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+        self._file.flush()
+        self._segment_size += 1
+
+        self._maybe_snapshot()
+        return self.last_seq
+
+
+    @contextmanager
+    def suspended(self):
+        """Skip recording nested mutations, e.g. inside a compound operation"""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+
+
+    @contextmanager
+    def batch(self):
+        """Record nested mutations as usual, but hold periodic snapshots until they all land
+
+        Keeps snapshots from catching a multi-step operation (e.g. a trade) half done.
+        """
+        self._batched += 1
+        try:
+            yield
+        finally:
+            self._batched -= 1
+        self._maybe_snapshot()
+
+
+    @contextmanager
+    def transaction(self, event_type: str, **data):
+        """Record a compound operation as a single event followed by a snapshot
+
+        Replay never re-runs the operation, it starts from the snapshot instead.
+        """
+        with self.suspended():
+            yield
+        if not self._suspended:
+            self.record(event_type, **data)
+            self.snapshot()
+
+
+    def snapshot(self):
+        """Save the attached league's current state as of the last event"""
+        if self.league is None:
+            raise ValueError("No league attached to the transaction log")
+        if self._snapshots and self._snapshots[-1] == self.last_seq:
+            return
+
+        path = self._snapshot_path(self.last_seq)
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        LeagueStore(tmp_path).save(self.league)
+        os.replace(tmp_path, path)
+        self._snapshots.append(self.last_seq)
+
+
+    def events(self, start: int = 1, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield events with start <= seq <= end, reading only the segments that hold them"""
+        end = self.last_seq if end is None else end
+        for i, first_seq in enumerate(self._segments):
+            next_first = self._segments[i + 1] if i + 1 < len(self._segments) else None
+            if first_seq > end:
+                break
+            if next_first is not None and next_first <= start:
+                continue
+
+            with open(self._segment_path(first_seq), encoding='utf-8') as f:
+                for line in f:
+                    event = json.loads(line)
+                    if event['seq'] > end:
+                        return
+                    if event['seq'] >= start:
+                        yield event
+
+
+    def seq_at(self, timestamp: float) -> int:
+        """Last event recorded at or before a point in time (0 if none)"""
+        seq = 0
+        for event in self.events():
+            if event['ts'] > timestamp:
+                break
+            seq = event['seq']
+        return seq
+
+
+    def rebuild(self, seq: Optional[int] = None) -> League:
+        """Rebuild the league as it was right after event seq (defaults to the latest)
+
+        Loads the nearest snapshot at or before seq and replays only the events after it.
+        """
+        seq = self.last_seq if seq is None else seq
+        base = max((s for s in self._snapshots if s <= seq), default=None)
+        if base is None:
+            raise ValueError(f"No snapshot at or before event {seq}")
+
+        league = LeagueStore(self._snapshot_path(base)).load()
+        for event in self.events(base + 1, seq):
+            replay = _REPLAY.get(event['type'])
+            if replay is None:
+                raise ValueError(f"Cannot replay event {event['seq']} ({event['type']}) without its snapshot")
+            replay(league, event)
+        return league
+
+
+    def _maybe_snapshot(self):
+        """Snapshot once snapshot_interval events have piled up outside of any batch"""
+        if self.league is None or self._batched:
+            return
+        last_snapshot = self._snapshots[-1] if self._snapshots else 0
+        if self.last_seq - last_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+
+    def _open_segment(self, first_seq: int):
+        self.close()
+        if not self._segments or self._segment_size >= self.segment_events:
+            self._segments.append(first_seq)
+            self._segment_size = 0
+        self._file = open(self._segment_path(self._segments[-1]), 'a', encoding='utf-8')
+
+
+    def _scan_last_segment(self) -> Tuple[int, int]:
+        """Find the last sequence number and the size of the newest segment"""
+        if not self._segments:
+            return 0, 0
+
+        last_seq, size = self._segments[-1] - 1, 0
+        with open(self._segment_path(self._segments[-1]), encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    last_seq = json.loads(line)['seq']
+                    size += 1
+        return last_seq, size
+
+
+    def _segment_path(self, first_seq: int) -> str:
+        return os.path.join(self._segment_dir, f"{first_seq:012d}.jsonl")
+
+
+    def _snapshot_path(self, seq: int) -> str:
+        return os.path.join(self._snapshot_dir, f"{seq:012d}.db")
+
+
+    @staticmethod
+    def _list(directory: str, extension: str) -> List[int]:
+        return sorted(int(name[:-len(extension)]) for name in os.listdir(directory)
+                      if name.endswith(extension))
+
+
+def _encode(value: Any, full: bool) -> Any:
+    """Make an event field JSON-ready, logging players in full or as an id and name"""
+    if isinstance(value, Player):
+        return player_record(value) if full else {'id': value.player_id, 'name': value.name}
+    if isinstance(value, Team):
+        return {'name': value.name, 'draft_position': value.draft_position,
+                'roster': {roster_type: [player_record(p) for p in roster_list]
+                           for roster_type, roster_list in value.roster.items()}}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, full) for item in value]
+    return value
+
+
+def _player(league: League, record: Dict[str, Any]) -> Player:
+    """Find a logged player in the league, or build them if they're new"""
+    player = league.players.get(record['id']) if record['id'] is not None else None
+    return player if player is not None else build_player(record)
+
+
+def _replay_add_team(league: League, event: Dict[str, Any]):
+    record = event['team']
+    team = Team(record['name'], draft_position=record['draft_position'])
+    for roster_type, roster_list in record['roster'].items():
+        team.roster[roster_type].extend(build_player(p) for p in roster_list)
+    team.rebuild_cap_ledger()
+    league.add_team(team)
+
+
+def _replay_add_free_agents(league: League, event: Dict[str, Any]):
+    league.add_free_agents([_player(league, record) for record in event['players']])
+
+
+def _replay_add_player(league: League, event: Dict[str, Any]):
+    record = event['player']
+    player = _player(league, record)
+
+    # Sign them as logged, e.g. an auction or rookie contract set just before joining
+    player.contract = build_player(record).contract
+    player.fantasy_team = None
+    player.roster_status = 'free_agent'
+    league.get_team_by_name(event['team']).add_player(player, event['roster_type'])
+
+    # Signed players leave the pool
+    league.free_agents = [p for p in league.free_agents if p is not player]
+
+
+def _replay_team_call(method: str, *fields: str):
+    def replay(league: League, event: Dict[str, Any]):
+        team = league.get_team_by_name(event['team'])
+        player = league.players.get(event['player']['id'])
+        getattr(team, method)(player, *(event[field] for field in fields))
+    return replay
+
+
+# Event type -> how to re-apply it to a rebuilt league; compound events
+# (advance_season) are covered by the snapshot written right after them
+_REPLAY = {
+    'add_team': _replay_add_team,
+    'add_free_agents': _replay_add_free_agents,
+    'add_player': _replay_add_player,
+    'remove_player': _replay_team_call('remove_player'),
+    'move_player': _replay_team_call('move_player', 'roster_type'),
+    'trade_away': _replay_team_call('trade_away'),
+    'receive_traded_player': _replay_team_call('receive_traded_player', 'roster_type'),
+    'extend_player_contract': _replay_team_call('extend_player_contract', 'years'),
+    'tag_player': _replay_team_call('tag_player', 'salary', 'transition'),
+    'resolve_player_holdout': _replay_team_call('resolve_player_holdout', 'decision'),
+}
@@ -5,6 +5,9 @@ from config.settings import LEAGUE_SETTINGS
 class Contract:
     """Represents a player's contract with salary, duration, and cap implications"""
 
+    __slots__ = ('player_name', 'initial_salary', 'total_years', 'years_remaining', 'is_rookie', 'start_year',
+                 'current_salary', 'has_been_extended', 'is_franchise_tagged', 'is_transition_tagged')
+
     def __init__(self, player_name: str, initial_salary: float, years: int, is_rookie: bool = False, start_year: int = None):
         self.player_name = player_name
         self.initial_salary = initial_salary
@@ -24,8 +27,8 @@ class Contract:
             raise ValueError("Contract has already expired")
 
         self.years_remaining -= 1
-        if self.years_remaining > 0:
-            # 20% salary increase each year per league rules
+        if self.years_remaining > 0 and not self.is_tagged():
+            # 20% salary increase each year per league rules, tag salaries are already set
             self.current_salary *= LEAGUE_SETTINGS['player_salary_increase_rate']
 
 
@@ -48,6 +51,23 @@ class Contract:
         return self.current_salary - old_salary  # Return salary increase
 
 
+    def apply_tag(self, salary: float, transition: bool = False):
+        """Tag an expiring contract, keeping the player one more season at the tag salary"""
+        if self.years_remaining != 1:
+            raise ValueError("Only expiring contracts can be tagged")
+
+        self.current_salary = salary
+        self.years_remaining += 1
+        self.total_years += 1
+        self.is_franchise_tagged = not transition
+        self.is_transition_tagged = transition
+
+
+    def is_tagged(self) -> bool:
+        """Check if contract is under a franchise or transition tag"""
+        return self.is_franchise_tagged or self.is_transition_tagged
+
+
     def calculate_dead_money_penalty(self) -> float:
         """Calculate dead money penalty for dropping player"""
         if self.years_remaining <= 1:
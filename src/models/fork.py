@@ -0,0 +1,351 @@
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from src.models.league import League
+from src.models.player import Player
+from src.models.registry import PlayerRegistry
+from src.models.team import Team
+
+# League fields a fork starts from and commits back
+_LEAGUE_FIELDS = ('season_year', 'max_teams', 'current_salary_cap', 'current_phase', 'current_week',
+                  'season_rankings', 'data_source')
+_TEAM_LISTS = ('rookie_draft_order', 'auction_nomination_order', 'playoff_teams')
+
+# Team state that belongs to the league it's in rather than to the team
+_TEAM_WIRING = frozenset(['_registry', '_log', '_cap_charges', '_salary_used', 'roster'])
+
+
+def _copy(model):
+    """Shallow copy of a slotted model"""
+    clone = object.__new__(type(model))
+    for name in type(model).__slots__:
+        setattr(clone, name, getattr(model, name))
+    return clone
+
+
+def _write_back(copy, original, skip=frozenset()):
+    """Overwrite a model's fields with its copy's"""
+    for name in type(original).__slots__:
+        if name not in skip:
+            setattr(original, name, getattr(copy, name))
+
+
+class _Owned:
+    """A fork field holding teams or players, which takes ownership of everything when read"""
+
+    def __set_name__(self, owner, name):
+        self.field = f'_{name}'
+
+
+    def __get__(self, fork, owner=None):
+        if fork is None:
+            return self
+        fork.own_all()
+        return getattr(fork, self.field)
+
+
+    def __set__(self, fork, value):
+        setattr(fork, self.field, value)
+
+
+class LeagueFork(League):
+    """Copy-on-write child league for what-if analysis
+
+    A fork starts out sharing every team, player and contract with its parent
+    and only copies what it's about to change: team(name) (and
+    get_team_by_name) copies a team along with its players and their
+    contracts, and player(p) does the same for a player's team, or just the
+    player if they're a free agent. Reading teams, free_agents, players or
+    the draft and playoff orders takes ownership of everything first, so
+    services that only see a League never reach the parent's objects.
+
+    diff() lists what changed against the parent and commit() writes the
+    changes back into the parent's own objects, so references held elsewhere
+    stay valid. Commits overwrite the touched objects wholesale: changes the
+    parent made to them after the fork are lost.
+    """
+
+    teams = _Owned()
+    free_agents = _Owned()
+    rookie_draft_order = _Owned()
+    auction_nomination_order = _Owned()
+    playoff_teams = _Owned()
+
+    def __init__(self, parent: League):
+        if isinstance(parent, LeagueFork):
+            raise ValueError("Forks can't be forked, fork the parent league instead")
+
+        self.parent = parent
+        for name in _LEAGUE_FIELDS:
+            setattr(self, name, getattr(parent, name))
+        for name in _TEAM_LISTS:
+            setattr(self, f'_{name}', list(getattr(parent, name)))
+        self._teams: List[Team] = list(parent.teams)
+        self._teams_by_name: Dict[str, Team] = dict(parent._teams_by_name)
+        self._free_agents: List[Player] = list(parent.free_agents)
+        self.season_stats = defaultdict(dict, {key: dict(stats) for key, stats in parent.season_stats.items()})
+        self.transaction_log = None
+
+        # Copies made so far: id(parent object) -> (parent object, copy), and id(copy) -> parent object
+        self._copies: Dict[int, Tuple[object, object]] = {}
+        self._originals: Dict[int, object] = {}
+        self._registry: Optional[PlayerRegistry] = None
+        self._owned = False
+
+
+    @property
+    def players(self) -> PlayerRegistry:
+        """The fork's player registry, built on first use after taking ownership of everything"""
+        if self._registry is None:
+            self.own_all()
+            registry = PlayerRegistry()
+            for team in self._teams:
+                for roster_list in team.roster.values():
+                    for player in roster_list:
+                        registry.add(player)
+                team._registry = registry
+            for player in self._free_agents:
+                registry.add(player)
+            for copy in self._player_copies():
+                registry.add(copy)
+            self._registry = registry
+        return self._registry
+
+
+    def team(self, name: str) -> Team:
+        """The fork's own copy of a team, copied with its roster on first use"""
+        team = self._teams_by_name.get(name)
+        if team is None:
+            raise ValueError(f"Team '{name}' not found")
+        if not self._is_shared(team):
+            return team
+
+        copy = _copy(team)
+        copy.roster = {roster_type: [self._copy_player(p) for p in roster_list]
+                       for roster_type, roster_list in team.roster.items()}
+        copy._cap_charges = {id(self._copy_of(p)): team._cap_charges[id(p)]
+                             for roster_list in team.roster.values() for p in roster_list
+                             if id(p) in team._cap_charges}
+        copy._registry = self._registry
+        copy._log = None
+        self._remember(team, copy)
+
+        self._teams[self._teams.index(team)] = copy
+        self._teams_by_name[name] = copy
+        for field in _TEAM_LISTS:
+            field = f'_{field}'
+            setattr(self, field, [copy if t is team else t for t in getattr(self, field)])
+        return copy
+
+
+    def player(self, player: Player) -> Player:
+        """The fork's own copy of a player, copying their team (or just them, for free agents) on first use"""
+        if not self._is_shared(player):
+            return player
+        if id(player) in self._copies:
+            return self._copy_of(player)
+
+        if player.fantasy_team is not None and self._teams_by_name.get(player.fantasy_team) is not None:
+            self.team(player.fantasy_team)
+            if id(player) in self._copies:
+                return self._copy_of(player)
+
+        copy = self._copy_player(player)
+        self._free_agents = [copy if p is player else p for p in self._free_agents]
+        return copy
+
+
+    def own_all(self):
+        """Copy every team, free agent and registered player the fork still shares"""
+        if self._owned:
+            return
+
+        for name in list(self._teams_by_name):
+            self.team(name)
+        self._free_agents = [self._copy_player(p) if self._is_shared(p) else p for p in self._free_agents]
+        for player in list(self.parent.players):
+            self._copy_player(player)
+        self._owned = True
+
+
+    def remove_free_agents(self, players: List[Player]):
+        """Take signed players out of the fork's free agent pool"""
+        taken = {id(player) for player in players}
+        self._free_agents = [p for p in self._free_agents if id(p) not in taken]
+
+
+    def get_team_by_name(self, name: str) -> Optional[Team]:
+        """Find team by name, copying it into the fork"""
+        return self.team(name) if name in self._teams_by_name else None
+
+
+    def add_free_agent(self, player: Player):
+        """Put a player into the fork's free agent pool"""
+        self.add_free_agents([player])
+
+
+    def add_free_agents(self, players: List[Player]):
+        """Put a batch of players into the fork's free agent pool"""
+        players = [self.player(p) for p in players]
+        self._free_agents.extend(players)
+        if self._registry is not None:
+            for player in players:
+                self._registry.add(player)
+
+
+    def diff(self) -> Dict[str, object]:
+        """Changes made in the fork, against the parent
+
+        Returns:
+            Dict with 'teams' (team name -> the players 'added' and 'removed',
+            'moved' as (player, from roster, to roster), 'contracts' changed as
+            (player, parent contract, fork contract), and 'dead_money' and
+            'salary_used' as (parent, fork) for every team that changed),
+            'free_agents' ('added' and 'removed') and 'league' (field ->
+            (parent, fork) for changed league fields)
+        """
+        teams = {}
+        for team in self._teams:
+            if self._is_shared(team):
+                continue
+
+            original = self.parent.get_team_by_name(team.name)
+            before = {id(p): (p, roster_type) for roster_type, roster_list in original.roster.items()
+                      for p in roster_list} if original is not None else {}
+            after = {id(self._parent_of(p)): (p, roster_type) for roster_type, roster_list in team.roster.items()
+                     for p in roster_list}
+
+            changes = {
+                'added': [p for key, (p, _) in after.items() if key not in before],
+                'removed': [p for key, (p, _) in before.items() if key not in after],
+                'moved': [(p, before[key][1], roster_type) for key, (p, roster_type) in after.items()
+                          if key in before and before[key][1] != roster_type],
+                'contracts': [(before[key][0], before[key][0].contract, p.contract) for key, (p, _) in after.items()
+                              if key in before and not self._same_contract(before[key][0].contract, p.contract)],
+            }
+            dead_money = (original.dead_money if original is not None else 0.0, team.dead_money)
+            salary_used = (original.get_total_salary_used() if original is not None else 0.0,
+                           team.get_total_salary_used())
+            if any(changes.values()) or dead_money[0] != dead_money[1] or original is None:
+                teams[team.name] = {**changes, 'dead_money': dead_money, 'salary_used': salary_used}
+
+        parent_free_agents = {id(p) for p in self.parent.free_agents}
+        fork_free_agents = {id(self._parent_of(p)) for p in self._free_agents}
+        free_agents = {
+            'added': [p for p in self._free_agents if id(self._parent_of(p)) not in parent_free_agents],
+            'removed': [p for p in self.parent.free_agents if id(p) not in fork_free_agents],
+        }
+
+        league = {name: (getattr(self.parent, name), getattr(self, name)) for name in _LEAGUE_FIELDS
+                  if getattr(self.parent, name) != getattr(self, name)}
+        for name in _TEAM_LISTS:
+            before = [t.name for t in getattr(self.parent, name)]
+            after = [t.name for t in getattr(self, f'_{name}')]
+            if before != after:
+                league[name] = (before, after)
+
+        return {'teams': teams, 'free_agents': free_agents, 'league': league}
+
+
+    def commit(self):
+        """Write the fork's changes back into the parent, then start over from the parent's new state"""
+        parent = self.parent
+        log = parent.transaction_log
+
+        # Logged as one event followed by a snapshot, like advance_season
+        with log.transaction('commit_fork') if log is not None else nullcontext():
+            touched = []
+            for original, copy in self._copies.values():
+                if isinstance(original, Player):
+                    contract = copy.contract
+                    _write_back(copy, original, skip=frozenset(['contract']))
+                    if contract is not None and id(contract) in self._originals:
+                        _write_back(contract, self._originals[id(contract)])
+                    original.contract = self._parent_of(contract) if contract is not None else None
+                    touched.append(original)
+
+            for team in self._teams:
+                if self._is_shared(team):
+                    continue
+                original = self._parent_of(team)
+                if original is not team:
+                    _write_back(team, original, skip=_TEAM_WIRING)
+                else:
+                    # Added in the fork
+                    team._registry = parent.players
+                    team._log = log
+                original.roster = {roster_type: [self._parent_of(p) for p in roster_list]
+                                   for roster_type, roster_list in team.roster.items()}
+                original.rebuild_cap_ledger()
+                touched.extend(p for roster_list in original.roster.values() for p in roster_list)
+
+            for name in _LEAGUE_FIELDS:
+                setattr(parent, name, getattr(self, name))
+            for name in _TEAM_LISTS:
+                setattr(parent, name, [self._parent_of(t) for t in getattr(self, f'_{name}')])
+            parent.teams = [self._parent_of(t) for t in self._teams]
+            parent._teams_by_name = {t.name: t for t in parent.teams}
+            parent.free_agents = [self._parent_of(p) for p in self._free_agents]
+            parent.season_stats = self.season_stats
+            touched.extend(parent.free_agents)
+
+            for player in touched:
+                if player not in parent.players and parent.players.get(player.player_id) is not None:
+                    player.player_id = None # Id taken in the parent since the fork
+                parent.players.add(player)
+
+        self.__init__(parent)
+
+
+    def _is_shared(self, model) -> bool:
+        """Whether a team or player still belongs to the parent"""
+        if isinstance(model, Team):
+            return self.parent.get_team_by_name(model.name) is model
+        return model in self.parent.players
+
+
+    def _copy_player(self, player: Player) -> Player:
+        """Copy a parent player and their contract, once"""
+        if id(player) in self._copies:
+            return self._copy_of(player)
+
+        copy = _copy(player)
+        copy.season_stats = dict(player.season_stats)
+        if player.contract is not None:
+            copy.contract = _copy(player.contract)
+            self._remember(player.contract, copy.contract)
+        self._remember(player, copy)
+
+        if self._registry is not None:
+            self._registry.remove(player)
+            self._registry.add(copy)
+        return copy
+
+
+    def _player_copies(self) -> List[Player]:
+        """Every player the fork copied"""
+        return [copy for _, copy in self._copies.values() if isinstance(copy, Player)]
+
+
+    def _remember(self, original, copy):
+        self._copies[id(original)] = (original, copy)
+        self._originals[id(copy)] = original
+
+
+    def _copy_of(self, model):
+        """The fork's copy of a parent object, or the object itself if it wasn't copied"""
+        entry = self._copies.get(id(model))
+        return entry[1] if entry is not None else model
+
+
+    def _parent_of(self, model):
+        """The parent object a fork copy came from, or the object itself if the fork made it"""
+        return self._originals.get(id(model), model)
+
+
+    @staticmethod
+    def _same_contract(before, after) -> bool:
+        if before is None or after is None:
+            return before is after
+        return all(getattr(before, name) == getattr(after, name) for name in type(before).__slots__)
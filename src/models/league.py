@@ -1,21 +1,30 @@
 from datetime import date
 from typing import List, Dict, Optional
 from collections import defaultdict
+from contextlib import nullcontext
 import random
 
 from config.settings import LEAGUE_SETTINGS
 from src.models.team import Team
 from src.models.player import Player
+from src.models.registry import PlayerRegistry
+from src.models.rankings import SeasonRankings
+from src.services.analytics import summarize_top_performers
 
 class League:
     """Manages the overall La Liga Lebowski league state and operations"""
 
-    def __init__(self, season_year: int = None):
+    def __init__(self, season_year: int = None, max_teams: Optional[int] = None):
         self.season_year = season_year or date.today().year
+        self.max_teams = max_teams or LEAGUE_SETTINGS['teams']
         self.teams: List[Team] = []
         self.free_agents: List[Player] = []
         self.current_salary_cap = LEAGUE_SETTINGS['salary_cap']
 
+        # Indexes for constant-time team and player lookups
+        self._teams_by_name: Dict[str, Team] = {}
+        self.players = PlayerRegistry()
+
         # League calendar state
         # TODO: add more phases according to the La Liga calendar
         self.current_phase = "offseason" # offseason, regular_season, playoffs
@@ -28,72 +37,121 @@ class League:
         # Season tracking
         self.season_stats: Dict[str, Dict] = defaultdict(dict)
         self.playoff_teams: List[Team] = []
+        self.season_rankings: Optional[SeasonRankings] = None
+
+        # Optional real stats source (e.g. SleeperClient) used during the offseason
+        self.data_source = None
+
+        # Optional transaction log (e.g. TransactionLog) that records every mutation
+        self.transaction_log = None
 
 
     def add_team(self, team: Team):
         """Add a team to the league"""
-        if len(self.teams) >= LEAGUE_SETTINGS['teams']:
-            raise ValueError(f"League is full ({LEAGUE_SETTINGS['teams']} teams max)")
+        if len(self.teams) >= self.max_teams:
+            raise ValueError(f"League is full ({self.max_teams} teams max)")
+
+        if team.name in self._teams_by_name:
+            raise ValueError(f"Team name '{team.name}' is already taken")
 
         team.salary_cap = self.current_salary_cap
         self.teams.append(team)
+        self._teams_by_name[team.name] = team
+
+        # Register the roster and keep the registry in sync with future moves
+        team._registry = self.players
+        team._log = self.transaction_log
+        for roster_list in team.roster.values():
+            for player in roster_list:
+                self.players.add(player)
+        self._record('add_team', team=team)
+
+
+    def add_free_agent(self, player: Player):
+        """Put a player into the free agent pool"""
+        self.free_agents.append(player)
+        self.players.add(player)
+        self._record('add_free_agents', players=[player])
+
+
+    def add_free_agents(self, players: List[Player]):
+        """Put a batch of players into the free agent pool"""
+        self.free_agents.extend(players)
+        for player in players:
+            self.players.add(player)
+        self._record('add_free_agents', players=players)
+
+
+    def remove_free_agents(self, players: List[Player]):
+        """Take signed players out of the free agent pool"""
+        taken = {id(player) for player in players}
+        self.free_agents = [p for p in self.free_agents if id(p) not in taken]
+
+
+    def _record(self, event_type: str, **data):
+        """Record a league change in the transaction log"""
+        if self.transaction_log is not None:
+            self.transaction_log.record(event_type, **data)
 
 
     def advance_season(self):
         """Advance to next season, handling all offseason tasks"""
         print(f"Advancing from {self.season_year} to {self.season_year + 1}!")
 
-        # 1. Advance all player contracts
-        self._advance_all_contracts()
+        # The whole offseason is logged as one event, followed by a snapshot
+        log = self.transaction_log
+        with log.transaction('advance_season') if log is not None else nullcontext():
+            # 1. Advance all player contracts
+            self._advance_all_contracts()
 
-        # 2. Increase salary cap by 5%
-        self.current_salary_cap *= LEAGUE_SETTINGS['salary_cap_increase_rate']
-        for team in self.teams:
-            team.salary_cap = self.current_salary_cap
+            # 2. Increase salary cap by 5%
+            self.current_salary_cap *= LEAGUE_SETTINGS['salary_cap_increase_rate']
+            for team in self.teams:
+                team.salary_cap = self.current_salary_cap
 
-        # 3. Process holdouts
-        self._process_holdouts()
+            # 3. Process holdouts
+            self._process_holdouts()
 
-        # 4. Handle expired contracts
-        self._handle_expired_contracts()
+            # 4. Handle expired contracts
+            self._handle_expired_contracts()
 
-        # 5. Validate team salary caps
-        self._validate_salary_caps()
+            # 5. Validate team salary caps
+            self._validate_salary_caps()
 
-        # 6. Set up draft order
-        self._determine_rookie_draft_order()
+            # 6. Set up draft order
+            self._determine_rookie_draft_order()
 
-        self.season_year += 1
-        self.current_phase = "rookie_draft"
+            self.season_year += 1
+            self.current_phase = "rookie_draft"
 
-        # TODO: open bidding for franchise players, unrestricted free agent auction/blind bidding, contract extension deadline, trading deadline, practice squad activation deadline, salary cap removal
+        # TODO: unrestricted free agent auction/blind bidding, contract extension deadline, trading deadline, practice squad activation deadline, salary cap removal
 
 
     def _advance_all_contracts(self):
         """Advance all player contracts by one year"""
         for team in self.teams:
-            for roster_list in team.roster.values():
-                for player in roster_list:
-                    if player.contract:
-                        player.advance_contract_year()
-
-                        # Player's contract expired
-                        if player.is_available():
-                            self.free_agents.append(player)
+            for player in team.advance_contracts():
+                # Player's contract expired
+                if player.is_available():
+                    self.add_free_agent(player)
 
 
     def _process_holdouts(self):
         """Identify and process potential holdouts"""
+        # Pull real season results when a data source is configured
+        if self.data_source is not None:
+            self.data_source.apply_season_points(self, self.season_year)
+
+        rankings = self.rank_season()
+
         # Calculate position averages for top performers
-        # TODO: Simplify this process by just scraping all this info from the sleeper API
         position_averages = self._calculate_position_averages()
 
         for team in self.teams:
             holdout_players = []
             for roster_list in team.roster.values():
                 for player in roster_list:
-                    # idk if this is right
-                    if player.check_holdout_eligibility(self.season_stats):
+                    if player.check_holdout_eligibility(rankings):
                         pos_avg = position_averages.get(player.position, 0)
                         demands = player.calculate_holdout_demands(pos_avg)
                         if demands:
@@ -103,30 +161,17 @@ class League:
                 print(f"{team.name} has {len(holdout_players)} potential holdouts")
 
 
-    def _calculate_position_averages(self) -> Dict[str, float]:
-        """Calculate average salaries for top performers at each position"""
-        # TODO: this can also be simplified using the sleeper API
-        position_averages = {}
-        # TODO: Put this into the LEAGUE_SETTINGS config file
-        thresholds = {"QB": 5, "TE": 5, "RB": 10, "WR": 15}
-
-        for position, threshold in thresholds.items():
-            top_players = []
-            for team in self.teams:
-                for roster_list in team.roster.values():
-                    players = [p for p in roster_list
-                               if p.position == position and p.contract]
-                    top_players.extend(players)
-
-            # Sory by fantasy points and take top performers
-            top_players.sort(key=lambda p: p.fantasy_points, reverse=True)
-            top_salaries = [p.contract.current_salary
-                            for p in top_players[:threshold]
-                            if p.contract]
+    def rank_season(self) -> SeasonRankings:
+        """Rank every league player at their position by this season's fantasy points"""
+        self.season_rankings = SeasonRankings(self.season_year, self.players)
+        for player in self.players:
+            player.position_rank_end_of_season = self.season_rankings.rank_of(player)
+        return self.season_rankings
 
-            if top_salaries:
-                position_averages[position] = sum(top_salaries) / len(top_salaries)
 
+    def _calculate_position_averages(self) -> Dict[str, float]:
+        """Calculate average salaries for top performers at each position"""
+        position_averages, _ = summarize_top_performers(self.teams)
         return position_averages
 
 
@@ -141,7 +186,7 @@ class League:
 
             for player in expired_players:
                 team.remove_player(player)
-                self.free_agents.append(player)
+                self.add_free_agent(player)
 
 
     def _validate_salary_caps(self):
@@ -159,58 +204,27 @@ class League:
 
     def _determine_rookie_draft_order(self):
         """Determine rookie draft order using weighted lottery system"""
-        # TODO: Move this function into a rookie draft service
-        # Sort teams by record (worst to best)
-        sorted_teams = sorted(self.teams, key=lambda t: getattr(t, 'wins', 0))
-
-        # Lottery for first 6 picks
-        lottery_teams = sorted_teams[:6]
-        lottery_balls = [30, 22, 18, 14, 10, 6] # ping pong balls per team
-
-        lottery_order = []
-        remaining_teams = lottery_teams.copy()
-        remaining_balls = lottery_balls.copy()
-
-        for pick in range(6):
-            total_balls = sum(remaining_balls)
-            winning_number = random.randint(1, total_balls)
-
-            cumulative = 0
-            for i, balls in enumerate(remaining_balls):
-                cumulative += balls
-                if winning_number <= cumulative:
-                    lottery_order.append(remaining_teams[i])
-                    remaining_teams.pop(i)
-                    remaining_balls.pop(i)
-                    break
-
-        # Remaining picks by inverse standings (reigning champ picks last)
-        remaining_picks = sorted_teams[6:]
-        if len(remaining_picks) >= 2:
-            # Champion picks last, runner-up second to last
-            champion = remaining_picks[-1]
-            runner_up = remaining_picks[-2] if len(remaining_picks) > 1 else None
-            middle_teams = remaining_picks[:-2] if len(remaining_picks) > 2 else []
-
-            final_order = middle_teams +([runner_up] if runner_up else []) + [champion]
-        else:
-            final_order = remaining_picks
-
-        self.rookie_draft_order = lottery_order + final_order
+        from src.services.rookie_draft import determine_draft_order
+
+        self.rookie_draft_order = determine_draft_order(self.teams)
         self.auction_nomination_order = self.rookie_draft_order.copy()
 
 
+    def fork(self) -> 'LeagueFork':
+        """Copy-on-write child league for what-if analysis, see LeagueFork"""
+        from src.models.fork import LeagueFork
+
+        return LeagueFork(self)
+
+
     def get_team_by_name(self, name: str) -> Optional[Team]:
         """Find team by name"""
-        for team in self.teams:
-            if team.name == name:
-                return team
-        return None
+        return self._teams_by_name.get(name)
 
 
     def get_free_agents_by_position(self, position: str) -> List[Player]:
         """Get all free agents at a specific position"""
-        return [p for p in self.free_agents if p.position == position]
+        return [p for p in self.free_agents if p.position == position and not p.is_retired]
 
 
     def get_league_stats(self) -> Dict:
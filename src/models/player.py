@@ -1,7 +1,16 @@
-from config.settings import VALID_POSITIONS, NFL_TEAMS, SALARY_MULTIPLIERS
+from config.settings import LEAGUE_SETTINGS, VALID_POSITIONS, NFL_TEAMS, SALARY_MULTIPLIERS
 from typing import Optional, Dict, Any
 
+# Set lookups for constructor validation
+_VALID_POSITIONS = frozenset(VALID_POSITIONS)
+_NFL_TEAMS = frozenset(NFL_TEAMS)
+
 class Player:
+    # No per-instance __dict__, full player pools are kept across many simulated seasons
+    __slots__ = ('player_id', 'name', 'position', 'nfl_team', 'rank', 'contract', 'fantasy_team',
+                 'roster_status', 'season_stats', 'fantasy_points', 'position_rank_end_of_season',
+                 'is_holdout', 'holdout_demands', 'is_retired')
+
     def __init__(self, name: str, nfl_team: str, position:str, 
                  rank: Optional[int] = None, 
                  contract: Optional['Contract'] = None):
@@ -9,12 +18,13 @@ class Player:
         # Input validation
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Player name cannot be empty")
-        if position not in VALID_POSITIONS: 
+        if position not in _VALID_POSITIONS:
             raise ValueError(f"Invalid position: {position}. Must be one of {VALID_POSITIONS}")
-        if nfl_team not in NFL_TEAMS: 
+        if nfl_team not in _NFL_TEAMS:
             raise ValueError(f"Invalid NFL team: {nfl_team}. Must be one of {NFL_TEAMS}")
 
         # Basic info
+        self.player_id: Optional[int] = None # assigned by the league's PlayerRegistry
         self.name = name.strip()
         self.position = position
         self.nfl_team = nfl_team
@@ -83,21 +93,19 @@ class Player:
         self.holdout_demands = None
 
 
-    def check_holdout_eligibility(self, position_rankings: Dict[str, list]) -> bool:
+    def check_holdout_eligibility(self, rankings: 'SeasonRankings') -> bool:
         """Check if player is eligible for holdout based on performance"""
         if not self.contract or self.contract.is_expiring():
             return False
 
-        # Define top performer thresholds by position
-        thresholds = {"QB": 5, "TE": 5, "RB": 10, "WR": 15, "K": 0, "D/ST": 0}
-        threshold = thresholds.get(self.position, 0)
+        # Top performer thresholds by position (none for K and D/ST)
+        threshold = LEAGUE_SETTINGS['holdout_thresholds'].get(self.position, 0)
 
         if threshold == 0:
             return False
 
         # Check if player finished in top group for their position
-        position_top_performers = position_rankings.get(self.position, [])
-        return len(position_top_performers) >= threshold and self in position_top_performers[:threshold]
+        return rankings.position_size(self.position) >= threshold and rankings.is_top(self, threshold)
 
 
     def calculate_holdout_demands(self, position_avg_salary: float) -> Optional[float]:
@@ -0,0 +1,223 @@
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from config.settings import SALARY_MULTIPLIERS, VALID_POSITIONS
+from src.models.contract import Contract
+from src.models.player import Player
+
+# Small integer codes for the categorical columns
+POSITION_CODES = {position: code for code, position in enumerate(VALID_POSITIONS)}
+ROSTER_STATUSES = ('free_agent', 'active', 'practice_squad', 'IR', 'retired')
+STATUS_CODES = {status: code for code, status in enumerate(ROSTER_STATUSES)}
+
+# Cap multiplier per status code, matching Player.get_effective_salary
+_STATUS_MULTIPLIERS = np.array([SALARY_MULTIPLIERS.get(status, 1.00) for status in ROSTER_STATUSES])
+
+
+class PlayerTable:
+    """Columnar player pool: one array per field instead of one object per player
+
+    Holds salary, years remaining, position, fantasy points and roster status
+    as struct-of-arrays, so large pools (e.g. Monte Carlo copies of a full NFL
+    player pool) cost a few bytes per player and whole-pool queries are
+    vectorized. table[i] is a PlayerView that reads and writes row i.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(capacity, 1)
+        self.salary = np.zeros(capacity, dtype=np.float64)
+        self.years_remaining = np.zeros(capacity, dtype=np.int16)
+        self.position = np.zeros(capacity, dtype=np.int8)
+        self.fantasy_points = np.zeros(capacity, dtype=np.float64)
+        self.roster_status = np.zeros(capacity, dtype=np.int8)
+        self.names: List[str] = []
+        self.nfl_teams: List[str] = []
+        self._size = 0
+
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> 'PlayerTable':
+        """Copy players into a new table, in order"""
+        players = list(players)
+        table = cls(len(players))
+        for player in players:
+            table.append(player.name, player.nfl_team, player.position,
+                         salary=player.get_current_salary(),
+                         years_remaining=player.contract.years_remaining if player.contract else 0,
+                         fantasy_points=player.fantasy_points, roster_status=player.roster_status)
+        return table
+
+
+    def append(self, name: str, nfl_team: str, position: str, salary: float = 0.0, years_remaining: int = 0,
+               fantasy_points: float = 0.0, roster_status: str = 'free_agent') -> int:
+        """Add a row, returning its index"""
+        if position not in POSITION_CODES:
+            raise ValueError(f"Invalid position: {position}. Must be one of {VALID_POSITIONS}")
+        if roster_status not in STATUS_CODES:
+            raise ValueError(f"Invalid roster status: {roster_status}")
+
+        if self._size == len(self.salary):
+            self._grow(2 * self._size)
+
+        i = self._size
+        self.salary[i] = salary
+        self.years_remaining[i] = years_remaining
+        self.position[i] = POSITION_CODES[position]
+        self.fantasy_points[i] = fantasy_points
+        self.roster_status[i] = STATUS_CODES[roster_status]
+        self.names.append(name)
+        self.nfl_teams.append(nfl_team)
+        self._size += 1
+        return i
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __getitem__(self, index: int) -> 'PlayerView':
+        if not -self._size <= index < self._size:
+            raise IndexError(f"Player table index {index} out of range")
+        return PlayerView(self, index % self._size)
+
+
+    def __iter__(self) -> Iterator['PlayerView']:
+        return (PlayerView(self, i) for i in range(self._size))
+
+
+    def column(self, name: str) -> np.ndarray:
+        """The filled part of a column (a view, writes go to the table)"""
+        return getattr(self, name)[:self._size]
+
+
+    def effective_salaries(self) -> np.ndarray:
+        """Salary counting against the cap for every row"""
+        salary = np.where(self.column('years_remaining') > 0, self.column('salary'), 0.0)
+        return salary * _STATUS_MULTIPLIERS[self.column('roster_status')]
+
+
+    def mask(self, position: Optional[str] = None, roster_status: Optional[str] = None) -> np.ndarray:
+        """Boolean row mask for a position and/or roster status"""
+        mask = np.ones(self._size, dtype=bool)
+        if position is not None:
+            mask &= self.column('position') == POSITION_CODES[position]
+        if roster_status is not None:
+            mask &= self.column('roster_status') == STATUS_CODES[roster_status]
+        return mask
+
+
+    def to_player(self, index: int) -> Player:
+        """Materialize row index as a full Player (with a contract if it has salary years left)"""
+        view = self[index]
+        contract = None
+        if view.years_remaining > 0:
+            contract = Contract(view.name, view.salary, view.years_remaining)
+        player = Player(view.name, view.nfl_team, view.position, contract=contract)
+        player.fantasy_points = view.fantasy_points
+        if view.roster_status == 'retired':
+            player.retire()
+        else:
+            player.roster_status = view.roster_status
+        return player
+
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns"""
+        return sum(getattr(self, name).nbytes
+                   for name in ('salary', 'years_remaining', 'position', 'fantasy_points', 'roster_status'))
+
+
+    def _grow(self, capacity: int):
+        for name in ('salary', 'years_remaining', 'position', 'fantasy_points', 'roster_status'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+
+class PlayerView:
+    """Row of a PlayerTable with the read side of Player's API"""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: PlayerTable, index: int):
+        self._table = table
+        self._index = index
+
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._index]
+
+
+    @property
+    def nfl_team(self) -> str:
+        return self._table.nfl_teams[self._index]
+
+
+    @property
+    def position(self) -> str:
+        return VALID_POSITIONS[self._table.position[self._index]]
+
+
+    @property
+    def salary(self) -> float:
+        return float(self._table.salary[self._index])
+
+
+    @salary.setter
+    def salary(self, value: float):
+        self._table.salary[self._index] = value
+
+
+    @property
+    def years_remaining(self) -> int:
+        return int(self._table.years_remaining[self._index])
+
+
+    @years_remaining.setter
+    def years_remaining(self, value: int):
+        self._table.years_remaining[self._index] = value
+
+
+    @property
+    def fantasy_points(self) -> float:
+        return float(self._table.fantasy_points[self._index])
+
+
+    @fantasy_points.setter
+    def fantasy_points(self, value: float):
+        self._table.fantasy_points[self._index] = value
+
+
+    @property
+    def roster_status(self) -> str:
+        return ROSTER_STATUSES[self._table.roster_status[self._index]]
+
+
+    @roster_status.setter
+    def roster_status(self, value: str):
+        if value not in STATUS_CODES:
+            raise ValueError(f"Invalid roster status: {value}")
+        self._table.roster_status[self._index] = STATUS_CODES[value]
+
+
+    def is_available(self) -> bool:
+        """Check if player is available as free agent"""
+        return self.roster_status == 'free_agent'
+
+
+    def get_current_salary(self) -> float:
+        return self.salary if self.years_remaining > 0 else 0.0
+
+
+    def get_effective_salary(self) -> float:
+        """Get salary counting against cap based on roster status"""
+        return self.get_current_salary() * SALARY_MULTIPLIERS.get(self.roster_status, 1.00)
+
+
+    def __repr__(self):
+        contract_info = f", ${self.salary:.2f}" if self.years_remaining > 0 else ""
+        return f"{self.name} ({self.position} - {self.nfl_team}{contract_info})"
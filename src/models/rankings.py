@@ -0,0 +1,60 @@
+from typing import Dict, Iterable, List, Optional
+
+from src.models.player import Player
+
+
+class SeasonRankings:
+    """End-of-season positional rankings by fantasy points
+
+    Built once per season: for each position a list of player ids sorted
+    best to worst, plus a rank-by-id map so rank checks are O(1).
+    """
+
+    def __init__(self, season_year: int, players: Iterable[Player]):
+        self.season_year = season_year
+
+        by_position: Dict[str, List[Player]] = {}
+        for player in players:
+            if player.player_id is None:
+                raise ValueError(f"{player.name} needs a player id to be ranked")
+            if not player.is_retired:
+                by_position.setdefault(player.position, []).append(player)
+
+        self.order: Dict[str, List[int]] = {}
+        self._rank: Dict[int, int] = {}
+        for position, group in by_position.items():
+            group.sort(key=lambda p: p.fantasy_points, reverse=True)
+            self.order[position] = [p.player_id for p in group]
+            for rank, player in enumerate(group, start=1):
+                self._rank[player.player_id] = rank
+
+
+    @classmethod
+    def from_order(cls, season_year: int, order: Dict[str, List[int]]) -> 'SeasonRankings':
+        """Build rankings from player ids already sorted best to worst at each position"""
+        rankings = cls(season_year, [])
+        rankings.order = order
+        for ids in order.values():
+            rankings._rank.update(zip(ids, range(1, len(ids) + 1)))
+        return rankings
+
+
+    def rank_of(self, player: Player) -> Optional[int]:
+        """Get a player's 1-based rank at their position, or None if unranked"""
+        return self._rank.get(player.player_id)
+
+
+    def position_size(self, position: str) -> int:
+        """Number of ranked players at a position"""
+        return len(self.order.get(position, []))
+
+
+    def top(self, position: str, n: int) -> List[int]:
+        """Get the ids of the top n players at a position"""
+        return self.order.get(position, [])[:n]
+
+
+    def is_top(self, player: Player, n: int) -> bool:
+        """Check if a player finished in the top n at their position"""
+        rank = self.rank_of(player)
+        return rank is not None and rank <= n
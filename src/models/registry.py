@@ -0,0 +1,148 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.player import Player
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a player name for lookups ("D.J. Moore" -> "dj moore")"""
+    name = re.sub(r"[.'’]", "", name.casefold())
+    return " ".join(name.split())
+
+
+class PlayerRegistry:
+    """League-wide player index with hash lookups by name, team, position and status"""
+
+    # Indexed fields and how to read each key off a player
+    INDEXES = {
+        'name': lambda p: normalize_name(p.name),
+        'fantasy_team': lambda p: p.fantasy_team,
+        'nfl_team': lambda p: p.nfl_team,
+        'position': lambda p: p.position,
+        'roster_status': lambda p: p.roster_status,
+    }
+
+    def __init__(self):
+        self._players: Dict[int, Player] = {}
+        self._next_id = 1
+
+        # index -> key -> {player_id: player}; dicts keep insertion order and O(1) removal
+        self._indexes: Dict[str, Dict[object, Dict[int, Player]]] = {field: {} for field in self.INDEXES}
+        self._indexed_keys: Dict[int, Tuple] = {}
+
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+
+    def __iter__(self) -> Iterator[Player]:
+        return iter(self._players.values())
+
+
+    def __contains__(self, player: Player) -> bool:
+        return player.player_id is not None and self._players.get(player.player_id) is player
+
+
+    def add(self, player: Player):
+        """Register a player, assigning a player id if needed"""
+        if player in self:
+            self.refresh(player)
+            return
+
+        if player.player_id is None:
+            player.player_id = self._next_id
+        elif player.player_id in self._players:
+            raise ValueError(f"Player id {player.player_id} is already registered")
+        self._next_id = max(self._next_id, player.player_id + 1)
+
+        self._players[player.player_id] = player
+        self._index(player)
+
+
+    def remove(self, player: Player):
+        """Drop a player from the registry"""
+        if player not in self:
+            raise ValueError(f"{player.name} is not registered")
+
+        self._unindex(player)
+        del self._players[player.player_id]
+
+
+    def refresh(self, player: Player):
+        """Re-index a player after its name, team, position or status changed"""
+        if player not in self:
+            return
+
+        keys = self._keys(player)
+        if keys != self._indexed_keys[player.player_id]:
+            self._unindex(player)
+            self._index(player, keys)
+
+
+    def get(self, player_id: int) -> Optional[Player]:
+        """Look up a player by id"""
+        return self._players.get(player_id)
+
+
+    def find_by_name(self, name: str) -> List[Player]:
+        """Find players by name, ignoring case and punctuation"""
+        return self._lookup('name', normalize_name(name))
+
+
+    def by_fantasy_team(self, team_name: Optional[str]) -> List[Player]:
+        """Get players on a fantasy team (None for players without a team)"""
+        return self._lookup('fantasy_team', team_name)
+
+
+    def by_nfl_team(self, nfl_team: str) -> List[Player]:
+        return self._lookup('nfl_team', nfl_team)
+
+
+    def by_position(self, position: str) -> List[Player]:
+        return self._lookup('position', position)
+
+
+    def by_status(self, roster_status: str) -> List[Player]:
+        return self._lookup('roster_status', roster_status)
+
+
+    def query(self, **criteria) -> List[Player]:
+        """Find players matching every given index, e.g. query(position='RB', roster_status='free_agent')"""
+        unknown = set(criteria) - set(self.INDEXES)
+        if unknown:
+            raise ValueError(f"Unknown registry indexes: {sorted(unknown)}")
+        if not criteria:
+            return list(self._players.values())
+
+        if 'name' in criteria:
+            criteria['name'] = normalize_name(criteria['name'])
+
+        # Scan the smallest bucket and check it against the others
+        buckets = sorted((self._indexes[field].get(key, {}) for field, key in criteria.items()), key=len)
+        smallest, others = buckets[0], buckets[1:]
+        return [player for player_id, player in smallest.items()
+                if all(player_id in bucket for bucket in others)]
+
+
+    def _lookup(self, field: str, key) -> List[Player]:
+        return list(self._indexes[field].get(key, {}).values())
+
+
+    def _keys(self, player: Player) -> Tuple:
+        return tuple(read(player) for read in self.INDEXES.values())
+
+
+    def _index(self, player: Player, keys: Optional[Tuple] = None):
+        keys = keys or self._keys(player)
+        for field, key in zip(self.INDEXES, keys):
+            self._indexes[field].setdefault(key, {})[player.player_id] = player
+        self._indexed_keys[player.player_id] = keys
+
+
+    def _unindex(self, player: Player):
+        keys = self._indexed_keys.pop(player.player_id)
+        for field, key in zip(self.INDEXES, keys):
+            bucket = self._indexes[field][key]
+            del bucket[player.player_id]
+            if not bucket:
+                del self._indexes[field][key]
@@ -1,8 +1,15 @@
-from config.settings import LEAGUE_SETTINGS
+import math
+from config.settings import LEAGUE_SETTINGS, SALARY_MULTIPLIERS
 from src.models.player import Player
 from typing import List, Dict, Optional
 
 class Team:
+    __slots__ = ('name', 'draft_position', 'salary_cap', 'dead_money', 'roster', '_registry', '_log',
+                 '_cap_charges', '_salary_used', 'wins', 'losses')
+
+    # Debug mode: check the cap ledger against a full recompute on every query
+    verify_cap_ledger = False
+
     def __init__(self, name: str, draft_position: Optional[int] = None):
         self.name = name
         self.draft_position = draft_position
@@ -15,6 +22,16 @@ class Team:
                 'IR': []
         }
 
+        # League-wide player registry, kept in sync on roster changes (set by League.add_team)
+        self._registry = None
+
+        # League transaction log that roster changes are recorded to (set by League.add_team)
+        self._log = None
+
+        # Running cap ledger: effective salary charged per rostered player
+        self._cap_charges: Dict[int, float] = {}
+        self._salary_used = 0.0
+
         # Track team performance (for rookie draft order and standings)
         self.wins = 0
         self.losses = 0
@@ -28,6 +45,9 @@ class Team:
         self.roster[roster_type].append(player)
         player.roster_status = roster_type
         player.fantasy_team = self.name
+        self._charge_player(player)
+        self._reindex(player)
+        self._record('add_player', player=player, roster_type=roster_type)
 
 
     def remove_player(self, player: Player):
@@ -43,6 +63,8 @@ class Team:
         else:
             raise ValueError(f"Cannot remove player: {player.name} not found in roster!")
 
+        self._release_charge(player)
+
         # Handle dead money penalty if player has contract
         if player.contract:
             penalty = player.contract.calculate_dead_money_penalty()
@@ -50,6 +72,8 @@ class Team:
 
         # Reset player status
         player._become_free_agent()
+        self._reindex(player)
+        self._record('remove_player', player=player)
 
 
     def move_player(self, player: Player, new_roster_type: str):
@@ -74,6 +98,109 @@ class Team:
         self.roster[current_roster_type].remove(player)
         self.roster[new_roster_type].append(player)
         player.roster_status = new_roster_type
+        self._charge_player(player)
+        self._reindex(player)
+        self._record('move_player', player=player, roster_type=new_roster_type)
+
+
+    def trade_away(self, player: Player):
+        """Remove a player leaving in a trade, trades carry no dead money"""
+        if player.fantasy_team != self.name:
+            raise ValueError(f"Cannot trade player: {player.name} not on your team!")
+
+        self.roster[player.roster_status].remove(player)
+        self._release_charge(player)
+        player.fantasy_team = None
+        self._reindex(player)
+        self._record('trade_away', player=player)
+
+
+    def receive_traded_player(self, player: Player, roster_type: str):
+        """Add a player arriving in a trade, roster and cap checks belong to the trade"""
+        if roster_type not in self.roster:
+            raise ValueError(f"Invalid roster type: {roster_type}")
+
+        self.roster[roster_type].append(player)
+        player.roster_status = roster_type
+        player.fantasy_team = self.name
+        self._charge_player(player)
+        self._reindex(player)
+        self._record('receive_traded_player', player=player, roster_type=roster_type)
+
+
+    def extend_player_contract(self, player: Player, years: int) -> float:
+        """Extend a rostered player's contract and charge the raise to the cap"""
+        if player.fantasy_team != self.name:
+            raise ValueError(f"Cannot extend player: {player.name} not on your team!")
+
+        salary_increase = player.extend_contract(years)
+        self._charge_player(player)
+        self._record('extend_player_contract', player=player, years=years)
+        return salary_increase
+
+
+    def tag_player(self, player: Player, salary: float, transition: bool = False):
+        """Franchise or transition tag a rostered player's expiring contract and charge the tag salary"""
+        if player.fantasy_team != self.name:
+            raise ValueError(f"Cannot tag player: {player.name} not on your team!")
+
+        player.contract.apply_tag(salary, transition=transition)
+        self._charge_player(player)
+        self._record('tag_player', player=player, salary=salary, transition=transition)
+
+
+    def resolve_player_holdout(self, player: Player, decision: str) -> float:
+        """Resolve a rostered player's holdout, keeping roster lists and cap in sync"""
+        if player.fantasy_team != self.name:
+            raise ValueError(f"Cannot resolve holdout: {player.name} not on your team!")
+
+        roster_type = player.roster_status
+        result = player.resolve_holdout(decision)
+
+        if decision == 'release':
+            # Player is now a free agent, release leaves dead money behind
+            self.roster[roster_type].remove(player)
+            self._release_charge(player)
+            self.dead_money += result
+        else:
+            # Rejected holdouts are sent to the practice squad
+            if player.roster_status != roster_type:
+                self.roster[roster_type].remove(player)
+                self.roster[player.roster_status].append(player)
+            self._charge_player(player)
+
+        self._reindex(player)
+        self._record('resolve_player_holdout', player=player, decision=decision)
+        return result
+
+
+    def advance_contracts(self) -> List[Player]:
+        """Advance every rostered contract one year, returning players whose contracts expired"""
+        expired = []
+        for roster_list in self.roster.values():
+            for player in roster_list:
+                if player.contract:
+                    player.advance_contract_year()
+                    if player.contract is None:
+                        expired.append(player)
+                    else:
+                        self._charge_player(player)
+
+        self.drop_expired(expired)
+        return expired
+
+
+    def drop_expired(self, expired: List[Player]):
+        """Take players whose contracts just ran out off the roster, without dead money"""
+        if not expired:
+            return
+
+        expired_ids = {id(p) for p in expired}
+        for roster_list in self.roster.values():
+            roster_list[:] = [p for p in roster_list if id(p) not in expired_ids]
+        for player in expired:
+            self._release_charge(player)
+            self._reindex(player)
 
 
     def can_afford(self, player: Player, roster_type: str = 'active') -> bool:
@@ -91,8 +218,73 @@ class Team:
         return self.get_remaining_cap() >= effective_salary
 
 
+    def can_afford_salary(self, salary: float, roster_type: str = 'active') -> bool:
+        """Check if team can afford a contract at this salary, before it's signed"""
+        return self.get_remaining_cap() >= salary * SALARY_MULTIPLIERS.get(roster_type, 1.00)
+
+
     def get_total_salary_used(self) -> float:
-        """Calculate total salary against cap"""
+        """Get total salary against cap from the running ledger"""
+        total = self._salary_used + self.dead_money
+
+        if Team.verify_cap_ledger:
+            recomputed = self._recompute_salary_used()
+            if not math.isclose(total, recomputed, rel_tol=1e-9, abs_tol=1e-6):
+                raise RuntimeError(f"Cap ledger drift for {self.name}: "
+                                   f"ledger ${total:.4f} != recomputed ${recomputed:.4f}")
+
+        return total
+
+
+    def rebuild_cap_ledger(self):
+        """Rebuild the cap ledger from the current roster"""
+        self._cap_charges = {}
+        self._salary_used = 0.0
+        for roster_list in self.roster.values():
+            for player in roster_list:
+                self._charge_player(player)
+
+
+    def load_cap_charges(self, players: List[Player], charges: List[float]):
+        """Replace the cap ledger with effective salaries computed elsewhere, in roster order"""
+        self._cap_charges = {id(player): charge for player, charge in zip(players, charges)}
+        self._salary_used = 0.0
+        for charge in charges:
+            self._salary_used += charge
+
+
+    def refresh_player_salary(self, player: Player):
+        """Re-sync the cap ledger after a player's salary or status changed outside of Team"""
+        self._charge_player(player)
+
+
+    def _reindex(self, player: Player):
+        """Keep the league player registry in sync after a roster change"""
+        if self._registry is not None:
+            self._registry.add(player)
+
+
+    def _record(self, event_type: str, **data):
+        """Record a roster change in the league's transaction log"""
+        if self._log is not None:
+            self._log.record(event_type, team=self.name, **data)
+
+
+    def _charge_player(self, player: Player):
+        """Record a player's current effective salary in the cap ledger"""
+        charge = player.get_effective_salary()
+        previous = self._cap_charges.get(id(player), 0.0)
+        self._cap_charges[id(player)] = charge
+        self._salary_used += charge - previous
+
+
+    def _release_charge(self, player: Player):
+        """Remove a player's charge from the cap ledger"""
+        self._salary_used -= self._cap_charges.pop(id(player), 0.0)
+
+
+    def _recompute_salary_used(self) -> float:
+        """Calculate total salary against cap by walking the full roster"""
         total = 0.0
 
         # Add up effective salaries from all roster types
@@ -120,8 +312,11 @@ class Team:
 
 
     def get_starting_lineup_players(self) -> List[Player]:
-        """Get players who can start (active roster only)"""
-        return self.roster['active'].copy()
+        """Get the highest-scoring legal starting lineup from the active roster"""
+        from src.services.lineup import LineupOptimizer
+
+        lineup = LineupOptimizer().optimize(self.roster['active'])
+        return [player for _, player, _ in lineup if player is not None]
 
 
     def is_salary_cap_compliant(self) -> bool:
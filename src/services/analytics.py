@@ -0,0 +1,54 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.settings import LEAGUE_SETTINGS
+from src.models.player import Player
+from src.models.team import Team
+
+
+def summarize_top_performers(teams: Iterable[Team], thresholds: Optional[Dict[str, int]] = None
+                             ) -> Tuple[Dict[str, float], Dict[str, List[Player]]]:
+    """Find each position's top performers and their average salary in one pass
+
+    Walks every rostered, contracted player once, keeping a bounded min-heap
+    of the best k players per position instead of sorting full lists. Ties in
+    fantasy points go to the player seen first, matching a stable sort.
+
+    Args:
+        teams: Teams whose rosters are scanned
+        thresholds: Position -> number of top performers, defaults to the
+            league's holdout thresholds
+
+    Returns:
+        (position -> average salary of its top performers,
+         position -> top performers ordered best first)
+    """
+    thresholds = thresholds if thresholds is not None else LEAGUE_SETTINGS['holdout_thresholds']
+    heaps: Dict[str, List[Tuple[float, int, Player]]] = {
+            position: [] for position, k in thresholds.items() if k > 0}
+
+    seq = 0
+    for team in teams:
+        for roster_list in team.roster.values():
+            for player in roster_list:
+                heap = heaps.get(player.position)
+                if heap is None or not player.contract:
+                    continue
+
+                # Negative sequence makes later players lose ties
+                entry = (player.fantasy_points, -seq, player)
+                seq += 1
+                if len(heap) < thresholds[player.position]:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+    position_averages: Dict[str, float] = {}
+    top_performers: Dict[str, List[Player]] = {}
+    for position, heap in heaps.items():
+        best = [player for _, _, player in sorted(heap, key=lambda e: e[:2], reverse=True)]
+        top_performers[position] = best
+        if best:
+            position_averages[position] = sum(p.contract.current_salary for p in best) / len(best)
+
+    return position_averages, top_performers
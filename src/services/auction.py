@@ -0,0 +1,312 @@
+import math
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config.settings import AUCTION_SETTINGS, LEAGUE_SETTINGS, ROSTER_REQUIREMENTS, SALARY_MULTIPLIERS
+from src.models.contract import Contract
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+from src.services.lineup import FLEX_ELIGIBILITY
+
+
+def starter_targets(lineup_requirements: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """Starters each team needs per position, splitting every flex slot between its positions"""
+    requirements = lineup_requirements or ROSTER_REQUIREMENTS['starting_lineup']
+    targets: Dict[str, float] = {}
+    for slot, count in requirements.items():
+        positions = FLEX_ELIGIBILITY.get(slot, (slot,))
+        for position in positions:
+            targets[position] = targets.get(position, 0.0) + count / len(positions)
+    return targets
+
+
+class ValueCurve:
+    """Auction dollar values for a player pool, computed once and shared by every bot
+
+    A player is worth the minimum bid plus a share of the league's spendable
+    dollars proportional to their fantasy points over replacement, where
+    replacement is the best player left at the position once every team has
+    filled its starters.
+    """
+
+    def __init__(self, players: Sequence[Player], num_teams: int, budget: float,
+                 roster_slots: int, min_bid: Optional[float] = None):
+        min_bid = min_bid if min_bid is not None else AUCTION_SETTINGS['min_bid']
+        self.players = list(players)
+        self.index = {id(player): i for i, player in enumerate(self.players)}
+
+        points = np.array([p.fantasy_points for p in self.players], dtype=np.float64)
+        positions = np.array([p.position for p in self.players])
+        targets = starter_targets()
+
+        replacement = np.zeros(len(self.players))
+        for position in np.unique(positions):
+            mask = positions == position
+            depth = int(round(targets.get(position, 0.0) * num_teams))
+            ranked = np.sort(points[mask])[::-1]
+            replacement[mask] = ranked[depth] if depth < len(ranked) else 0.0
+
+        surplus = np.maximum(points - replacement, 0.0)
+        spendable = max(budget - min(roster_slots, len(self.players)) * min_bid, 0.0)
+        share = surplus / surplus.sum() if surplus.sum() > 0 else surplus
+        self.values = min_bid + share * spendable
+
+        # Most valuable first, for nominations
+        self.order = np.argsort(-self.values, kind='stable')
+
+
+    def value_of(self, player: Player) -> float:
+        return float(self.values[self.index[id(player)]])
+
+
+class BotBidder:
+    """Nominates the best player left and bids their curve value, discounted at filled positions"""
+
+    def __init__(self, aggression: float = 1.0, depth_discount: float = 0.5):
+        self.aggression = aggression
+        self.depth_discount = depth_discount
+
+
+    def nominate(self, auction: 'AuctionDraft', team: Team) -> Optional[Player]:
+        return auction.best_available()
+
+
+    def bid_limit(self, auction: 'AuctionDraft', team: Team, player: Player, max_bid: float) -> float:
+        limit = auction.value_for(team, player) * self.aggression
+        if auction.starters_needed(team, player.position) <= 0:
+            limit *= self.depth_discount
+        return min(limit, max_bid)
+
+
+class HumanBidder:
+    """Hands nominations and bids to callbacks, e.g. CLI prompts
+
+    nominate(auction, team) returns a player from auction.available(), and
+    bid_limit(auction, team, player, max_bid) returns the most the team will
+    pay (0 to pass).
+    """
+
+    def __init__(self, nominate: Callable[['AuctionDraft', Team], Optional[Player]],
+                 bid_limit: Callable[['AuctionDraft', Team, Player, float], float]):
+        self._nominate = nominate
+        self._bid_limit = bid_limit
+
+
+    def nominate(self, auction: 'AuctionDraft', team: Team) -> Optional[Player]:
+        return self._nominate(auction, team)
+
+
+    def bid_limit(self, auction: 'AuctionDraft', team: Team, player: Player, max_bid: float) -> float:
+        return self._bid_limit(auction, team, player, max_bid)
+
+
+class AuctionDraft:
+    """Free agent auction run in nomination order with proxy bidding
+
+    Each lot is opened by the nominating team at the minimum bid. Every team
+    gives the most it would pay (capped at its max bid and rounded down to
+    whole bid increments), and the lot resolves like an open auction: the
+    highest limit wins at one increment over the runner-up. Ties go to the
+    team closest to the nominator in order.
+    """
+
+    def __init__(self, league: League, players: Optional[Sequence[Player]] = None,
+                 bidders: Optional[Dict[str, object]] = None, curve: Optional[ValueCurve] = None,
+                 seed=None, volatility: float = 0.1):
+        self.league = league
+        self.teams = list(league.auction_nomination_order or league.teams)
+        if not self.teams:
+            raise ValueError("Auction needs at least one team")
+
+        self.players = list(players) if players is not None else \
+                [p for p in league.free_agents if p.is_available()]
+        self.min_bid = AUCTION_SETTINGS['min_bid']
+        self.increment = AUCTION_SETTINGS['bid_increment']
+
+        bidders = bidders or {}
+        self.bidders = [bidders.get(team.name) or BotBidder() for team in self.teams]
+        self._team_index = {id(team): i for i, team in enumerate(self.teams)}
+
+        self.budgets = [team.get_remaining_cap() for team in self.teams]
+        self.open_slots = [LEAGUE_SETTINGS['max_roster_size'] - len(team.roster['active'])
+                           for team in self.teams]
+        self.curve = curve or ValueCurve(self.players, len(self.teams), sum(self.budgets),
+                                         sum(max(slots, 0) for slots in self.open_slots), self.min_bid)
+
+        # Per team, per player noise so repeated mock auctions play out differently
+        rng = np.random.default_rng(seed)
+        shape = (len(self.teams), len(self.curve.players))
+        self._noise = (rng.lognormal(0.0, volatility, shape) if volatility > 0 else np.ones(shape)).tolist()
+        self._values = self.curve.values.tolist()
+
+        targets = starter_targets()
+        self._needs = []
+        for team in self.teams:
+            # A flex slot counts as a need at every position that can fill it
+            needs = {position: math.ceil(count) for position, count in targets.items()}
+            for player in team.roster['active']:
+                needs[player.position] = needs.get(player.position, 0) - 1
+            self._needs.append(needs)
+
+        self._sold = set()
+        pool = {id(player) for player in self.players}
+        self._order = [i for i in self.curve.order.tolist() if id(self.curve.players[i]) in pool]
+        self._next = 0
+
+
+    def available(self) -> List[Player]:
+        """Players still up for auction, most valuable first"""
+        return [self.curve.players[i] for i in self._order[self._next:] if i not in self._sold]
+
+
+    def best_available(self) -> Optional[Player]:
+        while self._next < len(self._order) and self._order[self._next] in self._sold:
+            self._next += 1
+        return self.curve.players[self._order[self._next]] if self._next < len(self._order) else None
+
+
+    def max_bid(self, team: Team) -> float:
+        """Most a team can bid while keeping the minimum bid for each other open slot"""
+        i = self._team_index[id(team)]
+        if self.open_slots[i] <= 0:
+            return 0.0
+        return self.budgets[i] - (self.open_slots[i] - 1) * self.min_bid
+
+
+    def value_for(self, team: Team, player: Player) -> float:
+        """A player's curve value as seen by one team in this auction"""
+        i, j = self._team_index[id(team)], self.curve.index[id(player)]
+        return self._values[j] * self._noise[i][j]
+
+
+    def starters_needed(self, team: Team, position: str) -> int:
+        return self._needs[self._team_index[id(team)]].get(position, 0)
+
+
+    def run(self, apply: bool = True, max_lots: Optional[int] = None) -> List[Dict[str, object]]:
+        """Run nomination rounds until rosters are full, money runs out or the pool is empty
+
+        Args:
+            apply: Award contracts and roster players; False runs a mock
+                auction that leaves the league untouched
+            max_lots: Stop after this many players are sold
+
+        Returns:
+            One dict per sale with 'player', 'team', 'price' and 'nominated_by'
+        """
+        sales = []
+        nominator = 0
+        passes = 0
+        while passes < len(self.teams) and (max_lots is None or len(sales) < max_lots):
+            team = self.teams[nominator % len(self.teams)]
+            nominator += 1
+
+            player = self.bidders[self._team_index[id(team)]].nominate(self, team) \
+                    if self.max_bid(team) >= self.min_bid else None
+            if player is None:
+                passes += 1
+                continue
+            if id(player) not in self.curve.index or self.curve.index[id(player)] in self._sold:
+                raise ValueError(f"{player.name} is not available in this auction")
+
+            passes = 0
+            sales.append(self._run_lot(team, player))
+
+        if apply:
+            self._apply(sales)
+        return sales
+
+
+    def _run_lot(self, nominator: Team, player: Player) -> Dict[str, object]:
+        start = self._team_index[id(nominator)]
+        limits = []
+        for offset in range(len(self.teams)):
+            i = (start + offset) % len(self.teams)
+            team = self.teams[i]
+            max_bid = self.max_bid(team)
+            if max_bid < self.min_bid:
+                continue
+            limit = self._to_bid(min(self.bidders[i].bid_limit(self, team, player, max_bid), max_bid))
+            if offset == 0:
+                limit = max(limit, self.min_bid) # Nominating opens the bidding
+            if limit >= self.min_bid:
+                limits.append((limit, -offset, i))
+
+        limits.sort(reverse=True)
+        winner_limit, _, winner = limits[0]
+        price = self.min_bid
+        if len(limits) > 1:
+            price = max(min(limits[1][0] + self.increment, winner_limit), self.min_bid)
+
+        self.budgets[winner] -= price
+        self.open_slots[winner] -= 1
+        needs = self._needs[winner]
+        needs[player.position] = needs.get(player.position, 0) - 1
+        self._sold.add(self.curve.index[id(player)])
+
+        return {'player': player, 'team': self.teams[winner], 'price': price, 'nominated_by': nominator}
+
+
+    def _to_bid(self, amount: float) -> float:
+        """Round an amount down to a legal bid: the minimum plus whole increments"""
+        if amount < self.min_bid:
+            return 0.0
+        return self.min_bid + math.floor((amount - self.min_bid) / self.increment) * self.increment
+
+
+    def _apply(self, sales: List[Dict[str, object]]):
+        """Sign each winner to an auction contract and take them out of free agency
+
+        Every sale is checked against its team's roster space and cap before
+        anyone signs, so either all of them go through or none do.
+        """
+        self._check_sales(sales)
+
+        years = AUCTION_SETTINGS['contract_years']
+        for sale in sales:
+            player = sale['player']
+            player.set_contract(Contract(player.name, sale['price'], years, start_year=self.league.season_year))
+            sale['team'].add_player(player)
+
+        self.league.remove_free_agents([sale['player'] for sale in sales])
+
+
+    def _check_sales(self, sales: List[Dict[str, object]]):
+        """Raise ValueError if any team can't take on all of its sales"""
+        by_team: Dict[int, List[Dict[str, object]]] = {}
+        for sale in sales:
+            if not sale['player'].is_available():
+                raise ValueError(f"{sale['player'].name} is not available")
+            by_team.setdefault(id(sale['team']), []).append(sale)
+
+        for team_sales in by_team.values():
+            team = team_sales[0]['team']
+            if team._get_roster_size('active') + len(team_sales) > team._get_roster_max('active'):
+                raise ValueError(f"{team.name} has no active roster room for {len(team_sales)} more players")
+            total = sum(sale['price'] for sale in team_sales) * SALARY_MULTIPLIERS['active']
+            if total > team.get_remaining_cap() + 1e-9:
+                raise ValueError(f"Cannot afford ${total:.2f} in auction contracts for {team.name}")
+
+
+def mock_auctions(league: League, runs: int, seed=None, volatility: float = 0.1) -> Dict[str, Dict[str, float]]:
+    """Run many mock auctions against the same pool, sharing one value curve
+
+    Returns:
+        Player name -> {'avg_price': mean price when sold, 'sold_rate': share of runs sold}
+    """
+    first = AuctionDraft(league, seed=seed, volatility=volatility)
+    seeds = np.random.SeedSequence(seed).spawn(runs)
+
+    totals: Dict[str, List[float]] = {player.name: [0.0, 0] for player in first.players}
+    for run_seed in seeds:
+        auction = AuctionDraft(league, players=first.players, curve=first.curve,
+                               seed=run_seed, volatility=volatility)
+        for sale in auction.run(apply=False):
+            total = totals[sale['player'].name]
+            total[0] += sale['price']
+            total[1] += 1
+
+    return {name: {'avg_price': price / sold if sold else 0.0, 'sold_rate': sold / runs}
+            for name, (price, sold) in totals.items()}
@@ -0,0 +1,203 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import SALARY_MULTIPLIERS
+from src.models.player import Player
+from src.models.team import Team
+
+# Move -> roster the player ends up on (None for cuts)
+MOVES = {
+    'cut': None,
+    'practice_squad': 'practice_squad',
+    'IR': 'IR',
+    'reject_holdout': 'practice_squad',
+}
+
+_SLOT_CODES = {None: 0, 'practice_squad': 1, 'IR': 2}
+
+
+def season_value(player: Player, move: str) -> float:
+    """Fantasy points given up by a move: every remaining contract season for a cut, this season otherwise"""
+    if move == 'cut':
+        return player.fantasy_points * player.contract.years_remaining
+    return player.fantasy_points
+
+
+def _solve_team(savings: np.ndarray, values: np.ndarray, slots: np.ndarray, groups: np.ndarray,
+                target: int, ps_free: int, ir_free: int) -> Optional[List[int]]:
+    """Cheapest set of options saving at least target, at most one option per group
+
+    A multiple-choice covering knapsack over (practice squad slots used, IR
+    slots used, savings) where best[p, r, s] is the least value lost saving
+    at least s with at most p and r slots. Backtracking keeps one byte per
+    state and group: which of the group's options was taken, if any.
+
+    Returns:
+        Indices of the chosen options, or None if no combination saves enough
+    """
+    shape = (ps_free + 1, ir_free + 1, target + 1)
+    best = np.full(shape, np.inf)
+    best[:, :, 0] = 0.0
+
+    choices = []
+    for group in np.unique(groups).tolist():
+        new = best.copy()
+        members = np.flatnonzero(groups == group).tolist()
+        choice = np.full(shape, -1, dtype=np.int8)
+        for local, k in enumerate(members):
+            dp, dr = int(slots[k] == 1), int(slots[k] == 2)
+            if dp > ps_free or dr > ir_free:
+                continue
+
+            # Pull from the state before this option, savings past the target count as the target
+            before = best[:ps_free + 1 - dp, :ir_free + 1 - dr]
+            w = min(int(savings[k]), target + 1)
+            candidate = np.empty_like(before)
+            candidate[..., :w] = before[..., :1]
+            candidate[..., w:] = before[..., :target + 1 - w]
+            candidate += values[k]
+
+            region = new[dp:, dr:]
+            better = candidate < region
+            np.copyto(region, candidate, where=better)
+            choice[dp:, dr:][better] = local
+        best = new
+        choices.append((members, choice))
+
+    if not math.isfinite(best[ps_free, ir_free, target]):
+        return None
+
+    chosen = []
+    p, r, s = ps_free, ir_free, target
+    for members, choice in reversed(choices):
+        local = int(choice[p, r, s])
+        if local >= 0:
+            k = members[local]
+            chosen.append(k)
+            p, r, s = p - int(slots[k] == 1), r - int(slots[k] == 2), max(s - int(savings[k]), 0)
+    return chosen[::-1]
+
+
+class CapComplianceSolver:
+    """Propose the cheapest set of roster moves to bring each over-cap team under the cap
+
+    Every player on an over-cap team can be cut (leaving dead money behind),
+    moved to the practice squad if eligible, moved from the active roster to
+    IR, or, if holding out, have their holdout rejected, which sends them to
+    the practice squad. Savings follow SALARY_MULTIPLIERS and each move costs
+    the value it gives up (season_value by default). Each team is a multiple-
+    choice knapsack solved exactly by dynamic programming over savings, in
+    steps of resolution dollars ($1 by default, savings rounded down and the
+    overage up so plans never come up short), and open practice squad and IR
+    slots.
+    """
+
+    def __init__(self, league, value: Callable[[Player, str], float] = season_value,
+                 resolution: float = 1.0):
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive")
+
+        self.league = league
+        self.value = value
+        self.resolution = resolution
+
+
+    def moves(self, team: Team) -> List[Tuple[Player, str, float, float]]:
+        """Every move available to the team as (player, move, cap savings, value lost)"""
+        options = []
+        for roster_list in team.roster.values():
+            for player in roster_list:
+                if not player.contract:
+                    continue
+
+                salary = player.contract.current_salary
+                charged = player.get_effective_salary()
+                candidates = [('cut', charged - player.contract.calculate_dead_money_penalty())]
+                if player.roster_status == 'active':
+                    if player.is_holdout:
+                        candidates.append(('reject_holdout', charged - salary * SALARY_MULTIPLIERS['practice_squad']))
+                    elif player.is_eligible_for_practice_squad():
+                        candidates.append(('practice_squad', charged - salary * SALARY_MULTIPLIERS['practice_squad']))
+                    candidates.append(('IR', charged - salary * SALARY_MULTIPLIERS['IR']))
+
+                options.extend((player, move, savings, self.value(player, move))
+                               for move, savings in candidates if savings > 0)
+        return options
+
+
+    def solve(self, teams: Optional[List[Team]] = None, workers: Optional[int] = None) -> List[Dict[str, object]]:
+        """Find the cheapest fix for every over-cap team
+
+        Args:
+            teams: Teams to check, defaults to the whole league
+            workers: Worker processes; 1 solves in this process, None uses all cores
+
+        Returns:
+            One plan per over-cap team with 'team', 'overage', 'moves' (dicts
+            with 'player', 'move', 'savings' and 'value_lost'), total
+            'savings' and 'value_lost', and whether the moves are 'feasible'
+            (False, with no moves, if even every move together can't get the
+            team under the cap)
+        """
+        teams = teams if teams is not None else self.league.teams
+        over = [team for team in teams if not team.is_salary_cap_compliant()]
+        problems = [self._problem(team) for team in over]
+
+        args = [problem[1:] for problem in problems]
+        if workers == 1 or len(args) <= 1:
+            solutions = [_solve_team(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                solutions = list(pool.map(_solve_team, *zip(*args)))
+
+        plans = []
+        for team, (options, *_), chosen in zip(over, problems, solutions):
+            moves = [{'player': player, 'move': move, 'savings': savings, 'value_lost': value}
+                     for player, move, savings, value in (options[k] for k in chosen or [])]
+            plans.append({
+                'team': team,
+                'overage': team.get_total_salary_used() - team.salary_cap,
+                'moves': moves,
+                'savings': sum(m['savings'] for m in moves),
+                'value_lost': sum(m['value_lost'] for m in moves),
+                'feasible': chosen is not None,
+            })
+        return plans
+
+
+    def apply(self, plan: Dict[str, object]):
+        """Make a plan's moves on its team"""
+        team = plan['team']
+        log = self.league.transaction_log
+        with log.batch() if log is not None else nullcontext():
+            for move in plan['moves']:
+                player = move['player']
+                if move['move'] == 'cut':
+                    team.remove_player(player)
+                    self.league.add_free_agent(player)
+                elif move['move'] == 'reject_holdout':
+                    team.resolve_player_holdout(player, 'reject')
+                else:
+                    team.move_player(player, move['move'])
+
+
+    def _problem(self, team: Team):
+        """A team's moves and their knapsack arrays, savings rounded down and the target up"""
+        options = self.moves(team)
+        overage = team.get_total_salary_used() - team.salary_cap
+        savings = np.array([math.floor(s / self.resolution + 1e-9) for _, _, s, _ in options], dtype=np.int64)
+        values = np.array([v for _, _, _, v in options], dtype=np.float64)
+        slots = np.array([_SLOT_CODES[MOVES[move]] for _, move, _, _ in options], dtype=np.int64)
+        index: Dict[int, int] = {}
+        groups = np.array([index.setdefault(id(player), len(index)) for player, _, _, _ in options], dtype=np.int64)
+        target = math.ceil(overage / self.resolution - 1e-9)
+
+        ps_free = team._get_roster_max('practice_squad') - team._get_roster_size('practice_squad')
+        ir_free = team._get_roster_max('IR') - team._get_roster_size('IR')
+        ps_free = min(ps_free, int((slots == 1).sum()))
+        ir_free = min(ir_free, int((slots == 2).sum()))
+        return options, savings, values, slots, groups, target, ps_free, ir_free
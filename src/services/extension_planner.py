@@ -0,0 +1,159 @@
+import math
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.models.player import Player
+from src.models.team import Team
+from src.services.projections import CapProjection
+
+EXTENSION_YEARS = range(1, 6)
+
+
+def season_points(player: Player) -> float:
+    """Projected fantasy points per season, from the season just played"""
+    return player.fantasy_points
+
+
+class ExtensionPlanner:
+    """Choose which eligible players to extend, and for how long, over a multi-year horizon
+
+    An extension keeps a player for more seasons at a 20% raise ($10
+    minimum) from this season on. Each option (player, 1-5 added years) is
+    worth the projected points of the seasons it adds within the horizon and
+    costs the extra cap charges it adds, year by year, per CapProjection.
+    Seasons past the horizon count for neither, so when several lengths add
+    the same seasons within it, plans only use the shortest.
+
+    plan() is a dynamic program over players whose state is the cap space a
+    plan spends across the horizon, in steps of resolution dollars. Each
+    state keeps its k best plans and their spending per year, and a plan that
+    would overrun any year's projected cap space is dropped as it's built.
+    """
+
+    def __init__(self, team: Team, horizon: int = 5, resolution: float = 1.0,
+                 projection: Callable[[Player], float] = season_points):
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive")
+
+        self.team = team
+        self.horizon = horizon
+        self.resolution = resolution
+        self.projection = projection
+        self.cap = CapProjection([team], horizon)
+
+
+    def options(self) -> List[Dict[str, object]]:
+        """Every extension open to the team, with its 'player', 'years', 'points' and per-year 'cost'"""
+        cap = self.cap
+        base = cap.salary_schedule() * cap.multiplier[None, :]
+
+        options = []
+        for row in np.flatnonzero(cap.extendable).tolist():
+            player = cap.players[row]
+            years_remaining = int(cap.years_remaining[row])
+            for years in EXTENSION_YEARS:
+                seasons = max(min(years, self.horizon - years_remaining), 0) # Added seasons within the horizon
+                schedule = cap.salary_schedule({player: years}) * cap.multiplier[None, :]
+                options.append({'player': player, 'years': years,
+                                'points': self.projection(player) * seasons,
+                                'cost': schedule[:, row] - base[:, row]})
+        return options
+
+
+    def plan(self, k: int = 5, min_points_per_dollar: float = 0.0) -> List[Dict[str, object]]:
+        """Find the k best extension plans that fit under every projected year's cap
+
+        Args:
+            k: Number of plans to return
+            min_points_per_dollar: Skip extensions returning fewer projected
+                points per dollar of cap they use
+
+        Returns:
+            Plans best first (most projected points, then cheapest), each with
+            'extensions' (player -> added years), the 'points' they add, their
+            total 'cost' over the horizon, 'points_per_dollar' and the
+            projected 'cap_space' left each year
+        """
+        if k < 1:
+            raise ValueError("Number of plans must be positive")
+
+        space = np.maximum(self.cap.cap_space()[:, 0], 0.0)
+        options = [o for o in self.options()
+                   if o['points'] > 0 and o['points'] >= min_points_per_dollar * o['cost'].sum()
+                   and (o['cost'] <= space + 1e-9).all()]
+
+        # Longer extensions adding no seasons within the horizon only repeat a shorter one
+        players: Dict[int, List[Dict[str, object]]] = {}
+        for option in options:
+            player_options = players.setdefault(id(option['player']), [])
+            if not any(o['points'] == option['points'] and np.allclose(o['cost'], option['cost'])
+                       for o in player_options):
+                player_options.append(option)
+
+        budget = int(math.floor(space.sum() / self.resolution + 1e-9))
+        points = np.full((budget + 1, k), -np.inf)
+        points[0, 0] = 0.0
+        spent = np.zeros((budget + 1, k, self.horizon))
+
+        # Per player: the option each kept plan took (-1 for none) and the rank of the plan it extended
+        rows = np.arange(budget + 1)[:, None]
+        steps = []
+        for player_options in players.values():
+            slack = space - spent
+            indices, widths, costs, candidates = [-1], [0], [np.zeros(self.horizon)], [points]
+            for i, option in enumerate(player_options):
+                w = int(math.ceil(option['cost'].sum() / self.resolution - 1e-9))
+                if w > budget:
+                    continue
+                fits = (slack[:budget + 1 - w] >= option['cost'] - 1e-9).all(axis=-1)
+                shifted = np.full_like(points, -np.inf)
+                shifted[w:] = np.where(fits, points[:budget + 1 - w] + option['points'], -np.inf)
+                indices.append(i)
+                widths.append(w)
+                costs.append(option['cost'])
+                candidates.append(shifted)
+
+            best = np.argsort(-np.concatenate(candidates, axis=1), axis=1, kind='stable')[:, :k]
+            source, prev_rank = best // k, best % k
+            points = np.concatenate(candidates, axis=1)[rows, best]
+            prev_state = np.maximum(rows - np.array(widths)[source], 0)
+            spent = spent[prev_state, prev_rank] + np.array(costs)[source]
+            steps.append((player_options, indices, widths, source, prev_rank))
+
+        # Every finite state is a distinct plan
+        states, ranks = np.nonzero(np.isfinite(points))
+        totals = spent[states, ranks].sum(axis=-1)
+        order = np.lexsort((totals, -points[states, ranks]))[:k]
+        return [self._plan(steps, int(states[i]), int(ranks[i]), spent[states[i], ranks[i]])
+                for i in order.tolist()]
+
+
+    def apply(self, plan: Dict[str, object]):
+        """Extend every player in a plan"""
+        for player, years in plan['extensions'].items():
+            self.team.extend_player_contract(player, years)
+
+
+    def _plan(self, steps, state: int, rank: int, spent: np.ndarray) -> Dict[str, object]:
+        """Walk back through the chosen options of one final plan"""
+        extensions: Dict[Player, int] = {}
+        points = 0.0
+        for player_options, option_index, widths, source, prev_rank in reversed(steps):
+            candidate = int(source[state, rank])
+            i = option_index[candidate]
+            rank = int(prev_rank[state, rank])
+            if i >= 0:
+                option = player_options[i]
+                extensions[option['player']] = option['years']
+                points += option['points']
+                state -= widths[candidate]
+
+        cost = float(spent.sum())
+        return {
+            'extensions': dict(reversed(list(extensions.items()))),
+            'points': points,
+            'cost': cost,
+            'points_per_dollar': points / cost if cost else 0.0,
+            'cap_space': self.cap.cap_space()[:, 0] - spent,
+        }
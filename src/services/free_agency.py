@@ -0,0 +1,136 @@
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import FREE_AGENCY_SETTINGS
+from src.models.contract import Contract
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+
+
+class Bid:
+    """A team's sealed offer to a free agent"""
+
+    def __init__(self, team: Team, player: Player, salary: float, years: int, seq: int):
+        self.team = team
+        self.player = player
+        self.salary = salary
+        self.years = years
+        self.seq = seq # Placement order, earlier bids win ties
+
+
+    def __repr__(self):
+        return f"Bid({self.team.name} -> {self.player.name}: ${self.salary:.2f}, {self.years}yr)"
+
+
+class BlindBidding:
+    """A sealed-bid free agency window, resolved all at once
+
+    Teams place one bid per free agent (a new bid replaces their old one).
+    resolve() builds a max-heap of bids per player, then signs players in
+    order of their best live bid: the highest salary wins, ties going to the
+    earlier bid. A winner without the cap or roster space left to sign the
+    player falls through to the next bidder, and the player goes back in line
+    at that bid.
+    """
+
+    def __init__(self, league: League, min_bid: Optional[float] = None,
+                 max_years: Optional[int] = None):
+        self.league = league
+        self.min_bid = min_bid if min_bid is not None else FREE_AGENCY_SETTINGS['min_bid']
+        self.max_years = max_years or FREE_AGENCY_SETTINGS['max_contract_years']
+        self._bids: Dict[Tuple[str, int], Bid] = {}
+        self._seq = 0
+
+
+    def place_bid(self, team: Team, player: Player, salary: float, years: int = 1) -> Bid:
+        """Submit a sealed bid, replacing the team's earlier bid on the player"""
+        if self.league.get_team_by_name(team.name) is not team:
+            raise ValueError(f"{team.name} is not in this league")
+        if not player.is_available():
+            raise ValueError(f"{player.name} is not available")
+        if not math.isfinite(salary) or salary < self.min_bid:
+            raise ValueError(f"Bid must be at least ${self.min_bid:.2f}")
+        if not (1 <= years <= self.max_years):
+            raise ValueError(f"Contract must be between 1-{self.max_years} years")
+
+        self._seq += 1
+        bid = Bid(team, player, salary, years, self._seq)
+        self._bids[(team.name, id(player))] = bid
+        return bid
+
+
+    def withdraw_bid(self, team: Team, player: Player):
+        """Take back a team's bid on a player"""
+        if self._bids.pop((team.name, id(player)), None) is None:
+            raise ValueError(f"{team.name} has no bid on {player.name}")
+
+
+    def bids(self) -> List[Bid]:
+        """Every standing bid, in placement order"""
+        return sorted(self._bids.values(), key=lambda bid: bid.seq)
+
+
+    def resolve(self) -> List[Dict[str, object]]:
+        """Sign every free agent with a bid to their best live bidder
+
+        Returns:
+            One dict per player bid on, in signing order, with 'player',
+            'team', 'salary', 'years' and 'passed' (teams whose winning bid
+            fell through); team, salary and years are None for players
+            nobody could sign
+        """
+        heaps: Dict[int, List[Tuple[float, int, Bid]]] = {}
+        for bid in self._bids.values():
+            heaps.setdefault(id(bid.player), []).append((-bid.salary, bid.seq, bid))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+
+        # Players ordered by their best live bid
+        queue = [heap[0][:2] + (player_id,) for player_id, heap in heaps.items()]
+        heapq.heapify(queue)
+
+        results = []
+        passed: Dict[int, List[Team]] = {}
+        full = set() # Teams whose active roster filled up, it only grows during the window
+        signed = []
+        while queue:
+            _, _, player_id = heapq.heappop(queue)
+            heap = heaps[player_id]
+            _, _, bid = heapq.heappop(heap)
+            player = bid.player
+
+            if bid.team.name not in full and self._sign(bid):
+                signed.append(player)
+                results.append({'player': player, 'team': bid.team, 'salary': bid.salary,
+                                'years': bid.years, 'passed': passed.pop(player_id, [])})
+                continue
+
+            if bid.team._get_roster_size('active') >= bid.team._get_roster_max('active'):
+                full.add(bid.team.name)
+            passed.setdefault(player_id, []).append(bid.team)
+            if heap:
+                heapq.heappush(queue, heap[0][:2] + (player_id,))
+            else:
+                results.append({'player': player, 'team': None, 'salary': None,
+                                'years': None, 'passed': passed.pop(player_id)})
+
+        self.league.remove_free_agents(signed)
+        self._bids = {}
+        return results
+
+
+    def _sign(self, bid: Bid) -> bool:
+        """Sign the bid's player if the team still has the room and cap space for it"""
+        team, player = bid.team, bid.player
+        if not player.is_available() or team._get_roster_size('active') >= team._get_roster_max('active'):
+            return False
+
+        if not team.can_afford_salary(bid.salary):
+            return False
+
+        player.set_contract(Contract(player.name, bid.salary, bid.years,
+                                     start_year=self.league.season_year))
+        team.add_player(player)
+        return True
@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, ROSTER_REQUIREMENTS, VALID_POSITIONS
+from src.models.player import Player
+from src.models.team import Team
+from src.utils.assignment import solve_assignment
+
+# Positions each flex slot accepts
+FLEX_ELIGIBILITY = {
+    'FLEX_RB_WR': ('RB', 'WR'),
+    'FLEX_WR_TE': ('WR', 'TE'),
+}
+
+# One filled lineup slot: (slot, player or None if left empty, projected points)
+LineupSlot = Tuple[str, Optional[Player], float]
+
+# Cost for putting a player in a slot they can't play
+FORBIDDEN = 1e12
+
+
+class LineupOptimizer:
+    """Picks the highest-projected legal starting lineup using an exact assignment"""
+
+    def __init__(self, lineup_requirements: Optional[Dict[str, int]] = None):
+        requirements = lineup_requirements or ROSTER_REQUIREMENTS['starting_lineup']
+        self.slots = [slot for slot, count in requirements.items() for _ in range(count)]
+        self.slot_positions = [FLEX_ELIGIBILITY.get(slot, (slot,)) for slot in self.slots]
+
+        # Most slots one position can fill; nobody below that depth can start
+        self.max_starters = {position: sum(position in eligible for eligible in self.slot_positions)
+                             for position in VALID_POSITIONS}
+
+
+    def optimize(self, players: Sequence[Player],
+                 projections: Optional[Sequence[float]] = None) -> List[LineupSlot]:
+        """Find the lineup with the most projected points
+
+        Args:
+            players: Players available to start
+            projections: Projected points per player, defaults to fantasy_points
+
+        Returns:
+            One (slot, player, points) entry per lineup slot, player is None
+            when no eligible player is left for the slot
+        """
+        if projections is None:
+            projections = [p.fantasy_points for p in players]
+        if len(projections) != len(players):
+            raise ValueError(f"Expected {len(players)} projections, got {len(projections)}")
+
+        candidates = self._candidates(players, projections)
+        num_slots = len(self.slots)
+
+        # Slots x (candidates + one empty column per slot), minimizing negative points
+        cost = []
+        for eligible in self.slot_positions:
+            row = [-points if player.position in eligible else FORBIDDEN
+                   for player, points in candidates]
+            row.extend([0.0] * num_slots)
+            cost.append(row)
+
+        lineup = []
+        for slot, column in zip(self.slots, solve_assignment(cost)):
+            if column < len(candidates):
+                player, points = candidates[column]
+                lineup.append((slot, player, points))
+            else:
+                lineup.append((slot, None, 0.0))
+        return lineup
+
+
+    def optimize_weeks(self, players: Sequence[Player],
+                       weekly_projections: np.ndarray) -> List[List[LineupSlot]]:
+        """Find the best lineup for each week from a (weeks, players) projection array"""
+        weekly_projections = np.asarray(weekly_projections, dtype=np.float64)
+        if weekly_projections.ndim != 2 or weekly_projections.shape[1] != len(players):
+            raise ValueError(f"Expected projections shaped (weeks, {len(players)}), "
+                             f"got {weekly_projections.shape}")
+
+        return [self.optimize(players, week.tolist()) for week in weekly_projections]
+
+
+    def optimize_league(self, teams: Sequence[Team],
+                        weekly_projections: Optional[Dict[str, np.ndarray]] = None,
+                        weeks: Optional[int] = None) -> Dict[str, List[List[LineupSlot]]]:
+        """Solve every team's lineup for every week in one call
+
+        Args:
+            teams: Teams to solve, lineups come from each active roster
+            weekly_projections: Team name -> (weeks, active players) projections in
+                active roster order; teams left out project fantasy_points evenly
+                across the season
+            weeks: Weeks to solve, defaults to the full regular season plus playoffs
+        """
+        weeks = weeks or LEAGUE_SETTINGS['regular_season_weeks'] + LEAGUE_SETTINGS['playoff_weeks']
+        weekly_projections = weekly_projections or {}
+
+        lineups = {}
+        for team in teams:
+            players = team.roster['active']
+            projections = weekly_projections.get(team.name)
+            if projections is None:
+                per_week = np.array([p.fantasy_points for p in players]) / weeks
+                projections = np.tile(per_week, (weeks, 1))
+            lineups[team.name] = self.optimize_weeks(players, projections)
+        return lineups
+
+
+    def _candidates(self, players: Sequence[Player],
+                    projections: Sequence[float]) -> List[Tuple[Player, float]]:
+        """Keep only the top players at each position who could possibly start"""
+        by_position: Dict[str, List[Tuple[Player, float]]] = {}
+        for player, points in zip(players, projections):
+            if self.max_starters.get(player.position, 0):
+                by_position.setdefault(player.position, []).append((player, points))
+
+        candidates = []
+        for position, group in by_position.items():
+            group.sort(key=lambda entry: entry[1], reverse=True)
+            candidates.extend(group[:self.max_starters[position]])
+        return candidates
+
+
+def lineup_points(lineup: List[LineupSlot]) -> float:
+    """Total projected points for a lineup"""
+    return sum(points for _, player, points in lineup if player is not None)
@@ -0,0 +1,265 @@
+from contextlib import nullcontext
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, VALID_POSITIONS
+from src.models.player import Player
+from src.models.rankings import SeasonRankings
+from src.models.team import Team
+
+_POSITION_CODES = {position: code for code, position in enumerate(VALID_POSITIONS)}
+_UNRANKED = len(VALID_POSITIONS)
+
+_HOLDOUT_FIELDS = attrgetter('contract', 'position', 'fantasy_points', 'position_rank_end_of_season')
+
+
+class OffseasonEngine:
+    """Batched drop-in for League.advance_season
+
+    Gathers every rostered contract into arrays once per offseason, then ages
+    contracts, finds expirations, ranks the season, flags holdouts and checks
+    the cap as whole-array operations before writing the results back to the
+    players and teams. Results match advance_season, except that each team's
+    cap ledger is re-summed in roster order (as rebuild_cap_ledger does)
+    rather than updated one player at a time.
+    """
+
+    def __init__(self, league, verbose: bool = True):
+        self.league = league
+        self.verbose = verbose
+
+        # Registered players and their ids and position codes, as of the last offseason
+        self._players: List[Player] = []
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._positions = np.zeros(0, dtype=np.int64)
+
+
+    def advance_season(self) -> Dict[str, object]:
+        """Advance to next season, handling all offseason tasks
+
+        Returns:
+            Dict with the new 'season_year', the 'expired' players, the
+            players now holding out ('holdouts') and the teams over the cap
+            ('violations')
+        """
+        league = self.league
+        self._print(f"Advancing from {league.season_year} to {league.season_year + 1}!")
+
+        # Logged as one event followed by a snapshot, like League.advance_season
+        log = league.transaction_log
+        with log.transaction('advance_season') if log is not None else nullcontext():
+            # 1. Advance all player contracts
+            expired = self._advance_all_contracts()
+
+            # 2. Increase salary cap by 5%
+            league.current_salary_cap *= LEAGUE_SETTINGS['salary_cap_increase_rate']
+            for team in league.teams:
+                team.salary_cap = league.current_salary_cap
+
+            # 3. Process holdouts
+            holdouts = self._process_holdouts()
+
+            # 4. Expired contracts already left their rosters in step 1
+
+            # 5. Validate team salary caps
+            violations = self._validate_salary_caps()
+
+            # 6. Set up draft order
+            league._determine_rookie_draft_order()
+
+            league.season_year += 1
+            league.current_phase = "rookie_draft"
+
+        return {'season_year': league.season_year, 'expired': expired,
+                'holdouts': holdouts, 'violations': violations}
+
+
+    def run(self, seasons: int,
+            before_offseason: Optional[Callable[[object], None]] = None) -> List[Dict[str, object]]:
+        """Advance many seasons, e.g. for a dynasty simulation
+
+        Args:
+            seasons: Number of offseasons to run
+            before_offseason: Called with the league before each offseason,
+                e.g. to simulate stats or refill rosters
+
+        Returns:
+            advance_season's result for every season
+        """
+        results = []
+        for _ in range(seasons):
+            if before_offseason is not None:
+                before_offseason(self.league)
+            results.append(self.advance_season())
+        return results
+
+
+    def _advance_all_contracts(self) -> List[Player]:
+        """Age every rostered contract at once and drop the ones that ran out"""
+        teams = self.league.teams
+        contracted = [(t, p) for t, team in enumerate(teams)
+                      for roster_list in team.roster.values() for p in roster_list if p.contract]
+        if not contracted:
+            return []
+
+        years = np.fromiter((p.contract.years_remaining for _, p in contracted), dtype=np.int64,
+                            count=len(contracted))
+        salary = np.fromiter((p.contract.current_salary for _, p in contracted), dtype=np.float64,
+                             count=len(contracted))
+        tagged = np.fromiter((p.contract.is_tagged() for _, p in contracted), dtype=bool,
+                             count=len(contracted))
+        if (years <= 0).any():
+            raise ValueError("Contract has already expired")
+
+        # 20% salary increase for every untagged contract with years left
+        years -= 1
+        kept = years > 0
+        salary = np.where(kept & ~tagged, salary * LEAGUE_SETTINGS['player_salary_increase_rate'], salary)
+
+        expired_by_team: List[List[Player]] = [[] for _ in teams]
+        for (t, player), years_left, new_salary, still_signed in zip(contracted, years.tolist(), salary.tolist(),
+                                                                     kept.tolist()):
+            player.contract.years_remaining = years_left
+            if still_signed:
+                player.contract.current_salary = new_salary
+            else:
+                player._become_free_agent()
+                expired_by_team[t].append(player)
+
+        # Expired players leave without dead money, everyone else is re-charged at the new salary
+        for team, team_expired in zip(teams, expired_by_team):
+            team.drop_expired(team_expired)
+            players = [p for roster_list in team.roster.values() for p in roster_list]
+            team.load_cap_charges(players, [p.get_effective_salary() for p in players])
+
+        expired = [p for team_expired in expired_by_team for p in team_expired]
+        self.league.add_free_agents([p for p in expired if p.is_available()])
+        return expired
+
+
+    def _process_holdouts(self) -> List[Player]:
+        """Rank the season and flag every top performer underpaid against their position"""
+        league = self.league
+
+        # Pull real season results when a data source is configured
+        if league.data_source is not None:
+            league.data_source.apply_season_points(league, league.season_year)
+
+        rankings = self._rank_season()
+
+        rostered = [(team, p) for team in league.teams for roster_list in team.roster.values() for p in roster_list]
+        if not rostered:
+            return []
+
+        contracts, positions, points, ranks = zip(*(_HOLDOUT_FIELDS(p) for _, p in rostered))
+        has_contract = np.array([c is not None for c in contracts])
+        position = np.array([_POSITION_CODES[pos] for pos in positions])
+        points = np.array(points, dtype=np.float64)
+        years = np.array([c.years_remaining if c else 0 for c in contracts])
+        salary = np.array([c.current_salary if c else 0.0 for c in contracts], dtype=np.float64)
+        rank = np.array([r or 0 for r in ranks]) # Just written by _rank_season
+
+        # Per position: holdout threshold, ranked pool size and top performers' average salary
+        thresholds = LEAGUE_SETTINGS['holdout_thresholds']
+        threshold_of = np.array([thresholds.get(pos, 0) for pos in VALID_POSITIONS])
+        size_of = np.array([rankings.position_size(pos) for pos in VALID_POSITIONS])
+        average_of = np.zeros(len(VALID_POSITIONS))
+        for code, k in enumerate(threshold_of.tolist()):
+            if k > 0:
+                pool = np.flatnonzero(has_contract & (position == code))
+                best = pool[np.argsort(-points[pool], kind='stable')[:k]]
+                if len(best):
+                    average_of[code] = sum(salary[best].tolist()) / len(best)
+
+        threshold = threshold_of[position]
+        eligible = (has_contract & (years > 1) & (threshold > 0) & (size_of[position] >= threshold)
+                    & (rank > 0) & (rank <= threshold))
+        position_avg = average_of[position]
+        holding_out = eligible & (salary < position_avg * 0.5)
+
+        holdouts = []
+        counts: Dict[str, int] = {}
+        for i in np.flatnonzero(holding_out).tolist():
+            team, player = rostered[i]
+            player.holdout_demands = float(position_avg[i]) * 0.75
+            player.is_holdout = True
+            holdouts.append(player)
+            counts[team.name] = counts.get(team.name, 0) + 1
+
+        for team in league.teams:
+            if team.name in counts:
+                self._print(f"{team.name} has {counts[team.name]} potential holdouts")
+        return holdouts
+
+
+    def _rank_season(self) -> SeasonRankings:
+        """Rank every league player at their position with a single stable sort"""
+        league = self.league
+        players = list(league.players)
+        if not players:
+            league.season_rankings = SeasonRankings(league.season_year, [])
+            return league.season_rankings
+
+        ids, position = self._static_columns(players)
+        position = np.where([p.is_retired for p in players], _UNRANKED, position) # Retired players go unranked
+        points = np.array([p.fantasy_points for p in players], dtype=np.float64)
+
+        # By position, then points best first; lexsort is stable so ties keep registry order
+        ranked = np.lexsort((-points, position))
+        ranked_position = position[ranked]
+        group_starts = np.flatnonzero(np.r_[True, ranked_position[1:] != ranked_position[:-1]])
+        group_ends = np.r_[group_starts[1:], len(ranked)]
+
+        order: Dict[str, List[int]] = {}
+        ranks = np.zeros(len(players), dtype=np.int64)
+        for start, end in zip(group_starts.tolist(), group_ends.tolist()):
+            code = int(ranked_position[start])
+            if code != _UNRANKED:
+                order[VALID_POSITIONS[code]] = ids[ranked[start:end]].tolist()
+                ranks[ranked[start:end]] = np.arange(1, end - start + 1)
+
+        for player, player_rank in zip(players, ranks.tolist()):
+            player.position_rank_end_of_season = player_rank or None
+
+        league.season_rankings = SeasonRankings.from_order(league.season_year, order)
+        return league.season_rankings
+
+
+    def _static_columns(self, players: List[Player]):
+        """Player ids and position codes, cached across seasons
+
+        The registry only ever appends players, so each offseason only reads
+        the players registered since the last one.
+        """
+        known = len(self._players)
+        if players[:known] != self._players:
+            known = 0
+            self._ids = np.zeros(0, dtype=np.int64)
+            self._positions = np.zeros(0, dtype=np.int64)
+
+        new_players = players[known:]
+        if new_players:
+            self._ids = np.concatenate([self._ids, [p.player_id for p in new_players]]).astype(np.int64)
+            self._positions = np.concatenate([self._positions,
+                                              [_POSITION_CODES[p.position] for p in new_players]]).astype(np.int64)
+        self._players = players
+        return self._ids, self._positions
+
+
+    def _validate_salary_caps(self) -> List[Team]:
+        """Compare every team's cap total to the cap at once"""
+        teams = self.league.teams
+        used = np.array([team.get_total_salary_used() for team in teams])
+        caps = np.array([team.salary_cap for team in teams])
+        violations = [teams[i] for i in np.flatnonzero(used > caps).tolist()]
+
+        if violations:
+            self._print(f"Salary cap violations: {[t.name for t in violations]}")
+        return violations
+
+
+    def _print(self, message: str):
+        if self.verbose:
+            print(message)
@@ -0,0 +1,152 @@
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, SALARY_MULTIPLIERS
+from src.models.player import Player
+from src.models.team import Team
+
+# Dead money multipliers by years remaining, mirroring Contract.calculate_dead_money_penalty
+DEAD_MONEY_MULTIPLIERS = {2: 0.50, 3: 0.75, 4: 1.00}
+DEAD_MONEY_MAX_MULTIPLIER = 1.25
+
+
+class CapProjection:
+    """Array-backed salary schedules for every rostered contract over a multi-year horizon
+
+    Year 0 is the current season. Salaries grow by player_salary_increase_rate
+    each year a contract is still running, as Contract.advance_year does, and
+    tagged contracts stay at their tag salary. Caps grow by
+    salary_cap_increase_rate (as League.advance_season does). Existing dead
+    money never comes off a team's books, matching Team.
+    """
+
+    def __init__(self, teams: Sequence[Team], horizon: int = 5):
+        if horizon < 1:
+            raise ValueError("Projection horizon must be at least one year")
+
+        self.horizon = horizon
+        self.team_names = [team.name for team in teams]
+        self._team_pos = {name: i for i, name in enumerate(self.team_names)}
+
+        players, team_index = [], []
+        for i, team in enumerate(teams):
+            for roster_list in team.roster.values():
+                for player in roster_list:
+                    if player.contract:
+                        players.append(player)
+                        team_index.append(i)
+
+        self.players = players
+        self._row = {id(player): row for row, player in enumerate(players)}
+        self.team_index = np.array(team_index, dtype=np.intp)
+        self.salary = np.array([p.contract.current_salary for p in players], dtype=np.float64)
+        self.years_remaining = np.array([p.contract.years_remaining for p in players], dtype=np.int64)
+        self.multiplier = np.array([SALARY_MULTIPLIERS.get(p.roster_status, 1.00) for p in players])
+        self.extendable = np.array([p.contract.is_eligible_for_extension() for p in players], dtype=bool)
+        self.tagged = np.array([p.contract.is_tagged() for p in players], dtype=bool)
+
+        self.dead_money = np.array([team.dead_money for team in teams], dtype=np.float64)
+        self.salary_cap = np.array([team.salary_cap for team in teams], dtype=np.float64)
+
+        years = np.arange(horizon)
+        self._years = years[:, None]
+        self._salary_growth = LEAGUE_SETTINGS['player_salary_increase_rate'] ** years
+        self._cap_growth = LEAGUE_SETTINGS['salary_cap_increase_rate'] ** years
+
+
+    def salary_schedule(self, extensions: Optional[Mapping[Player, int]] = None) -> np.ndarray:
+        """Base salary owed each year, shaped (years, players)"""
+        salary, years_remaining = self._apply_extensions(extensions)
+        active = self._years < years_remaining[None, :]
+        growth = np.where(self.tagged[None, :], 1.0, self._salary_growth[:, None])
+        return np.where(active, salary[None, :] * growth, 0.0)
+
+
+    def dead_money_schedule(self, extensions: Optional[Mapping[Player, int]] = None) -> np.ndarray:
+        """Dead money charged for cutting each player at the start of each year, shaped (years, players)
+
+        Shows the cliffs as contracts wind down, e.g. nothing once a single
+        year is left.
+        """
+        _, years_remaining = self._apply_extensions(extensions)
+        years_left = years_remaining[None, :] - self._years
+        multiplier = np.where(years_left >= 5, DEAD_MONEY_MAX_MULTIPLIER, 0.0)
+        for years, value in DEAD_MONEY_MULTIPLIERS.items():
+            multiplier = np.where(years_left == years, value, multiplier)
+        return self.salary_schedule(extensions) * multiplier
+
+
+    def cap_space(self, moves: Optional[Mapping[Player, Optional[str]]] = None,
+                  extensions: Optional[Mapping[Player, int]] = None) -> np.ndarray:
+        """Projected cap space per team per year, shaped (years, teams)
+
+        Args:
+            moves: What-if roster moves, player -> destination team name, or
+                None to cut the player (dead money charged in year 0 stays on
+                the books like Team.dead_money)
+            extensions: What-if extensions, player -> additional years
+        """
+        schedule = self.salary_schedule(extensions) * self.multiplier[None, :]
+        team_index, cut_dead_money = self._apply_moves(moves, schedule, extensions)
+
+        committed = schedule @ np.eye(len(self.team_names))[team_index] if len(team_index) else \
+                np.zeros((self.horizon, len(self.team_names)))
+        caps = self.salary_cap[None, :] * self._cap_growth[:, None]
+        return caps - committed - (self.dead_money + cut_dead_money)[None, :]
+
+
+    def cap_space_by_team(self, moves: Optional[Mapping[Player, Optional[str]]] = None,
+                          extensions: Optional[Mapping[Player, int]] = None) -> Dict[str, np.ndarray]:
+        """Projected cap space per year keyed by team name"""
+        space = self.cap_space(moves, extensions)
+        return {name: space[:, i] for i, name in enumerate(self.team_names)}
+
+
+    def _apply_extensions(self, extensions: Optional[Mapping[Player, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply what-if extensions: immediate 20% raise, $10 minimum and added years"""
+        if not extensions:
+            return self.salary, self.years_remaining
+
+        rows = np.array([self._row_of(player) for player in extensions], dtype=np.intp)
+        added = np.array(list(extensions.values()), dtype=np.int64)
+        if not self.extendable[rows].all():
+            raise ValueError("Extensions include players who are not eligible")
+        if ((added < 1) | (added > 5)).any():
+            raise ValueError("Extension must be between 1-5 years")
+
+        salary = self.salary.copy()
+        years_remaining = self.years_remaining.copy()
+        salary[rows] = np.maximum(salary[rows] * 1.20, 10)
+        years_remaining[rows] += added
+        return salary, years_remaining
+
+
+    def _apply_moves(self, moves: Optional[Mapping[Player, Optional[str]]], schedule: np.ndarray,
+                     extensions: Optional[Mapping[Player, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Reassign traded players and zero out cut players, returning team index and new dead money"""
+        cut_dead_money = np.zeros(len(self.team_names))
+        if not moves:
+            return self.team_index, cut_dead_money
+
+        team_index = self.team_index.copy()
+        dead_money = None
+        for player, destination in moves.items():
+            row = self._row_of(player)
+            if destination is None:
+                if dead_money is None:
+                    dead_money = self.dead_money_schedule(extensions)
+                cut_dead_money[team_index[row]] += dead_money[0, row]
+                schedule[:, row] = 0.0
+            else:
+                if destination not in self._team_pos:
+                    raise ValueError(f"Unknown team: {destination}")
+                team_index[row] = self._team_pos[destination]
+        return team_index, cut_dead_money
+
+
+    def _row_of(self, player: Player) -> int:
+        row = self._row.get(id(player))
+        if row is None:
+            raise ValueError(f"{player.name} is not a rostered, contracted player in this projection")
+        return row
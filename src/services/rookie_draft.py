@@ -0,0 +1,207 @@
+import random
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS, SALARY_MULTIPLIERS
+from src.models.contract import Contract
+from src.models.player import Player
+from src.models.team import Team
+
+
+def draw_lottery(teams: Sequence[Team], balls: Sequence[int], rng=random) -> List[Team]:
+    """Draw every lottery pick, each team's chance proportional to its balls among teams left"""
+    remaining = list(zip(teams, balls))
+    order = []
+    while remaining:
+        winning_number = rng.randint(1, sum(b for _, b in remaining))
+
+        cumulative = 0
+        for i, (team, team_balls) in enumerate(remaining):
+            cumulative += team_balls
+            if winning_number <= cumulative:
+                order.append(team)
+                del remaining[i]
+                break
+    return order
+
+
+def determine_draft_order(teams: Sequence[Team], rng=random) -> List[Team]:
+    """Lottery among the worst records for the top picks, then inverse standings
+
+    Lottery teams are the worst len(rookie_lottery_balls) records (fewer in a
+    small league). Everyone else picks worst to best, so the runner-up picks
+    second to last and the reigning champ picks last.
+    """
+    standings = sorted(teams, key=lambda t: getattr(t, 'wins', 0))
+    balls = LEAGUE_SETTINGS['rookie_lottery_balls'][:len(standings)]
+    return draw_lottery(standings[:len(balls)], balls, rng) + standings[len(balls):]
+
+
+def lottery_odds(balls: Optional[Sequence[int]] = None) -> np.ndarray:
+    """Exact lottery pick probabilities, shaped (lottery seeds, picks)
+
+    Walks every set of teams already drawn (2^n states), so the table is exact
+    rather than sampled.
+    """
+    weights = np.asarray(balls if balls is not None else LEAGUE_SETTINGS['rookie_lottery_balls'],
+                         dtype=np.float64)
+    n = len(weights)
+    odds = np.zeros((n, n))
+
+    # Probability that exactly the teams in each bitmask were drawn first
+    reach = np.zeros(1 << n)
+    reach[0] = 1.0
+    drawn_balls = np.zeros(1 << n)
+    for mask in range(1 << n):
+        if reach[mask] == 0.0:
+            continue
+        pick = bin(mask).count('1')
+        left = weights.sum() - drawn_balls[mask]
+        for team in range(n):
+            bit = 1 << team
+            if mask & bit:
+                continue
+            p = reach[mask] * weights[team] / left
+            odds[team, pick] += p
+            reach[mask | bit] += p
+            drawn_balls[mask | bit] = drawn_balls[mask] + weights[team]
+    return odds
+
+
+def simulate_lottery_odds(balls: Optional[Sequence[int]] = None, draws: int = 1_000_000,
+                          seed=None, batch_size: int = 250_000) -> np.ndarray:
+    """Monte Carlo lottery pick probabilities, shaped (lottery seeds, picks)
+
+    Each draw sorts the teams by Exp(1) / balls, which orders them exactly as
+    drawing one ball per pick without replacement would, so a whole batch of
+    lotteries is a single argsort.
+    """
+    weights = np.asarray(balls if balls is not None else LEAGUE_SETTINGS['rookie_lottery_balls'],
+                         dtype=np.float64)
+    n = len(weights)
+    rng = np.random.default_rng(seed)
+
+    counts = np.zeros((n, n), dtype=np.int64)
+    for start in range(0, draws, batch_size):
+        size = min(batch_size, draws - start)
+        order = np.argsort(rng.exponential(size=(size, n)) / weights, axis=1)
+        for pick in range(n):
+            counts[:, pick] += np.bincount(order[:, pick], minlength=n)
+    return counts / draws
+
+
+def rank_rookies(rookies: Iterable[Player]) -> List[Player]:
+    """Order a rookie pool best first: by rank, then fantasy points for unranked players"""
+    return sorted(rookies, key=lambda p: (p.rank is None, p.rank or 0, -p.fantasy_points))
+
+
+class RookieDraft:
+    """Runs the rookie draft in the league's draft order, signing picks to rookie contracts
+
+    Every round follows league.rookie_draft_order. Teams with a picker
+    callback choose their own player, everyone else takes the best ranked
+    rookie left. Picks go to the active roster, or the practice squad when
+    the active roster is full or can't afford them; a team with no room
+    forfeits the pick.
+    """
+
+    def __init__(self, league, rookies: Iterable[Player],
+                 pickers: Optional[Dict[str, Callable[['RookieDraft', Team], Player]]] = None):
+        if not league.rookie_draft_order:
+            raise ValueError("Draft order not set")
+
+        self.league = league
+        self.order = list(league.rookie_draft_order)
+        self.pickers = pickers or {}
+        self.pool = rank_rookies(p for p in rookies if p.is_available())
+        self.rounds = LEAGUE_SETTINGS['rookie_draft_rounds']
+
+        self._taken = set()
+        self._next = 0
+
+        # Roster spots and cap taken by mock picks, which never touch the teams
+        self._added = {id(team): {'active': 0, 'practice_squad': 0, 'salary': 0.0} for team in self.order}
+
+
+    def available(self) -> List[Player]:
+        """Rookies not yet drafted, best first"""
+        return [p for p in self.pool if id(p) not in self._taken]
+
+
+    def best_available(self) -> Optional[Player]:
+        while self._next < len(self.pool) and id(self.pool[self._next]) in self._taken:
+            self._next += 1
+        return self.pool[self._next] if self._next < len(self.pool) else None
+
+
+    def run(self, apply: bool = True) -> List[Dict[str, object]]:
+        """Draft every round
+
+        Args:
+            apply: Sign and roster each pick; False runs a mock draft that
+                leaves the league untouched
+
+        Returns:
+            One dict per pick with 'round', 'pick', 'team', 'player',
+            'salary' and 'roster_type' (player and roster_type are None for
+            forfeited picks)
+        """
+        picks = []
+        pool_ids = {id(p) for p in self.pool}
+        years = LEAGUE_SETTINGS['rookie_contract_years']
+        round_salaries = LEAGUE_SETTINGS['rookie_round_salaries']
+
+        for round_num in range(1, self.rounds + 1):
+            salary = round_salaries[min(round_num, len(round_salaries)) - 1]
+            for team in self.order:
+                if self.best_available() is None:
+                    break
+
+                pick = {'round': round_num, 'pick': len(picks) + 1, 'team': team,
+                        'player': None, 'salary': salary, 'roster_type': None}
+                picks.append(pick)
+
+                roster_type = self._roster_spot(team, salary)
+                if roster_type is None:
+                    continue
+
+                picker = self.pickers.get(team.name)
+                player = picker(self, team) if picker else self.best_available()
+                if id(player) not in pool_ids or id(player) in self._taken:
+                    raise ValueError(f"{player.name} is not available in this draft")
+
+                self._taken.add(id(player))
+                pick['player'] = player
+                pick['roster_type'] = roster_type
+
+                if apply:
+                    player.set_contract(Contract(player.name, salary, years, is_rookie=True,
+                                                 start_year=self.league.season_year))
+                    team.add_player(player, roster_type)
+                else:
+                    added = self._added[id(team)]
+                    added[roster_type] += 1
+                    added['salary'] += salary * SALARY_MULTIPLIERS[roster_type]
+
+        if apply:
+            self._apply_pool()
+        return picks
+
+
+    def _roster_spot(self, team: Team, salary: float) -> Optional[str]:
+        """Where a pick would go after the picks already made, or None if it fits nowhere"""
+        added = self._added[id(team)]
+        cap_left = team.get_remaining_cap() - added['salary']
+        for roster_type in ('active', 'practice_squad'):
+            size = team._get_roster_size(roster_type) + added[roster_type]
+            if size < team._get_roster_max(roster_type) and cap_left >= salary * SALARY_MULTIPLIERS[roster_type]:
+                return roster_type
+        return None
+
+
+    def _apply_pool(self):
+        """Drafted rookies leave free agency, undrafted ones join it"""
+        self.league.free_agents = [p for p in self.league.free_agents if id(p) not in self._taken]
+        undrafted = [p for p in self.pool if id(p) not in self._taken and p not in self.league.players]
+        self.league.add_free_agents(undrafted)
@@ -0,0 +1,87 @@
+from typing import Dict, List, Mapping, Optional, Union
+
+import numpy as np
+
+from config.settings import SCORING_SETTINGS
+from src.models.player import Player
+
+# Columnar box scores: stat name -> array shaped (..., players, weeks)
+StatColumns = Mapping[str, np.ndarray]
+
+
+class ScoringEngine:
+    """Scores columnar weekly box scores against the league scoring weights"""
+
+    def __init__(self, scoring_settings: Optional[Dict[str, float]] = None):
+        settings = scoring_settings if scoring_settings is not None else SCORING_SETTINGS
+
+        # Stat order used when stacking columns for the dot product
+        self.stat_columns = tuple(settings.keys())
+        self.weights = np.array([settings[stat] for stat in self.stat_columns], dtype=np.float64)
+
+
+    def with_rules(self, **overrides: float) -> 'ScoringEngine':
+        """Build an engine with some scoring weights changed, for testing rule changes"""
+        settings = dict(zip(self.stat_columns, self.weights.tolist()))
+        settings.update(overrides)
+        return ScoringEngine(settings)
+
+
+    def stack(self, stats: StatColumns) -> np.ndarray:
+        """Stack stat columns into one (..., players, weeks, stats) array
+
+        Stats missing from the box scores count as zero. Unknown stats raise,
+        since they usually mean a typo in a rule change.
+        """
+        unknown = set(stats) - set(self.stat_columns)
+        if unknown:
+            raise ValueError(f"Unknown stat columns: {sorted(unknown)}")
+        if not stats:
+            raise ValueError("No stat columns provided")
+
+        shape = np.broadcast_shapes(*(np.shape(col) for col in stats.values()))
+        stacked = np.zeros(shape + (len(self.stat_columns),), dtype=np.float64)
+        for i, stat in enumerate(self.stat_columns):
+            if stat in stats:
+                stacked[..., i] = stats[stat]
+
+        return stacked
+
+
+    def score_weeks(self, stats: Union[StatColumns, np.ndarray]) -> np.ndarray:
+        """Calculate fantasy points for every stat line
+
+        Args:
+            stats: stat name -> (..., players, weeks) columns, or an already
+                stacked (..., players, weeks, stats) array in stat_columns order
+
+        Returns:
+            Weekly fantasy points shaped (..., players, weeks)
+        """
+        if isinstance(stats, np.ndarray):
+            if stats.shape[-1] != len(self.stat_columns):
+                raise ValueError(f"Expected {len(self.stat_columns)} stats in last axis, got {stats.shape[-1]}")
+            stacked = stats
+        else:
+            stacked = self.stack(stats)
+
+        # One batched dot product against the scoring weights
+        return stacked @ self.weights
+
+
+    def score_seasons(self, stats: Union[StatColumns, np.ndarray]) -> np.ndarray:
+        """Calculate season fantasy points shaped (..., players)"""
+        return self.score_weeks(stats).sum(axis=-1)
+
+
+    def apply_season_points(self, players: List[Player],
+                            stats: Union[StatColumns, np.ndarray]) -> np.ndarray:
+        """Score one season of box scores and store the totals on each player"""
+        season_points = self.score_seasons(stats)
+        if season_points.shape != (len(players),):
+            raise ValueError(f"Expected box scores for {len(players)} players, got shape {season_points.shape}")
+
+        for player, points in zip(players, season_points.tolist()):
+            player.fantasy_points = points
+
+        return season_points
@@ -0,0 +1,142 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config.settings import LEAGUE_SETTINGS
+from src.models.league import League
+from src.models.team import Team
+from src.services.lineup import LineupOptimizer, lineup_points
+
+
+def round_robin_schedule(num_teams: int, weeks: int) -> np.ndarray:
+    """Build a head-to-head schedule with the circle method
+
+    Returns:
+        Array shaped (weeks, num_teams // 2, 2) of team indices; the round
+        robin repeats from the top once every pairing has been played
+    """
+    if num_teams < 2 or num_teams % 2:
+        raise ValueError(f"Schedule needs an even number of teams, got {num_teams}")
+
+    rotation = list(range(num_teams))
+    rounds = []
+    for _ in range(num_teams - 1):
+        half = num_teams // 2
+        rounds.append([(rotation[i], rotation[-1 - i]) for i in range(half)])
+        # Keep the first team fixed and rotate everyone else
+        rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+
+    return np.array([rounds[week % len(rounds)] for week in range(weeks)], dtype=np.intp)
+
+
+def _simulate_chunk(means: np.ndarray, sds: np.ndarray, schedule: np.ndarray,
+                    num_playoff: int, lottery_balls: np.ndarray,
+                    num_seasons: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """Simulate a batch of regular seasons at once and tally per-team outcomes"""
+    rng = np.random.default_rng(seed)
+    weeks, _, _ = schedule.shape
+    num_teams = len(means)
+
+    # Weekly scores for every season, shaped (seasons, weeks, teams)
+    scores = rng.normal(means, sds, size=(num_seasons, weeks, num_teams))
+
+    week_idx = np.arange(weeks)[:, None]
+    home = schedule[:, :, 0]
+    away = schedule[:, :, 1]
+    home_won = scores[:, week_idx, home] > scores[:, week_idx, away]
+
+    # Scatter game results into per-team win totals with one-hot matrices
+    home_onehot = np.eye(num_teams)[home.ravel()]
+    away_onehot = np.eye(num_teams)[away.ravel()]
+    home_won = home_won.reshape(num_seasons, -1).astype(np.float64)
+    wins = home_won @ home_onehot + (1.0 - home_won) @ away_onehot
+    points_for = scores.sum(axis=1)
+
+    # Standings worst to best: fewest wins first, points for breaks ties
+    order = np.lexsort((points_for, wins))
+    standings = np.empty_like(order)
+    np.put_along_axis(standings, order, np.arange(num_teams)[None, :], axis=1)
+
+    num_lottery = len(lottery_balls)
+    in_lottery = standings < num_lottery
+    first_pick_share = np.where(in_lottery,
+                                lottery_balls[np.minimum(standings, num_lottery - 1)] / lottery_balls.sum(),
+                                0.0)
+
+    return {
+            'wins': wins.sum(axis=0),
+            'playoffs': (standings >= num_teams - num_playoff).sum(axis=0),
+            'lottery': in_lottery.sum(axis=0),
+            'first_pick': first_pick_share.sum(axis=0),
+    }
+
+
+class SeasonSimulator:
+    """Monte Carlo simulation of head-to-head regular seasons for a league"""
+
+    def __init__(self, league: League, volatility: float = 0.25,
+                 seed: Optional[int] = None, chunk_size: int = 10_000):
+        if len(league.teams) < 2:
+            raise ValueError("Need at least two teams to simulate a season")
+
+        self.teams: List[Team] = list(league.teams)
+        self.volatility = volatility
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+        self.schedule = round_robin_schedule(len(self.teams), LEAGUE_SETTINGS['regular_season_weeks'])
+        self.num_playoff = min(LEAGUE_SETTINGS['playoff_teams'], len(self.teams))
+        self.lottery_balls = np.array(LEAGUE_SETTINGS['rookie_lottery_balls'][:len(self.teams)],
+                                      dtype=np.float64)
+
+        self.weekly_means = np.array([self.projected_weekly_points(t) for t in self.teams])
+        self.weekly_sds = np.maximum(self.weekly_means * volatility, 1.0)
+
+
+    @staticmethod
+    def projected_weekly_points(team: Team) -> float:
+        """Project a team's weekly score from its optimal starting lineup"""
+        season_weeks = LEAGUE_SETTINGS['regular_season_weeks'] + LEAGUE_SETTINGS['playoff_weeks']
+        lineup = LineupOptimizer().optimize(team.roster['active'])
+        return lineup_points(lineup) / season_weeks
+
+
+    def run(self, num_seasons: int = 10_000, workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """Simulate seasons and report playoff odds, expected wins and lottery odds per team
+
+        Work is split into fixed-size chunks, each seeded from one SeedSequence,
+        so results are the same for any number of workers.
+
+        Args:
+            num_seasons: Number of seasons to simulate
+            workers: Worker processes; 1 runs in this process, None uses all cores
+        """
+        if num_seasons <= 0:
+            raise ValueError("Number of seasons must be positive")
+
+        chunk_sizes = [self.chunk_size] * (num_seasons // self.chunk_size)
+        if num_seasons % self.chunk_size:
+            chunk_sizes.append(num_seasons % self.chunk_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunk_sizes))
+
+        args = [(self.weekly_means, self.weekly_sds, self.schedule, self.num_playoff,
+                 self.lottery_balls, size, seed) for size, seed in zip(chunk_sizes, seeds)]
+
+        if workers == 1 or len(args) == 1:
+            results = [_simulate_chunk(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_simulate_chunk, *zip(*args)))
+
+        totals = {key: sum(r[key] for r in results) for key in results[0]}
+
+        return {
+                team.name: {
+                    'expected_wins': float(totals['wins'][i] / num_seasons),
+                    'playoff_odds': float(totals['playoffs'][i] / num_seasons),
+                    'lottery_odds': float(totals['lottery'][i] / num_seasons),
+                    'first_pick_odds': float(totals['first_pick'][i] / num_seasons),
+                }
+                for i, team in enumerate(self.teams)
+        }
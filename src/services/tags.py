@@ -0,0 +1,189 @@
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import FREE_AGENCY_SETTINGS, SALARY_MULTIPLIERS, TAG_SETTINGS
+from src.models.contract import Contract
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+from src.services.free_agency import Bid
+
+TAG_KINDS = ('franchise', 'transition')
+
+
+class Tag:
+    """A team's franchise or transition tag on one of its expiring players"""
+
+    def __init__(self, team: Team, player: Player, kind: str, salary: float):
+        self.team = team
+        self.player = player
+        self.kind = kind
+        self.salary = salary # What the team pays if nobody bids
+
+
+    def __repr__(self):
+        return f"Tag({self.team.name} {self.kind} {self.player.name}: ${self.salary:.2f})"
+
+
+class TagRound:
+    """Franchise and transition tags, with open bidding on tagged players
+
+    Opened at the end of a season: teams tag expiring players, which keeps
+    them under contract for one more season at the tag salary. Position
+    averages are computed once when the round opens and priced into every
+    tag. Once the season rolls over (League.advance_season), other teams make
+    offers and resolve() settles every tagged player in one batch:
+
+    - Franchise tag: offers must be at least the tag salary.
+    - Transition tag: any offer from the minimum bid up is allowed.
+
+    The original team can match the best offer it can afford and keep the
+    player on those terms, or let the player sign with the bidding team.
+    Players without offers play out the tag season.
+    """
+
+    def __init__(self, league: League, min_bid: Optional[float] = None, max_years: Optional[int] = None):
+        self.league = league
+        self.min_bid = min_bid if min_bid is not None else FREE_AGENCY_SETTINGS['min_bid']
+        self.max_years = max_years or FREE_AGENCY_SETTINGS['max_contract_years']
+        self.season_year = league.season_year # The season ending when tags are applied
+        self.position_averages: Dict[str, float] = league._calculate_position_averages()
+        self._tags: Dict[int, Tag] = {}
+        self._offers: Dict[Tuple[str, int], Bid] = {}
+        self._seq = 0
+
+
+    def tag(self, team: Team, player: Player, kind: str = 'franchise') -> Tag:
+        """Tag one of the team's expiring players at the cached position average"""
+        if self.league.season_year != self.season_year:
+            raise ValueError("Tags must be applied before the season rolls over")
+        if kind not in TAG_KINDS:
+            raise ValueError(f"Tag must be one of {list(TAG_KINDS)}")
+        if player.fantasy_team != team.name or self.league.get_team_by_name(team.name) is not team:
+            raise ValueError(f"Cannot tag player: {player.name} not on your team!")
+        if id(player) in self._tags:
+            raise ValueError(f"{player.name} is already tagged")
+        if not player.contract or not player.contract.is_expiring():
+            raise ValueError("Only expiring contracts can be tagged")
+
+        limit = TAG_SETTINGS[f'{kind}_tags_per_team']
+        if sum(1 for t in self._tags.values() if t.team is team and t.kind == kind) >= limit:
+            raise ValueError(f"{team.name} has no {kind} tags left")
+
+        position_avg = self.position_averages.get(player.position, 0.0)
+        if kind == 'franchise':
+            salary = player.contract.get_franchise_tag_minimum(position_avg)
+        else:
+            salary = player.contract.get_transition_tag_salary(position_avg)
+
+        if team.get_remaining_cap() < self._raise(player, salary):
+            raise ValueError(f"Cannot afford to tag {player.name}")
+
+        team.tag_player(player, salary, transition=kind == 'transition')
+
+        tag = Tag(team, player, kind, salary)
+        self._tags[id(player)] = tag
+        return tag
+
+
+    def tags(self) -> List[Tag]:
+        """Every tag, in the order applied"""
+        return list(self._tags.values())
+
+
+    def offer(self, team: Team, player: Player, salary: float, years: int = 1) -> Bid:
+        """Make an offer on another team's tagged player, replacing the team's earlier offer"""
+        tag = self._tags.get(id(player))
+        if tag is None:
+            raise ValueError(f"{player.name} is not tagged")
+        if self.league.get_team_by_name(team.name) is not team:
+            raise ValueError(f"{team.name} is not in this league")
+        if team is tag.team:
+            raise ValueError("Cannot bid on your own tagged player")
+
+        minimum = tag.salary if tag.kind == 'franchise' else self.min_bid
+        if salary < minimum:
+            raise ValueError(f"Offer must be at least ${minimum:.2f}")
+        if not (1 <= years <= self.max_years):
+            raise ValueError(f"Contract must be between 1-{self.max_years} years")
+
+        self._seq += 1
+        offer = Bid(team, player, salary, years, self._seq)
+        self._offers[(team.name, id(player))] = offer
+        return offer
+
+
+    def offers(self, player: Player) -> List[Bid]:
+        """Offers on a tagged player, best first"""
+        return sorted((o for o in self._offers.values() if o.player is player),
+                      key=lambda o: (-o.salary, o.seq))
+
+
+    def resolve(self, match: Optional[Callable[[Tag, Bid], bool]] = None) -> List[Dict[str, object]]:
+        """Settle every tagged player
+
+        Args:
+            match: Called with the tag and the best offer the bidder can
+                afford, returns whether the original team matches; by default
+                teams match every offer they can afford
+
+        Returns:
+            One dict per tag still with its team, in the order applied, with 'player', 'tag', the
+            'team' the player ends up on, their 'salary' and 'years', the
+            winning 'offer' (None without one) and whether it was 'matched'
+        """
+        if self.league.season_year == self.season_year:
+            raise ValueError("Bidding on tagged players opens after the season rolls over")
+
+        match = match or (lambda tag, offer: True)
+        by_player: Dict[int, List[Bid]] = {}
+        for offer in sorted(self._offers.values(), key=lambda o: (-o.salary, o.seq)):
+            by_player.setdefault(id(offer.player), []).append(offer)
+
+        # Logged as one event followed by a snapshot, like advance_season
+        log = self.league.transaction_log
+        results = []
+        with log.transaction('tag_round') if log is not None else nullcontext():
+            for tag in self._tags.values():
+                if tag.player.fantasy_team != tag.team.name:
+                    continue # Released or traded since being tagged
+                offer = next((o for o in by_player.get(id(tag.player), []) if self._can_sign(o)), None)
+                results.append(self._settle(tag, offer, match))
+
+        self._tags = {}
+        self._offers = {}
+        return results
+
+
+    def _settle(self, tag: Tag, offer: Optional[Bid], match: Callable[[Tag, Bid], bool]) -> Dict[str, object]:
+        """Keep a tagged player on the tag, on matched terms, or send them to the bidder"""
+        team, player = tag.team, tag.player
+        result = {'player': player, 'tag': tag, 'offer': offer, 'matched': False}
+
+        if offer is None:
+            return {**result, 'team': team, 'salary': tag.salary, 'years': 1}
+
+        contract = Contract(player.name, offer.salary, offer.years, start_year=self.league.season_year)
+        if team.get_remaining_cap() >= self._raise(player, offer.salary) and match(tag, offer):
+            player.set_contract(contract)
+            team.refresh_player_salary(player)
+            result['matched'] = True
+        else:
+            team.remove_player(player) # Expiring contracts carry no dead money
+            player.set_contract(contract)
+            offer.team.add_player(player)
+        return {**result, 'team': self.league.get_team_by_name(player.fantasy_team),
+                'salary': offer.salary, 'years': offer.years}
+
+
+    def _can_sign(self, offer: Bid) -> bool:
+        """Check the bidder still has active roster and cap space for an offer"""
+        team = offer.team
+        return (team._get_roster_size('active') < team._get_roster_max('active')
+                and team.get_remaining_cap() >= offer.salary)
+
+
+    @staticmethod
+    def _raise(player: Player, salary: float) -> float:
+        """Extra cap space a rostered player takes up at a new salary"""
+        return (salary - player.contract.current_salary) * SALARY_MULTIPLIERS.get(player.roster_status, 1.00)
@@ -0,0 +1,289 @@
+from contextlib import nullcontext
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.models.league import League
+from src.models.player import Player
+from src.models.team import Team
+from src.services.lineup import LineupOptimizer, lineup_points
+
+
+class Trade:
+    """Players swapped between two teams, each side keeps its roster status"""
+
+    def __init__(self, team_a: Team, team_b: Team,
+                 players_a: Sequence[Player] = (), players_b: Sequence[Player] = ()):
+        self.team_a = team_a
+        self.team_b = team_b
+        self.players_a = list(players_a) # Sent from team_a to team_b
+        self.players_b = list(players_b) # Sent from team_b to team_a
+
+
+    def sides(self) -> List[Tuple[Team, List[Player], List[Player]]]:
+        """Each team with the players it receives and the players it sends"""
+        return [(self.team_a, self.players_b, self.players_a),
+                (self.team_b, self.players_a, self.players_b)]
+
+
+    def __repr__(self):
+        sent_a = ", ".join(p.name for p in self.players_a) or "nothing"
+        sent_b = ", ".join(p.name for p in self.players_b) or "nothing"
+        return f"Trade({self.team_a.name} sends {sent_a}; {self.team_b.name} sends {sent_b})"
+
+
+class TeamDelta:
+    """Read-only view of a team after a trade, built from the team's ledger without copying it"""
+
+    def __init__(self, team: Team, incoming: Sequence[Player], outgoing: Sequence[Player]):
+        self.team = team
+        self.incoming = incoming
+        self.outgoing = outgoing
+
+
+    def roster_size(self, roster_type: str) -> int:
+        size = self.team._get_roster_size(roster_type)
+        size += sum(p.roster_status == roster_type for p in self.incoming)
+        size -= sum(p.roster_status == roster_type for p in self.outgoing)
+        return size
+
+
+    def salary_used(self) -> float:
+        # Traded players keep their roster status, so effective salaries move unchanged
+        return (self.team.get_total_salary_used()
+                + sum(p.get_effective_salary() for p in self.incoming)
+                - sum(p.get_effective_salary() for p in self.outgoing))
+
+
+    def remaining_cap(self) -> float:
+        return self.team.salary_cap - self.salary_used()
+
+
+    def active_players(self) -> List[Player]:
+        outgoing = {id(p) for p in self.outgoing}
+        players = [p for p in self.team.roster['active'] if id(p) not in outgoing]
+        players.extend(p for p in self.incoming if p.roster_status == 'active')
+        return players
+
+
+class TradeService:
+    """Validates, scores and executes trades, and searches the league for good ones"""
+
+    def __init__(self, league: League, optimizer: Optional[LineupOptimizer] = None):
+        self.league = league
+        self.optimizer = optimizer or LineupOptimizer()
+        self._lineup_cache: Dict[Tuple[int, ...], float] = {}
+
+
+    def validate(self, trade: Trade) -> List[str]:
+        """Check ownership, roster limits and cap space for both teams
+
+        Returns:
+            Reasons the trade is invalid, empty when it can go through
+        """
+        errors = []
+        if trade.team_a is trade.team_b:
+            return ["A team cannot trade with itself"]
+        if not trade.players_a and not trade.players_b:
+            return ["Trade has no players"]
+
+        seen = set()
+        for team, _, outgoing in trade.sides():
+            for player in outgoing:
+                if player.fantasy_team != team.name:
+                    errors.append(f"{player.name} is not on {team.name}")
+                if id(player) in seen:
+                    errors.append(f"{player.name} is in the trade more than once")
+                seen.add(id(player))
+        if errors:
+            return errors
+
+        for team, incoming, outgoing in trade.sides():
+            after = TeamDelta(team, incoming, outgoing)
+            for roster_type in team.roster:
+                size = after.roster_size(roster_type)
+                if size > team._get_roster_max(roster_type) and size > team._get_roster_size(roster_type):
+                    errors.append(f"{team.name} {roster_type} roster would be over the limit")
+
+            # Teams already over the cap may still trade if they shed salary
+            salary_used = after.salary_used()
+            if salary_used > team.salary_cap and salary_used > team.get_total_salary_used():
+                errors.append(f"{team.name} would be ${salary_used - team.salary_cap:,.2f} over the cap")
+
+        return errors
+
+
+    def score(self, trade: Trade) -> Dict[str, object]:
+        """Score a trade by starting lineup points and cap space gained by each team
+
+        Returns:
+            Dict with per-team 'lineup_delta' and 'cap_delta' keyed by team name,
+            and 'value', the smaller lineup gain, so trades that help both
+            teams score highest
+        """
+        return self._score(trade, {})
+
+
+    def _score(self, trade: Trade, charts: Dict[int, Dict[str, List[Player]]]) -> Dict[str, object]:
+        result: Dict[str, object] = {}
+        gains = []
+        for team, incoming, outgoing in trade.sides():
+            after = TeamDelta(team, incoming, outgoing)
+            lineup_delta = self._lineup_gain(team, incoming, outgoing, charts)
+            result[team.name] = {
+                'lineup_delta': lineup_delta,
+                'cap_delta': after.remaining_cap() - team.get_remaining_cap(),
+            }
+            gains.append(lineup_delta)
+
+        result['value'] = min(gains)
+        return result
+
+
+    def evaluate(self, trades: Iterable[Trade]) -> List[Dict[str, object]]:
+        """Validate and score many candidate trades without touching any team
+
+        Returns:
+            One dict per trade with 'trade', 'errors' and 'score' (None when invalid)
+        """
+        results = []
+        for trade in trades:
+            errors = self.validate(trade)
+            results.append({
+                'trade': trade,
+                'errors': errors,
+                'score': None if errors else self.score(trade),
+            })
+        return results
+
+
+    def execute(self, trade: Trade) -> Dict[str, object]:
+        """Validate, score and apply a trade, rolling back every move if any step fails"""
+        errors = self.validate(trade)
+        if errors:
+            raise ValueError(f"Invalid trade: {'; '.join(errors)}")
+
+        result = self.score(trade)
+        undo = []
+
+        # Keep log snapshots from landing between the two halves of the trade
+        log = self.league.transaction_log
+        with log.batch() if log is not None else nullcontext():
+            try:
+                for team, incoming, outgoing in trade.sides():
+                    for player in outgoing:
+                        roster_type = player.roster_status
+                        team.trade_away(player)
+                        undo.append(lambda t=team, p=player, r=roster_type: t.receive_traded_player(p, r))
+
+                for team, incoming, _ in trade.sides():
+                    for player in incoming:
+                        team.receive_traded_player(player, player.roster_status)
+                        undo.append(lambda t=team, p=player: t.trade_away(p))
+            except Exception:
+                for step in reversed(undo):
+                    step()
+                raise
+
+        return result
+
+
+    def find_trades(self, max_players: int = 1, min_gain: float = 0.0,
+                    limit: Optional[int] = None) -> List[Dict[str, object]]:
+        """Sweep every pair of teams for valid trades of active players that help both sides
+
+        Args:
+            max_players: Most players each team sends
+            min_gain: Lineup points each team must gain
+            limit: Return only the best trades
+
+        Returns:
+            Evaluations from evaluate() ordered by value, best first
+        """
+        found = []
+        charts: Dict[int, Dict[str, List[Player]]] = {}
+        bounds: Dict[Tuple[int, ...], float] = {}
+        for team_a, team_b in combinations(self.league.teams, 2):
+            for trade in self._candidate_trades(team_a, team_b, max_players):
+                # Losing players never helps a lineup, so a team gains at most what it
+                # would by just adding the incoming players; skip the solve if that's too little
+                if any(self._gain_bound(team, incoming, charts, bounds) <= min_gain
+                       for team, incoming, _ in trade.sides()):
+                    continue
+
+                errors = self.validate(trade)
+                if errors:
+                    continue
+                score = self._score(trade, charts)
+                if score['value'] > min_gain:
+                    found.append({'trade': trade, 'errors': errors, 'score': score})
+
+        found.sort(key=lambda result: result['score']['value'], reverse=True)
+        return found[:limit] if limit is not None else found
+
+
+    def _candidate_trades(self, team_a: Team, team_b: Team, max_players: int) -> Iterable[Trade]:
+        packages_a = [group for size in range(1, max_players + 1)
+                      for group in combinations(team_a.roster['active'], size)]
+        packages_b = [group for size in range(1, max_players + 1)
+                      for group in combinations(team_b.roster['active'], size)]
+        for players_a in packages_a:
+            for players_b in packages_b:
+                yield Trade(team_a, team_b, players_a, players_b)
+
+
+    def _gain_bound(self, team: Team, incoming: Sequence[Player],
+                    charts: Dict[int, Dict[str, List[Player]]], bounds: Dict[Tuple[int, ...], float]) -> float:
+        """Upper bound on a team's lineup gain from receiving players, cached per package"""
+        key = (id(team),) + tuple(id(p) for p in incoming)
+        if key not in bounds:
+            bounds[key] = self._lineup_gain(team, incoming, (), charts)
+        return bounds[key]
+
+
+    def _lineup_gain(self, team: Team, incoming: Sequence[Player], outgoing: Sequence[Player],
+                     charts: Dict[int, Dict[str, List[Player]]]) -> float:
+        """Change in a team's best lineup points after a trade"""
+        if id(team) not in charts:
+            charts[id(team)] = self._depth_chart(team)
+        chart = charts[id(team)]
+        return self._lineup_points(chart, incoming, outgoing) - self._lineup_points(chart, (), ())
+
+
+    def _depth_chart(self, team: Team) -> Dict[str, List[Player]]:
+        """Active players who could start, by position, best first"""
+        chart: Dict[str, List[Player]] = {}
+        for player in team.roster['active']:
+            if self.optimizer.max_starters.get(player.position, 0):
+                chart.setdefault(player.position, []).append(player)
+        for group in chart.values():
+            group.sort(key=lambda p: p.fantasy_points, reverse=True)
+        return chart
+
+
+    def _lineup_points(self, chart: Dict[str, List[Player]],
+                       incoming: Sequence[Player], outgoing: Sequence[Player]) -> float:
+        """Best lineup points after a trade, memoized on the players who could start
+
+        Only the top few players per position can start, so most trades leave
+        that set unchanged and reuse an earlier solve.
+        """
+        outgoing_ids = {id(p) for p in outgoing}
+        candidates = []
+        for position, limit in self.optimizer.max_starters.items():
+            if not limit:
+                continue
+            kept = []
+            for player in chart.get(position, ()):
+                if id(player) not in outgoing_ids:
+                    kept.append(player)
+                    if len(kept) == limit:
+                        break
+            arrivals = [p for p in incoming if p.position == position and p.roster_status == 'active']
+            if arrivals:
+                kept = sorted(kept + arrivals, key=lambda p: p.fantasy_points, reverse=True)[:limit]
+            candidates.extend(kept)
+
+        key = tuple(sorted((id(p), p.fantasy_points) for p in candidates))
+        if key not in self._lineup_cache:
+            self._lineup_cache[key] = lineup_points(self.optimizer.optimize(candidates))
+        return self._lineup_cache[key]
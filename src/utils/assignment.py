@@ -0,0 +1,74 @@
+from typing import List, Sequence
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> List[int]:
+    """Minimum-cost assignment of rows to distinct columns (Hungarian algorithm)
+
+    Runs in O(rows^2 * columns) using row/column potentials.
+
+    Args:
+        cost: rows x columns cost matrix with rows <= columns
+
+    Returns:
+        The column assigned to each row
+    """
+    n = len(cost)
+    if n == 0:
+        return []
+    m = len(cost[0])
+    if n > m:
+        raise ValueError(f"Need at least as many columns as rows, got {n}x{m}")
+
+    inf = float('inf')
+    # Potentials and matching are 1-indexed; column 0 is a sentinel
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)   # row matched to each column
+    way = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+
+        # Grow an alternating tree from row i until it reaches a free column
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            row = cost[i0 - 1]
+            u_i0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    slack = row[j - 1] - u_i0 - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = j0
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        j1 = j
+
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+
+            j0 = j1
+            if match[j0] == 0:
+                break
+
+        # Flip the augmenting path
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
@@ -0,0 +1,190 @@
+import functools
+import importlib
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Hooked methods by category, as "module:Class.method". Hooks are patched onto
+# the classes only while a Profiler is running, so disabled instrumentation
+# costs nothing on the hot paths.
+HOOKS: Dict[str, List[str]] = {
+    'offseason': [
+        'src.models.league:League.advance_season',
+        'src.models.league:League._advance_all_contracts',
+        'src.models.league:League._process_holdouts',
+        'src.models.league:League.rank_season',
+        'src.models.league:League._calculate_position_averages',
+        'src.models.league:League._handle_expired_contracts',
+        'src.models.league:League._validate_salary_caps',
+        'src.models.league:League._determine_rookie_draft_order',
+        'src.services.offseason:OffseasonEngine.advance_season',
+        'src.services.offseason:OffseasonEngine._advance_all_contracts',
+        'src.services.offseason:OffseasonEngine._process_holdouts',
+        'src.services.offseason:OffseasonEngine._rank_season',
+        'src.services.offseason:OffseasonEngine._validate_salary_caps',
+    ],
+    'cap': [
+        'src.models.team:Team.get_total_salary_used',
+        'src.models.team:Team.can_afford',
+        'src.models.team:Team.rebuild_cap_ledger',
+        'src.models.team:Team.load_cap_charges',
+        'src.models.team:Team.refresh_player_salary',
+        'src.models.team:Team._recompute_salary_used',
+    ],
+    'roster': [
+        'src.models.team:Team.add_player',
+        'src.models.team:Team.remove_player',
+        'src.models.team:Team.move_player',
+        'src.models.team:Team.trade_away',
+        'src.models.team:Team.receive_traded_player',
+        'src.models.team:Team.extend_player_contract',
+        'src.models.team:Team.tag_player',
+        'src.models.team:Team.resolve_player_holdout',
+        'src.models.team:Team.advance_contracts',
+        'src.models.team:Team.drop_expired',
+        'src.models.league:League.add_team',
+        'src.models.league:League.add_free_agent',
+        'src.models.league:League.add_free_agents',
+    ],
+    'lookup': [
+        'src.models.league:League.get_team_by_name',
+        'src.models.league:League.get_free_agents_by_position',
+        'src.models.registry:PlayerRegistry.get',
+        'src.models.registry:PlayerRegistry.find_by_name',
+        'src.models.registry:PlayerRegistry.query',
+        'src.models.registry:PlayerRegistry.add',
+        'src.models.registry:PlayerRegistry.refresh',
+    ],
+}
+
+_active: Optional['Profiler'] = None
+
+
+class Profiler:
+    """Opt-in timers and call counters for the league's hot paths
+
+    While running, every hooked method is wrapped to count its calls and
+    their inclusive time; stop() puts the original methods back. Code can
+    also time its own phases with phase(), which is a no-op unless a
+    profiler is running. Only one profiler runs at a time.
+    """
+
+    def __init__(self, hooks: Optional[Dict[str, List[str]]] = None):
+        self.hooks = hooks if hooks is not None else HOOKS
+        self.stats: Dict[str, List[float]] = {} # name -> [calls, total seconds]
+        self.categories: Dict[str, str] = {}
+        self.wall_time = 0.0
+
+        self._patched: List[Tuple[type, str, Optional[object]]] = []
+        self._started: Optional[float] = None
+
+
+    def start(self) -> 'Profiler':
+        global _active
+        if _active is not None:
+            raise ValueError("A profiler is already running")
+
+        try:
+            for category, targets in self.hooks.items():
+                for target in targets:
+                    self._patch(category, target)
+        except Exception:
+            self._unpatch()
+            raise
+        _active = self
+        self._started = time.perf_counter()
+        return self
+
+
+    def stop(self):
+        global _active
+        if _active is not self:
+            return
+
+        self.wall_time += time.perf_counter() - self._started
+        self._unpatch()
+        _active = None
+
+
+    def __enter__(self) -> 'Profiler':
+        return self.start()
+
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+    def record(self, name: str, seconds: float, category: str = 'phase'):
+        """Add one timed call to a stat"""
+        stat = self.stats.setdefault(name, [0, 0.0])
+        stat[0] += 1
+        stat[1] += seconds
+        self.categories.setdefault(name, category)
+
+
+    def summary(self) -> List[Dict[str, object]]:
+        """Stats for everything called, by category then total time
+
+        Returns:
+            One dict per hook with 'name', 'category', 'calls', 'total'
+            and 'mean' (seconds)
+        """
+        rows = [{'name': name, 'category': self.categories[name], 'calls': int(calls),
+                 'total': total, 'mean': total / calls}
+                for name, (calls, total) in self.stats.items() if calls]
+        order = {category: i for i, category in enumerate(self.hooks)}
+        return sorted(rows, key=lambda r: (order.get(r['category'], len(order)), -r['total']))
+
+
+    def _patch(self, category: str, target: str):
+        module_name, qualname = target.split(':')
+        class_name, name = qualname.split('.')
+        cls = getattr(importlib.import_module(module_name), class_name)
+
+        original = cls.__dict__.get(name)
+        function = getattr(cls, name)
+        stat_name = f"{class_name}.{name}"
+        self.categories.setdefault(stat_name, category)
+        stat = self.stats.setdefault(stat_name, [0, 0.0])
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stat[0] += 1
+                stat[1] += time.perf_counter() - start
+
+        setattr(cls, name, wrapper)
+        self._patched.append((cls, name, original))
+
+
+    def _unpatch(self):
+        """Put back every original method"""
+        for cls, name, original in reversed(self._patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched = []
+
+
+def active() -> Optional[Profiler]:
+    """The running profiler, if any"""
+    return _active
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block under name when a profiler is running"""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(name, time.perf_counter() - start)
@@ -0,0 +1,10 @@
+import pytest
+from src.models.team import Team
+
+
+@pytest.fixture(autouse=True)
+def verify_cap_ledger():
+    """Check every team's cap ledger against a full recompute during tests"""
+    Team.verify_cap_ledger = True
+    yield
+    Team.verify_cap_ledger = False
@@ -0,0 +1,166 @@
+"""
+Test suite for the La Liga Lebowski CLI
+Run with: python -m pytest tests/test_cli.py -v
+"""
+
+import os
+import pstats
+import subprocess
+import sys
+import time
+
+import pytest
+from click.testing import CliRunner
+from src.cli.interface import cli
+from src.data.store import LeagueStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "league.db")
+
+
+def run(db_path, *args):
+    result = CliRunner().invoke(cli, ['--db', db_path, *args])
+    assert result.exit_code == 0, result.output
+    return result
+
+
+class TestCommands:
+    """Test CLI commands against a persisted league"""
+
+    def test_state_persists_between_commands(self, db_path):
+        run(db_path, 'setup-demo')
+        run(db_path, 'extend-player', 'Team Alpha', 'Josh Allen', '2')
+
+        result = run(db_path, 'team-roster', 'Team Alpha')
+        assert "Josh Allen" in result.output
+        assert "5yr" in result.output
+
+    def test_extend_player_loads_one_team(self, db_path, monkeypatch):
+        run(db_path, 'setup-demo')
+        monkeypatch.setattr(LeagueStore, 'load', lambda self: pytest.fail("loaded the whole league"))
+
+        result = run(db_path, 'extend-player', 'Team Alpha', 'josh allen', '2')
+        assert "Extended Josh Allen for 2 additional years" in result.output
+        assert "not found" in run(db_path, 'extend-player', 'Team Alpha', 'Nobody', '2').output
+
+    def test_import_players(self, db_path, tmp_path):
+        run(db_path, 'setup-demo')
+        path = tmp_path / "players.csv"
+        path.write_text("name,nfl_team,position,salary,years,fantasy_team\n"
+                        "Free Agent,BUF,WR,,,\n"
+                        "Signed Player,KC,RB,20,2,Team Beta\n"
+                        "Lost Player,KC,RB,20,2,Team Omega\n"
+                        "Bad Player,XXX,RB,,,\n")
+
+        result = run(db_path, 'import-players', str(path))
+
+        assert "Imported 2 players (1 rostered, 1 free agents)" in result.output
+        assert "Rejected 2 rows" in result.output
+        league = LeagueStore(db_path).load()
+        assert [p.name for p in league.free_agents] == ["Free Agent"]
+        assert "Signed Player" in [p.name for p in league.get_team_by_name("Team Beta").roster['active']]
+        assert (tmp_path / "players.csv.rejects.jsonl").exists()
+
+    def test_simulate_draft(self, db_path, tmp_path):
+        run(db_path, 'setup-demo')
+        run(db_path, 'advance-season')
+
+        result = CliRunner().invoke(cli, ['--db', db_path, 'simulate-draft'])
+        assert result.exit_code != 0 and "--rookies" in result.output
+
+        path = tmp_path / "rookies.csv"
+        path.write_text("name,nfl_team,position,rank\n" +
+                        "".join(f"Rookie {i},KC,WR,{i}\n" for i in range(1, 31)))
+
+        result = run(db_path, 'simulate-draft', '--rookies', str(path))
+
+        assert "Rookie 1" in result.output
+        league = LeagueStore(db_path).load()
+        drafted = [p for team in league.teams for p in team.roster['active'] if p.name.startswith("Rookie")]
+        assert len(drafted) == 20
+        assert all(p.contract.is_rookie for p in drafted)
+
+    def test_fix_cap(self, db_path):
+        run(db_path, 'setup-demo')
+        store = LeagueStore(db_path)
+        team = store.load().get_team_by_name("Team Beta")
+        team.dead_money = team.get_remaining_cap() + 12.5
+        store.save_team(team)
+
+        result = run(db_path, 'fix-cap')
+        assert "Team Beta: $12.50 over cap" in result.output
+        assert "Total: saves" in result.output
+        assert not store.load().get_team_by_name("Team Beta").is_salary_cap_compliant()
+
+        result = run(db_path, 'fix-cap', 'Team Beta', '--apply')
+        assert "Moves applied" in result.output
+        assert store.load().get_team_by_name("Team Beta").is_salary_cap_compliant()
+        assert "All teams are under the salary cap" in run(db_path, 'fix-cap').output
+
+    def test_plan_extensions(self, db_path):
+        run(db_path, 'setup-demo')
+        result = run(db_path, 'plan-extensions', 'Team Alpha', '--top', '2')
+        assert "Plan 1" in result.output and "Plan 2" in result.output
+        assert "Extend Josh Allen" in result.output
+        assert "not found" in run(db_path, 'plan-extensions', 'Team Omega').output
+
+    def test_lottery_odds(self, db_path):
+        result = run(db_path, 'lottery-odds', '--draws', '10000', '--seed', '1')
+        assert "30.00%" in result.output
+
+    def test_profile(self, db_path):
+        run(db_path, 'setup-demo')
+        result = run(db_path, '--profile', 'advance-season')
+        assert "Season advanced to 2026" in result.output
+        assert "Profile (" in result.output
+        assert "LeagueStore.load" in result.output
+
+    def test_profile_stats(self, db_path, tmp_path):
+        path = str(tmp_path / "league_status.prof")
+        result = run(db_path, '--profile-stats', path, 'league-status')
+        assert "Saved cProfile stats" in result.output
+        assert pstats.Stats(path).total_calls > 0
+
+
+class TestStartup:
+    """Startup budgets for the commands scripts call most"""
+
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Best-of-3 wall time, generous enough for a loaded CI box
+    HELP_BUDGET = 0.3
+    STATUS_BUDGET = 0.5
+
+    def launch(self, *args):
+        """Best wall time of three fresh interpreters, and the modules the last one imported"""
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(self.ROOT, 'main.py'), *args],
+                                    capture_output=True, text=True, cwd=self.ROOT)
+            times.append(time.perf_counter() - start)
+            assert result.returncode == 0, result.stderr
+
+        modules = {line.rsplit('|', 1)[-1].strip() for line in result.stderr.splitlines()
+                   if line.startswith('import time:')}
+        return min(times), modules
+
+    def test_help(self):
+        elapsed, modules = self.launch('--help')
+
+        assert not {'numpy', 'rich', 'src.models.league', 'src.data.store', 'config.settings'} & modules
+        assert elapsed < self.HELP_BUDGET
+
+    def test_league_status(self, db_path):
+        run(db_path, 'setup-demo')
+        elapsed, modules = self.launch('--db', db_path, 'league-status')
+
+        assert 'src.models.league' in modules
+        assert 'numpy' not in modules
+        assert elapsed < self.STATUS_BUDGET
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
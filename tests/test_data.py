@@ -0,0 +1,488 @@
+"""
+Test suite for La Liga Lebowski data layer
+Run with: python -m pytest tests/test_data.py -v
+"""
+
+import pytest
+from src.models.player import Player
+from src.models.team import Team
+from src.models.league import League
+from src.models.contract import Contract
+import json
+import os
+from src.data.store import LeagueStore
+from src.data.transaction_log import TransactionLog
+from src.services.trades import Trade, TradeService
+from src.services.tags import TagRound
+from src.data.player_loader import PlayerLoader, batched, validate_row
+from src.data.sleeper import (FixtureBackend, FixtureServer, HttpBackend,
+                              ResponseCache, SleeperClient)
+
+
+def build_league(num_teams: int = 12, players_per_team: int = 3) -> League:
+    """Build a small league with contracted players on every team"""
+    league = League(2025)
+    positions = ["QB", "RB", "WR", "TE"]
+    for t in range(num_teams):
+        team = Team(f"Team {t+1}", draft_position=t+1)
+        team.wins = t
+        league.add_team(team)
+        for i in range(players_per_team):
+            name = f"Player {t}-{i}"
+            contract = Contract(name, 10.0 + i, 3, start_year=2024)
+            player = Player(name, "KC", positions[i % len(positions)], contract=contract)
+            player.fantasy_points = 100.0 + t + i
+            team.add_player(player)
+    return league
+
+
+class TestLeagueStore:
+    """Test persisting leagues to SQLite"""
+
+    def test_empty_store(self, tmp_path):
+        store = LeagueStore(str(tmp_path / "league.db"))
+        assert not store.exists()
+        assert store.load() is None
+        assert store.load_team("Team 1") is None
+
+    def test_round_trip(self, tmp_path):
+        store = LeagueStore(str(tmp_path / "league.db"))
+        league = build_league()
+        league.teams[0].dead_money = 12.5
+        free_agent = Player("Free Agent", "BUF", "WR")
+        league.free_agents.append(free_agent)
+        league._determine_rookie_draft_order()
+
+        store.save(league)
+        loaded = store.load()
+
+        assert store.exists()
+        assert loaded.season_year == 2025
+        assert [t.name for t in loaded.teams] == [t.name for t in league.teams]
+        assert [t.name for t in loaded.rookie_draft_order] == [t.name for t in league.rookie_draft_order]
+        assert loaded.teams[0].dead_money == 12.5
+        assert [p.name for p in loaded.free_agents] == ["Free Agent"]
+
+        for original, restored in zip(league.teams, loaded.teams):
+            assert restored.get_total_salary_used() == original.get_total_salary_used()
+            assert [p.name for p in restored.roster['active']] == [p.name for p in original.roster['active']]
+
+        player = loaded.teams[0].roster['active'][0]
+        assert player.player_id == league.teams[0].roster['active'][0].player_id
+        assert loaded.players.get(player.player_id) is player
+        assert loaded.get_team_by_name("Team 1") is loaded.teams[0]
+        assert player.fantasy_team == "Team 1"
+        assert player.roster_status == "active"
+        assert player.contract.years_remaining == 3
+        assert player.contract.start_year == 2024
+
+    def test_load_and_save_single_team(self, tmp_path):
+        store = LeagueStore(str(tmp_path / "league.db"))
+        store.save(build_league())
+
+        team = store.load_team("Team 2")
+        player = team.roster['active'][0]
+        player.extend_contract(2)
+        store.save_team(team)
+
+        league = store.load()
+        assert [t.name for t in league.teams][1] == "Team 2"
+        assert league.teams[1].roster['active'][0].contract.has_been_extended
+        assert len(league.teams[0].roster['active']) == 3
+
+    def test_round_trip_large_league(self, tmp_path):
+        league = League(2025, max_teams=32)
+        for t in range(32):
+            league.add_team(Team(f"Team {t+1}"))
+        store = LeagueStore(str(tmp_path / "league.db"))
+        store.save(league)
+
+        assert len(store.load().teams) == 32
+
+    def test_save_team_requires_saved_league(self, tmp_path):
+        store = LeagueStore(str(tmp_path / "league.db"))
+        store.save(build_league(num_teams=1))
+
+        with pytest.raises(ValueError, match="has not been saved"):
+            store.save_team(Team("Unknown"))
+
+
+class TestPlayerLoader:
+    """Test streaming player imports"""
+
+    def test_validate_row(self):
+        row = validate_row({'name': ' Josh Allen ', 'nfl_team': 'buf', 'position': 'qb',
+                            'salary': '50', 'years': '3', 'is_rookie': 'yes'})
+
+        assert row['name'] == "Josh Allen"
+        assert row['nfl_team'] == "BUF"
+        assert row['position'] == "QB"
+        assert row['salary'] == 50.0
+        assert row['years'] == 3
+        assert row['is_rookie']
+        assert row['roster_status'] == 'active'
+
+    @pytest.mark.parametrize("row, error", [
+        ({'nfl_team': 'BUF', 'position': 'QB'}, "Missing player name"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'LB'}, "Invalid position"),
+        ({'name': 'X', 'nfl_team': 'XXX', 'position': 'QB'}, "Invalid NFL team"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'QB', 'salary': '10'}, "both salary and years"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'QB', 'rank': 'first'}, "Invalid rank"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'QB', 'fantasy_team': 'T'}, "needs a contract"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'QB', 'salary': 'nan', 'years': '2'}, "Invalid salary"),
+        ({'name': 'X', 'nfl_team': 'BUF', 'position': 'QB', 'fantasy_points': 'inf'}, "Invalid fantasy_points"),
+        ([1, 2], "Row must be a JSON object"),
+    ])
+    def test_invalid_rows(self, row, error):
+        with pytest.raises(ValueError, match=error):
+            validate_row(row)
+
+    def test_batched(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_load_csv_with_rejects(self, tmp_path):
+        path = tmp_path / "players.csv"
+        path.write_text("name,nfl_team,position,salary,years,fantasy_points\n"
+                        "Josh Allen,BUF,QB,50,3,350.5\n"
+                        "Bad Player,BUF,LB,,,\n"
+                        "James Cook,BUF,RB,,,120\n")
+        reject_path = tmp_path / "rejects.jsonl"
+
+        loader = PlayerLoader(str(path), str(reject_path), batch_size=1)
+        batches = list(loader)
+
+        assert [len(b) for b in batches] == [1, 1]
+        allen, cook = batches[0][0][0], batches[1][0][0]
+        assert allen.contract.current_salary == 50.0
+        assert allen.fantasy_points == 350.5
+        assert cook.contract is None
+        assert loader.loaded == 2
+
+        rejects = [json.loads(line) for line in reject_path.read_text().splitlines()]
+        assert rejects == [{'line': 3, 'error': "Invalid position: LB",
+                            'row': {'name': 'Bad Player', 'nfl_team': 'BUF', 'position': 'LB',
+                                    'salary': '', 'years': '', 'fantasy_points': ''}}]
+
+    def test_load_jsonl(self, tmp_path):
+        path = tmp_path / "players.jsonl"
+        path.write_text(json.dumps({'name': 'Josh Allen', 'nfl_team': 'BUF', 'position': 'QB'}) + "\n"
+                        "\n"
+                        "{not json\n"
+                        "[1, 2]\n"
+                        "42\n")
+
+        loader = PlayerLoader(str(path))
+        players = [player for batch in loader for player, _ in batch]
+
+        assert [p.name for p in players] == ["Josh Allen"]
+        assert loader.rejects.count == 3
+
+    def test_unsupported_file(self, tmp_path):
+        path = tmp_path / "players.xlsx"
+        path.write_text("")
+
+        with pytest.raises(ValueError, match="Unsupported player file type"):
+            list(PlayerLoader(str(path)))
+
+
+@pytest.fixture
+def sleeper_fixtures(tmp_path):
+    """Write a tiny Sleeper-shaped fixture tree: two players, two weeks of stats"""
+    root = tmp_path / "sleeper"
+
+    def write(path, payload):
+        file_path = root.joinpath(*path.split('/')).with_suffix('.json')
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps(payload))
+
+    write("players/nfl", {
+            "4984": {"full_name": "Josh Allen", "position": "QB", "team": "BUF"},
+            "4034": {"full_name": "Christian McCaffrey", "position": "RB", "team": "SF"},
+    })
+    write("stats/nfl/regular/2025/1", {
+            "4984": {"pass_yd": 250, "pass_td": 2, "pass_int": 1},
+            "4034": {"rush_yd": 100, "rush_td": 1, "rec": 4, "rec_yd": 30},
+    })
+    write("stats/nfl/regular/2025/2", {"4984": {"pass_yd": 300, "pass_td": 3}})
+    for week in range(3, 18):
+        write(f"stats/nfl/regular/2025/{week}", {})
+    return str(root)
+
+
+class TestSleeperAdapter:
+    """Test the offline Sleeper data source and its cache"""
+
+    def test_season_points(self, sleeper_fixtures):
+        client = SleeperClient(FixtureBackend(sleeper_fixtures))
+
+        points = client.season_points(2025)
+
+        # Allen: 10 + 8 - 2 + 12 + 12 = 40; McCaffrey: 10 + 6 + 2 + 3 = 21
+        assert points == pytest.approx({"4984": 40.0, "4034": 21.0})
+
+    def test_missing_week_has_no_stats(self, sleeper_fixtures):
+        os.remove(os.path.join(sleeper_fixtures, "stats", "nfl", "regular", "2025", "2.json"))
+        client = SleeperClient(FixtureBackend(sleeper_fixtures))
+
+        # Allen: week 1 only, 10 + 8 - 2
+        assert client.season_points(2025) == pytest.approx({"4984": 16.0, "4034": 21.0})
+
+    def test_same_name_players(self, sleeper_fixtures):
+        path = os.path.join(sleeper_fixtures, "players", "nfl.json")
+        with open(path) as f:
+            players = json.load(f)
+        players["4985"] = {"full_name": "Josh Allen", "position": "QB", "team": "JAX"}
+        with open(path, "w") as f:
+            json.dump(players, f)
+        path = os.path.join(sleeper_fixtures, "stats", "nfl", "regular", "2025", "1.json")
+        with open(path) as f:
+            stats = json.load(f)
+        stats["4985"] = {"pass_yd": 50}
+        with open(path, "w") as f:
+            json.dump(stats, f)
+
+        league = build_league(num_teams=2, players_per_team=1)
+        buffalo = Player("Josh Allen", "BUF", "QB", contract=Contract("Josh Allen", 10.0, 3))
+        jacksonville = Player("Josh Allen", "JAX", "QB", contract=Contract("Josh Allen", 10.0, 3))
+        league.teams[0].add_player(buffalo)
+        league.teams[1].add_player(jacksonville)
+
+        client = SleeperClient(FixtureBackend(sleeper_fixtures))
+        assert client.apply_season_points(league, 2025) == 2
+        assert (buffalo.fantasy_points, jacksonville.fantasy_points) == pytest.approx((40.0, 2.0))
+
+    def test_cache_avoids_refetch(self, sleeper_fixtures, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        first = SleeperClient(FixtureBackend(sleeper_fixtures), ResponseCache(cache_dir))
+        first.players()
+        first.players()
+        assert first.fetch_count == 1
+
+        # A new process reads the payload straight from disk
+        second = SleeperClient(FixtureBackend(sleeper_fixtures), ResponseCache(cache_dir))
+        assert second.players()["4984"]["full_name"] == "Josh Allen"
+        assert second.fetch_count == 0
+
+    def test_cache_ttl(self, tmp_path):
+        now = [1000.0]
+        cache = ResponseCache(str(tmp_path), ttl=60, clock=lambda: now[0])
+        digest = cache.put("/players/nfl", b"{}")
+
+        now[0] += 30
+        assert cache.get("/players/nfl") == digest
+        now[0] += 31
+        assert cache.get("/players/nfl") is None
+
+    def test_cache_is_content_addressed(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.put("/stats/nfl/regular/2025/3", b"{}")
+        cache.put("/stats/nfl/regular/2025/4", b"{}")
+
+        assert len(os.listdir(tmp_path / "objects")) == 1
+        assert cache.size() == 2
+
+    def test_cache_eviction(self, tmp_path):
+        now = [0.0]
+        cache = ResponseCache(str(tmp_path), max_bytes=10, clock=lambda: now[0])
+        cache.put("old", b"aaaaaa")
+        now[0] += 1
+        cache.put("new", b"bbbbbb")
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+        assert cache.size() == 6
+
+    def test_cache_hits_persist_across_processes(self, tmp_path):
+        now = [0.0]
+        cache = ResponseCache(str(tmp_path), max_bytes=12, clock=lambda: now[0])
+        cache.put("a", b"aaaaaa")
+        now[0] += 1
+        cache.put("b", b"bbbbbb")
+        now[0] += 1
+        assert cache.get("a") is not None
+
+        # A new process evicts by the persisted last use
+        now[0] += 1
+        reopened = ResponseCache(str(tmp_path), max_bytes=12, clock=lambda: now[0])
+        reopened.put("c", b"cccccc")
+        assert reopened.get("a") is not None
+        assert reopened.get("b") is None
+        assert reopened.size() == 12
+
+    def test_fixture_server(self, sleeper_fixtures):
+        with FixtureServer(sleeper_fixtures) as server:
+            client = SleeperClient(HttpBackend(server.url))
+            assert set(client.players()) == {"4984", "4034"}
+
+            with pytest.raises(LookupError):
+                client.weekly_stats(1999, 1)
+
+    def test_league_uses_data_source(self, sleeper_fixtures):
+        league = build_league(num_teams=12, players_per_team=1)
+        allen = Player("Josh Allen", "BUF", "QB", contract=Contract("Josh Allen", 10.0, 3))
+        league.teams[0].add_player(allen)
+        client = SleeperClient(FixtureBackend(sleeper_fixtures))
+        league.data_source = client
+
+        league._process_holdouts()
+        fetches = client.fetch_count
+        league._process_holdouts()
+
+        assert allen.fantasy_points == pytest.approx(40.0)
+        assert client.fetch_count == fetches == 18 # players + 17 weeks, fetched once
+
+
+def league_state(league):
+    """Comparable summary of teams, rosters, contracts and the free agent pool"""
+    teams = {}
+    for team in league.teams:
+        roster = {roster_type: sorted((p.player_id, p.name, p.roster_status, p.contract.years_remaining,
+                                       round(p.contract.current_salary, 6)) for p in players)
+                  for roster_type, players in team.roster.items()}
+        teams[team.name] = (roster, round(team.dead_money, 6), round(team.get_total_salary_used(), 6))
+    free_agents = sorted(p.name for p in league.free_agents if p.fantasy_team is None)
+    return league.season_year, teams, free_agents
+
+
+class TestTransactionLog:
+    """Test the append-only transaction log"""
+
+    def make_moves(self, league, season):
+        """A season's worth of signings, cuts, moves and extensions"""
+        team_a, team_b = league.teams[0], league.teams[1]
+        signing = Player(f"Signing {season}", "BUF", "WR", contract=Contract(f"Signing {season}", 5.0, 4))
+        league.add_free_agent(signing)
+        team_a.add_player(signing)
+        league.free_agents.remove(signing)
+        rookie = Player(f"Rookie {season}", "BUF", "RB",
+                        contract=Contract(f"Rookie {season}", 2.0, 3, is_rookie=True))
+        team_b.add_player(rookie, 'practice_squad')
+        team_b.move_player(rookie, 'active')
+        if team_a.roster['active'][0].can_be_extended():
+            team_a.extend_player_contract(team_a.roster['active'][0], 2)
+        team_b.remove_player(team_b.roster['active'][0])
+
+    def test_records_events(self, tmp_path):
+        league = build_league(num_teams=2)
+        log = TransactionLog(str(tmp_path / "log"))
+        log.attach(league)
+
+        self.make_moves(league, 2025)
+
+        events = list(log.events())
+        assert [e['type'] for e in events] == ['add_free_agents', 'add_player', 'add_player', 'move_player',
+                                                'extend_player_contract', 'remove_player']
+        assert [e['seq'] for e in events] == [1, 2, 3, 4, 5, 6]
+        assert events[1]['team'] == "Team 1" and events[1]['player']['c_current_salary'] == 5.0
+        assert events[3]['player'] == {'id': events[2]['player']['id'], 'name': "Rookie 2025"}
+
+    def test_rebuild_latest_and_past(self, tmp_path):
+        league = build_league(num_teams=2)
+        log = TransactionLog(str(tmp_path / "log"))
+        log.attach(league)
+        before = league_state(league)
+
+        self.make_moves(league, 2025)
+
+        assert league_state(log.rebuild()) == league_state(league)
+        assert league_state(log.rebuild(0)) == before
+
+        partial = log.rebuild(2)
+        assert "Signing 2025" in [p.name for p in partial.teams[0].roster['active']]
+        assert "Rookie 2025" not in [p.name for p in partial.teams[1].roster['active']]
+
+    def test_ten_seasons(self, tmp_path, monkeypatch):
+        monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+        league = build_league(num_teams=4)
+        log = TransactionLog(str(tmp_path / "log"), snapshot_interval=1000)
+        log.attach(league)
+
+        states = {}
+        for season in range(2025, 2035):
+            self.make_moves(league, season)
+            states[log.last_seq] = league_state(league)
+            league.advance_season()
+
+        assert league.season_year == 2035
+        assert league_state(log.rebuild()) == league_state(league)
+        for seq, state in states.items():
+            assert league_state(log.rebuild(seq)) == state
+
+        # Every offseason is one event followed by a snapshot
+        assert sum(e['type'] == 'advance_season' for e in log.events()) == 10
+
+    def test_replays_only_from_nearest_snapshot(self, tmp_path):
+        directory = str(tmp_path / "log")
+        league = build_league(num_teams=2)
+        log = TransactionLog(directory, snapshot_interval=4, segment_events=3)
+        log.attach(league)
+        for season in range(2025, 2029):
+            self.make_moves(league, season)
+
+            # Trades are batched, so a snapshot never holds a player in transit
+            team_a, team_b = league.teams
+            TradeService(league).execute(Trade(team_a, team_b, [team_a.roster['active'][-1]],
+                                               [team_b.roster['active'][-1]]))
+        log.close()
+
+        # Drop every segment that ends before the last snapshot
+        snapshots = sorted(int(n[:-3]) for n in os.listdir(os.path.join(directory, 'snapshots')))
+        segments = sorted(int(n[:-6]) for n in os.listdir(os.path.join(directory, 'segments')))
+        for first, next_first in zip(segments, segments[1:]):
+            if next_first <= snapshots[-1] + 1:
+                os.remove(os.path.join(directory, 'segments', f"{first:012d}.jsonl"))
+
+        reopened = TransactionLog(directory, snapshot_interval=4, segment_events=3)
+        assert reopened.last_seq == log.last_seq
+        assert league_state(reopened.rebuild()) == league_state(league)
+
+    def test_replays_tags(self, tmp_path):
+        league = build_league(num_teams=2)
+        log = TransactionLog(str(tmp_path / "log"))
+        log.attach(league)
+        team = league.teams[0]
+        player = Player("Tagged", "BUF", "WR", contract=Contract("Tagged", 10.0, 1))
+        team.add_player(player)
+
+        TagRound(league).tag(team, player)
+        team.remove_player(player)
+
+        assert team.dead_money > 0
+        assert [e['type'] for e in log.events()][-2:] == ['tag_player', 'remove_player']
+        assert league_state(log.rebuild()) == league_state(league)
+
+    def test_fork_commit(self, tmp_path):
+        league = build_league(num_teams=2)
+        log = TransactionLog(str(tmp_path / "log"))
+        log.attach(league)
+
+        fork = league.fork()
+        self.make_moves(fork, 2025)
+        assert list(log.events()) == []
+
+        fork.commit()
+        assert [e['type'] for e in log.events()] == ['commit_fork']
+        assert league_state(log.rebuild()) == league_state(league)
+
+        self.make_moves(league, 2026)
+        assert league_state(log.rebuild()) == league_state(league)
+
+    def test_reopen_appends(self, tmp_path):
+        directory = str(tmp_path / "log")
+        league = build_league(num_teams=2)
+        log = TransactionLog(directory)
+        log.attach(league)
+        self.make_moves(league, 2025)
+        log.detach()
+
+        reopened = TransactionLog(directory)
+        reopened.attach(league)
+        self.make_moves(league, 2026)
+
+        assert [e['seq'] for e in reopened.events()] == list(range(1, reopened.last_seq + 1))
+        assert reopened.last_seq > 6
+        assert league_state(reopened.rebuild()) == league_state(league)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
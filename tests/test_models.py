@@ -8,6 +8,9 @@ from src.models.player import Player
 from src.models.team import Team
 from src.models.league import League
 from src.models.contract import Contract
+from src.models.registry import PlayerRegistry, normalize_name
+from src.models.rankings import SeasonRankings
+from src.models.player_table import PlayerTable
 
 class TestContract:
     """Test Contract model functionality"""
@@ -31,6 +34,21 @@ class TestContract:
         assert contract.years_remaining == 2
         assert contract.current_salary == original_salary * 1.20
 
+    def test_apply_tag(self):
+        contract = Contract("Test Player", 50.0, 1)
+
+        contract.apply_tag(70.0, transition=True)
+
+        # Tagged players stay one more season at the tag salary, with no raise
+        assert contract.is_transition_tagged and not contract.is_franchise_tagged
+        assert not contract.is_eligible_for_extension()
+        contract.advance_year()
+        assert contract.years_remaining == 1
+        assert contract.current_salary == 70.0
+
+        with pytest.raises(ValueError, match="Only expiring"):
+            Contract("Test Player", 50.0, 3).apply_tag(70.0)
+
     def test_contract_extension(self):
         contract = Contract("Test Player", 50.0, 3)
 
@@ -287,6 +305,69 @@ class TestTeam:
                 with pytest.raises(ValueError, match="roster is full"):
                     team.add_player(player)
 
+    def test_cap_ledger_tracks_roster_moves(self):
+        """Test that the cap ledger follows adds, moves and removals"""
+        team = Team("Test Team")
+        contract = Contract("Rookie", 40.0, 4, is_rookie=True)
+        player = Player("Rookie", "KC", "WR", contract=contract)
+
+        team.add_player(player)
+        assert team.get_total_salary_used() == 40.0
+
+        team.move_player(player, 'practice_squad')
+        assert team.get_total_salary_used() == 10.0 # 25% on PS
+
+        team.move_player(player, 'IR')
+        assert team.get_total_salary_used() == 20.0 # 50% on IR
+
+        team.remove_player(player)
+        assert team.get_total_salary_used() == team.dead_money == 40.0
+
+    def test_cap_ledger_tracks_extensions_and_holdouts(self):
+        team = Team("Test Team")
+        extended = Player("Extended", "KC", "QB", contract=Contract("Extended", 50.0, 3))
+        holdout = Player("Holdout", "KC", "RB", contract=Contract("Holdout", 20.0, 3))
+        team.add_player(extended)
+        team.add_player(holdout)
+
+        team.extend_player_contract(extended, 2)
+        assert team.get_total_salary_used() == 60.0 + 20.0
+
+        holdout.calculate_holdout_demands(100.0)
+        team.resolve_player_holdout(holdout, 'reject')
+        assert holdout in team.roster['practice_squad']
+        assert team.get_total_salary_used() == 60.0 + 5.0
+
+        team.resolve_player_holdout(holdout, 'release')
+        assert holdout not in team.roster['practice_squad']
+        assert team.get_total_salary_used() == 60.0 + 15.0 # 75% dead money, 3yr left
+
+    def test_cap_ledger_drift_detected(self):
+        """Test that debug mode catches salary changes that bypass the ledger"""
+        team = Team("Test Team")
+        player = Player("Test Player", "KC", "RB", contract=Contract("Test Player", 50.0, 3))
+        team.add_player(player)
+
+        player.contract.current_salary = 80.0
+        with pytest.raises(RuntimeError, match="Cap ledger drift"):
+            team.get_total_salary_used()
+
+        team.refresh_player_salary(player)
+        assert team.get_total_salary_used() == 80.0
+
+    def test_advance_contracts(self):
+        team = Team("Test Team")
+        expiring = Player("Expiring", "KC", "RB", contract=Contract("Expiring", 50.0, 1))
+        ongoing = Player("Ongoing", "KC", "WR", contract=Contract("Ongoing", 50.0, 2))
+        team.add_player(expiring)
+        team.add_player(ongoing)
+
+        expired = team.advance_contracts()
+
+        assert expired == [expiring]
+        assert team.roster['active'] == [ongoing]
+        assert team.get_total_salary_used() == 60.0
+        assert team.dead_money == 0.0
 
 class TestLeague:
     """Test League model functionalit"""
@@ -310,6 +391,14 @@ class TestLeague:
         with pytest.raises(ValueError, match="League is full"):
             league.add_team(Team("Team 13"))
 
+    def test_max_teams(self):
+        league = League(2025, max_teams=32)
+        for i in range(32):
+            league.add_team(Team(f"Team {i+1}"))
+
+        with pytest.raises(ValueError, match=r"League is full \(32 teams max\)"):
+            league.add_team(Team("Team 33"))
+
     def test_season_advancement(self):
         """Test advancing to next season"""
         league = League(2025)
@@ -375,6 +464,218 @@ class TestLeague:
         # Last should be champion (best record)
         assert league.rookie_draft_order[-1].wins == 11 # Highest wins
 
+    def test_team_lookup(self):
+        league = League(2025)
+        league.add_team(Team("Team 1"))
+
+        assert league.get_team_by_name("Team 1") is league.teams[0]
+        assert league.get_team_by_name("Team 2") is None
+        with pytest.raises(ValueError, match="already taken"):
+            league.add_team(Team("Team 1"))
+
+    def test_registry_follows_roster_moves(self):
+        """Test that roster and free agent moves keep the player registry in sync"""
+        league = League(2025)
+        team = Team("Test Team")
+        league.add_team(team)
+
+        contract = Contract("Test Player", 50.0, 4, is_rookie=True)
+        player = Player("Test Player", "KC", "RB", contract=contract)
+        team.add_player(player)
+        assert league.players.by_fantasy_team("Test Team") == [player]
+
+        team.move_player(player, 'practice_squad')
+        assert league.players.query(fantasy_team="Test Team", roster_status='practice_squad') == [player]
+        assert league.players.by_status('active') == []
+
+        team.remove_player(player)
+        assert league.players.by_fantasy_team("Test Team") == []
+        assert league.get_free_agents_by_position("RB") == [] # Released, but not in the pool yet
+        league.add_free_agent(player)
+        assert league.get_free_agents_by_position("RB") == [player]
+
+        free_agent = Player("Free Agent", "BUF", "WR")
+        league.add_free_agent(free_agent)
+        assert free_agent in league.free_agents
+        assert league.get_free_agents_by_position("WR") == [free_agent]
+
+        # The pool is League.free_agents, registered or not
+        unregistered = Player("Unregistered", "BUF", "WR")
+        league.free_agents.append(unregistered)
+        assert league.get_free_agents_by_position("WR") == [free_agent, unregistered]
+
+
+class TestPlayerRegistry:
+    """Test indexed player lookups"""
+
+    def test_normalize_name(self):
+        assert normalize_name("  D.J.  Moore ") == "dj moore"
+        assert normalize_name("Ja'Marr Chase") == "jamarr chase"
+
+    def test_add_assigns_ids(self):
+        registry = PlayerRegistry()
+        first = Player("First", "KC", "QB")
+        second = Player("Second", "KC", "QB")
+        second.player_id = 10
+
+        registry.add(first)
+        registry.add(second)
+        registry.add(Player("Third", "KC", "QB"))
+
+        assert first.player_id == 1
+        assert registry.get(10) is second
+        assert registry.find_by_name("third")[0].player_id == 11
+        assert len(registry) == 3
+
+        duplicate = Player("Duplicate", "KC", "QB")
+        duplicate.player_id = 10
+        with pytest.raises(ValueError, match="already registered"):
+            registry.add(duplicate)
+
+    def test_query(self):
+        registry = PlayerRegistry()
+        players = [Player("Josh Allen", "BUF", "QB"),
+                   Player("James Cook", "BUF", "RB"),
+                   Player("Christian McCaffrey", "SF", "RB")]
+        for player in players:
+            registry.add(player)
+
+        assert registry.by_nfl_team("BUF") == players[:2]
+        assert registry.by_position("RB") == players[1:]
+        assert registry.query(nfl_team="BUF", position="RB") == [players[1]]
+        assert registry.query(name="JOSH ALLEN") == [players[0]]
+        assert registry.query(nfl_team="KC") == []
+
+        with pytest.raises(ValueError, match="Unknown registry indexes"):
+            registry.query(salary=10)
+
+    def test_refresh_and_remove(self):
+        registry = PlayerRegistry()
+        player = Player("Traded", "BUF", "WR")
+        registry.add(player)
+
+        player.nfl_team = "MIA"
+        registry.refresh(player)
+        assert registry.by_nfl_team("BUF") == []
+        assert registry.by_nfl_team("MIA") == [player]
+
+        registry.remove(player)
+        assert player not in registry
+        assert registry.by_nfl_team("MIA") == []
+
+
+class TestSeasonRankings:
+    """Test positional rankings and holdout eligibility"""
+
+    def build_rbs(self, count: int):
+        registry = PlayerRegistry()
+        players = []
+        for i in range(count):
+            player = Player(f"RB {i}", "KC", "RB", contract=Contract(f"RB {i}", 10.0, 3))
+            player.fantasy_points = 300.0 - i * 10
+            registry.add(player)
+            players.append(player)
+        return registry, players
+
+    def test_rankings(self):
+        registry, players = self.build_rbs(12)
+        qb = Player("QB", "BUF", "QB")
+        registry.add(qb)
+
+        rankings = SeasonRankings(2025, registry)
+
+        assert rankings.rank_of(players[0]) == 1
+        assert rankings.rank_of(players[11]) == 12
+        assert rankings.rank_of(qb) == 1
+        assert rankings.position_size("RB") == 12
+        assert rankings.top("RB", 2) == [players[0].player_id, players[1].player_id]
+        assert rankings.is_top(players[9], 10)
+        assert not rankings.is_top(players[10], 10)
+
+    def test_unregistered_player_rejected(self):
+        with pytest.raises(ValueError, match="needs a player id"):
+            SeasonRankings(2025, [Player("Loose", "KC", "RB")])
+
+    def test_holdout_eligibility(self):
+        registry, players = self.build_rbs(12)
+        rankings = SeasonRankings(2025, registry)
+
+        assert players[0].check_holdout_eligibility(rankings) # Top 10 RB
+        assert not players[10].check_holdout_eligibility(rankings)
+
+        players[1].contract.years_remaining = 1 # Expiring deals can't hold out
+        assert not players[1].check_holdout_eligibility(rankings)
+
+    def test_league_rank_season(self):
+        league = League(2025)
+        team = Team("Test Team")
+        league.add_team(team)
+        registry, players = self.build_rbs(3)
+        for player in players:
+            player.player_id = None
+            team.add_player(player)
+
+        rankings = league.rank_season()
+
+        assert league.season_rankings is rankings
+        assert [p.position_rank_end_of_season for p in players] == [1, 2, 3]
+
+
+class TestPlayerTable:
+    """Test the compact player representations"""
+
+    def build_players(self):
+        starter = Player("Starter", "KC", "WR", contract=Contract("Starter", 20.0, 3))
+        starter.roster_status = 'active'
+        starter.fantasy_points = 210.5
+        stash = Player("Stash", "BUF", "RB", contract=Contract("Stash", 8.0, 2, is_rookie=True))
+        stash.roster_status = 'practice_squad'
+        free_agent = Player("Free Agent", "DAL", "QB")
+        return [starter, stash, free_agent]
+
+    def test_models_have_no_instance_dict(self):
+        player = self.build_players()[0]
+        for obj in (player, player.contract, Team("Slots")):
+            assert not hasattr(obj, '__dict__')
+            with pytest.raises(AttributeError):
+                obj.not_a_field = 1
+
+    def test_from_players(self):
+        players = self.build_players()
+        table = PlayerTable.from_players(players)
+
+        assert len(table) == 3
+        for player, view in zip(players, table):
+            assert (view.name, view.position, view.roster_status) == (player.name, player.position,
+                                                                      player.roster_status)
+            assert view.get_effective_salary() == pytest.approx(player.get_effective_salary())
+        assert list(table.effective_salaries()) == pytest.approx([20.0, 2.0, 0.0])
+        assert list(table.mask(position='RB')) == [False, True, False]
+        assert list(table.mask(roster_status='free_agent')) == [False, False, True]
+
+    def test_views_write_through(self):
+        table = PlayerTable(capacity=1)
+        for player in self.build_players():
+            table.append(player.name, player.nfl_team, player.position) # Grows past capacity
+
+        view = table[-1]
+        view.fantasy_points = 99.0
+        view.roster_status = 'active'
+        assert table.column('fantasy_points')[2] == 99.0
+        assert table.mask(roster_status='active').sum() == 1
+        with pytest.raises(ValueError, match="Invalid roster status"):
+            view.roster_status = 'bench'
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_to_player(self):
+        table = PlayerTable.from_players(self.build_players())
+
+        starter = table.to_player(0)
+        assert starter.contract.current_salary == 20.0 and starter.contract.years_remaining == 3
+        assert starter.roster_status == 'active' and starter.fantasy_points == 210.5
+        assert table.to_player(2).contract is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
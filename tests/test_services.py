@@ -0,0 +1,1364 @@
+"""
+Test suite for La Liga Lebowski services
+Run with: python -m pytest tests/test_services.py -v
+"""
+
+import itertools
+import random
+import time
+import tracemalloc
+import numpy as np
+import pytest
+from config.settings import SCORING_SETTINGS
+from src.models.player import Player
+from src.models.team import Team
+from src.models.league import League
+from src.models.contract import Contract
+from src.services.scoring import ScoringEngine
+from src.services.season_simulator import SeasonSimulator, round_robin_schedule
+from src.services.lineup import LineupOptimizer, lineup_points
+from src.utils.assignment import solve_assignment
+from src.utils import instrumentation
+from src.utils.instrumentation import Profiler, phase
+from src.services.analytics import summarize_top_performers
+from src.services.projections import CapProjection
+from src.services.trades import Trade, TradeService
+from src.services.auction import AuctionDraft, HumanBidder, ValueCurve, mock_auctions
+from src.services.offseason import OffseasonEngine
+from src.services.free_agency import BlindBidding
+from src.services.tags import TagRound
+from src.services.cap_compliance import CapComplianceSolver
+from src.services.extension_planner import ExtensionPlanner
+from src.services.rookie_draft import (RookieDraft, determine_draft_order, lottery_odds,
+                                       simulate_lottery_odds)
+
+
+def build_league(num_teams: int = 12, players_per_team: int = 9) -> League:
+    """Build a league where later teams have stronger rosters"""
+    league = League(2025)
+    positions = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "WR", "RB"]
+    for t in range(num_teams):
+        team = Team(f"Team {t+1}", draft_position=t+1)
+        league.add_team(team)
+        for i in range(players_per_team):
+            name = f"Player {t}-{i}"
+            player = Player(name, "KC", positions[i % len(positions)],
+                            contract=Contract(name, 10.0 + i, 3))
+            player.fantasy_points = 100.0 + 10 * t + i
+            team.add_player(player)
+    return league
+
+
+class TestScoringEngine:
+    """Test vectorized fantasy scoring"""
+
+    def test_weights_follow_settings(self):
+        engine = ScoringEngine()
+        assert engine.stat_columns == tuple(SCORING_SETTINGS)
+        assert engine.weights.tolist() == list(SCORING_SETTINGS.values())
+
+    def test_score_weeks(self):
+        engine = ScoringEngine()
+        # Two players, two weeks
+        stats = {
+                'passing_yards': np.array([[250, 300], [0, 0]]),
+                'passing_td': np.array([[2, 3], [0, 0]]),
+                'interception': np.array([[1, 0], [0, 0]]),
+                'receiving_yards': np.array([[0, 0], [100, 45]]),
+                'reception': np.array([[0, 0], [8, 4]]),
+                'receiving_td': np.array([[0, 0], [1, 0]]),
+                'fumble_lost': np.array([[0, 0], [0, 1]]),
+        }
+
+        weekly = engine.score_weeks(stats)
+
+        # 250/25 + 2*4 - 2 = 16, 300/25 + 3*4 = 24
+        # 100/10 + 8*0.5 + 6 = 20, 45/10 + 4*0.5 - 2 = 4.5
+        assert weekly.shape == (2, 2)
+        assert np.allclose(weekly, [[16, 24], [20, 4.5]])
+        assert np.allclose(engine.score_seasons(stats), [40, 24.5])
+
+    def test_batched_seasons(self):
+        """Test scoring several seasons of pre-stacked box scores at once"""
+        engine = ScoringEngine()
+        rng = np.random.default_rng(7)
+        box_scores = rng.integers(0, 5, size=(3, 50, 17, len(engine.stat_columns)))
+
+        season_points = engine.score_seasons(box_scores)
+
+        assert season_points.shape == (3, 50)
+        expected = sum(box_scores[1, 10, :, i].sum() * w for i, w in enumerate(engine.weights))
+        assert np.isclose(season_points[1, 10], expected)
+
+    def test_rule_change(self):
+        engine = ScoringEngine()
+        full_ppr = engine.with_rules(reception=1.0)
+        stats = {'reception': np.array([[10]])}
+
+        assert engine.score_seasons(stats)[0] == 5.0
+        assert full_ppr.score_seasons(stats)[0] == 10.0
+
+    def test_unknown_stat(self):
+        with pytest.raises(ValueError, match="Unknown stat columns"):
+            ScoringEngine().score_weeks({'sacks': np.zeros((1, 1))})
+
+    def test_apply_season_points(self):
+        engine = ScoringEngine()
+        players = [Player("Rusher", "SF", "RB"), Player("Backup", "SF", "RB")]
+        stats = {'rushing_yards': np.array([[100, 50], [10, 0]]),
+                 'rushing_td': np.array([[1, 0], [0, 0]])}
+
+        engine.apply_season_points(players, stats)
+
+        assert players[0].fantasy_points == pytest.approx(21.0)
+        assert players[1].fantasy_points == pytest.approx(1.0)
+
+
+class TestSeasonSimulator:
+    """Test Monte Carlo season simulation"""
+
+    def test_round_robin_schedule(self):
+        schedule = round_robin_schedule(12, 14)
+
+        assert schedule.shape == (14, 6, 2)
+        for week in schedule:
+            # Every team plays exactly once a week
+            assert sorted(week.ravel().tolist()) == list(range(12))
+
+        # First 11 weeks cover every pairing exactly once
+        pairings = {tuple(sorted(game)) for week in schedule[:11] for game in week.tolist()}
+        assert len(pairings) == 66
+
+    def test_odd_team_count_rejected(self):
+        with pytest.raises(ValueError, match="even number of teams"):
+            round_robin_schedule(5, 14)
+
+    def test_odds_are_consistent(self):
+        odds = SeasonSimulator(build_league(), seed=42).run(2_000, workers=1)
+
+        assert sum(o['playoff_odds'] for o in odds.values()) == pytest.approx(6.0)
+        assert sum(o['lottery_odds'] for o in odds.values()) == pytest.approx(6.0)
+        assert sum(o['first_pick_odds'] for o in odds.values()) == pytest.approx(1.0)
+        assert sum(o['expected_wins'] for o in odds.values()) == pytest.approx(12 * 14 / 2)
+
+        # Strongest roster should make the playoffs far more often than the weakest
+        assert odds["Team 12"]['playoff_odds'] > odds["Team 1"]['playoff_odds']
+        assert odds["Team 1"]['first_pick_odds'] > odds["Team 12"]['first_pick_odds']
+
+    def test_deterministic_across_workers(self):
+        simulator = SeasonSimulator(build_league(), seed=7, chunk_size=500)
+
+        assert simulator.run(2_000, workers=1) == simulator.run(2_000, workers=2)
+
+
+class TestLineupOptimizer:
+    """Test exact starting lineup selection"""
+
+    def test_solve_assignment(self):
+        cost = [[4, 1, 3],
+                [2, 0, 5]]
+        # Row 0 -> col 1 (1) + row 1 -> col 0 (2) beats row 1 -> col 1
+        assert solve_assignment(cost) == [1, 0]
+
+    def test_flex_slots(self):
+        """Test that flex slots take the best leftover RB/WR/TE"""
+        players = [Player(f"QB{i}", "KC", "QB") for i in range(2)]
+        players += [Player(f"RB{i}", "KC", "RB") for i in range(4)]
+        players += [Player(f"WR{i}", "KC", "WR") for i in range(4)]
+        players += [Player(f"TE{i}", "KC", "TE") for i in range(3)]
+        points = [300, 200, 150, 140, 130, 10, 120, 110, 100, 20, 90, 80, 70]
+
+        lineup = LineupOptimizer().optimize(players, points)
+        starters = {slot: [] for slot, _, _ in lineup}
+        for slot, player, _ in lineup:
+            starters[slot].append(player.name)
+
+        assert starters['QB'] == ["QB0"]
+        assert sorted(starters['RB']) == ["RB0", "RB1"]
+        assert sorted(starters['WR']) == ["WR0", "WR1", "WR2"]
+        assert starters['TE'] == ["TE0"]
+        # RB2 (130) takes RB/WR flex; TE1 (80) beats WR3 (20) for WR/TE flex
+        assert starters['FLEX_RB_WR'] == ["RB2"]
+        assert starters['FLEX_WR_TE'] == ["TE1"]
+        assert lineup_points(lineup) == 300 + 150 + 140 + 120 + 110 + 100 + 90 + 130 + 80
+
+    def test_empty_slots(self):
+        """Test that slots without an eligible player are left empty"""
+        lineup = LineupOptimizer().optimize([Player("Lone QB", "KC", "QB")], [20.0])
+
+        filled = [(slot, player.name) for slot, player, _ in lineup if player]
+        assert filled == [('QB', "Lone QB")]
+        assert len(lineup) == 9
+
+    def test_optimize_league(self):
+        league = build_league()
+        weeks = 17 # regular season + playoffs
+
+        lineups = LineupOptimizer().optimize_league(league.teams)
+
+        assert len(lineups) == 12
+        assert all(len(team_weeks) == weeks for team_weeks in lineups.values())
+        strongest = lineups["Team 12"][0]
+        assert lineup_points(strongest) == pytest.approx(sum(p.fantasy_points for p in
+                                                             league.teams[-1].roster['active']) / weeks)
+
+    def test_starting_lineup_players(self):
+        team = build_league(num_teams=1).teams[0]
+        team.add_player(Player("Kicker", "KC", "K", contract=Contract("Kicker", 1.0, 1)))
+
+        starters = team.get_starting_lineup_players()
+
+        assert len(starters) == 9
+        assert all(p.position != "K" for p in starters)
+
+
+class TestLeagueAnalytics:
+    """Test single-pass top performer aggregation"""
+
+    def test_matches_full_sort(self):
+        """Test that bounded heaps give the same answer as sorting every list"""
+        rng = random.Random(3)
+        league = League(2025)
+        for t in range(12):
+            team = Team(f"Team {t+1}")
+            league.add_team(team)
+            for i in range(20):
+                name = f"Player {t}-{i}"
+                player = Player(name, "KC", rng.choice(["QB", "RB", "WR", "TE", "K"]),
+                                contract=Contract(name, rng.randint(1, 60), 2))
+                # Coarse points so ties are common
+                player.fantasy_points = float(rng.randint(0, 20) * 10)
+                team.add_player(player)
+
+        averages, top = summarize_top_performers(league.teams)
+
+        for position, k in {"QB": 5, "TE": 5, "RB": 10, "WR": 15}.items():
+            everyone = [p for team in league.teams for roster in team.roster.values()
+                        for p in roster if p.position == position]
+            expected = sorted(everyone, key=lambda p: p.fantasy_points, reverse=True)[:k]
+            assert top[position] == expected
+            assert averages[position] == pytest.approx(
+                    sum(p.contract.current_salary for p in expected) / len(expected))
+        assert "K" not in top
+
+    def test_custom_thresholds(self):
+        league = build_league(num_teams=2)
+
+        averages, top = summarize_top_performers(league.teams, {"QB": 1, "TE": 0})
+
+        assert [p.name for p in top["QB"]] == ["Player 1-0"]
+        assert averages == {"QB": 10.0}
+        assert "TE" not in top
+
+
+class TestCapProjection:
+    """Test vectorized multi-year cap projections"""
+
+    def build_team(self):
+        team = Team("Test Team")
+        starter = Player("Starter", "KC", "QB", contract=Contract("Starter", 100.0, 4))
+        rookie = Player("Rookie", "KC", "WR", contract=Contract("Rookie", 40.0, 2, is_rookie=True))
+        team.add_player(starter)
+        team.add_player(rookie, 'practice_squad')
+        return team, starter, rookie
+
+    def test_salary_schedule_matches_contract(self):
+        team, starter, _ = self.build_team()
+        projection = CapProjection([team], horizon=5)
+        row = projection.players.index(starter)
+
+        expected = []
+        contract = Contract("Copy", 100.0, 4)
+        for _ in range(5):
+            expected.append(contract.current_salary if contract.years_remaining > 0 else 0.0)
+            if contract.years_remaining > 0:
+                contract.advance_year()
+
+        assert projection.salary_schedule()[:, row] == pytest.approx(expected)
+
+    def test_tagged_contracts_get_no_raise(self):
+        team = Team("Test Team")
+        tagged = Player("Tagged", "KC", "WR", contract=Contract("Tagged", 30.0, 1))
+        team.add_player(tagged)
+        team.tag_player(tagged, 60.0)
+        projection = CapProjection([team], horizon=3)
+
+        assert projection.salary_schedule()[:, 0] == pytest.approx([60.0, 60.0, 0.0])
+        tagged.contract.advance_year()
+        assert tagged.contract.current_salary == 60.0
+
+    def test_dead_money_cliffs(self):
+        team, starter, _ = self.build_team()
+        projection = CapProjection([team])
+        row = projection.players.index(starter)
+
+        dead = projection.dead_money_schedule()[:, row]
+
+        # 4yr: 100%, 3yr: 75%, 2yr: 50%, 1yr: nothing, then expired
+        assert dead == pytest.approx([100.0, 90.0, 72.0, 0.0, 0.0])
+        assert dead[0] == starter.contract.calculate_dead_money_penalty()
+
+    def test_cap_space(self):
+        team, starter, rookie = self.build_team()
+        projection = CapProjection([team], horizon=3)
+
+        space = projection.cap_space()[:, 0]
+
+        # Year 0: 100 active + 40 * 0.25 on PS
+        assert space[0] == pytest.approx(team.get_remaining_cap())
+        assert space[1] == pytest.approx(1006 * 1.05 - 120.0 - 12.0)
+        assert space[2] == pytest.approx(1006 * 1.05 ** 2 - 144.0) # Rookie deal is over
+
+    def test_what_if_moves_and_extensions(self):
+        team, starter, rookie = self.build_team()
+        other = Team("Other Team")
+        projection = CapProjection([team, other], horizon=2)
+        base = projection.cap_space()
+
+        traded = projection.cap_space(moves={starter: "Other Team"})
+        assert traded[:, 0] - base[:, 0] == pytest.approx([100.0, 120.0])
+        assert traded[:, 1] - base[:, 1] == pytest.approx([-100.0, -120.0])
+
+        cut = projection.cap_space(moves={starter: None})
+        assert cut[:, 0] - base[:, 0] == pytest.approx([0.0, 20.0]) # 100% dead money stays
+
+        extended = projection.cap_space(extensions={starter: 2})
+        assert base[:, 0] - extended[:, 0] == pytest.approx([20.0, 24.0])
+
+        rookie.contract.has_been_extended = True
+        with pytest.raises(ValueError, match="not eligible"):
+            CapProjection([team, other]).cap_space(extensions={rookie: 1})
+
+    def test_projection_does_not_mutate(self):
+        league = build_league()
+        before = [t.get_total_salary_used() for t in league.teams]
+        player = league.teams[0].roster['active'][0]
+
+        CapProjection(league.teams).cap_space(moves={player: "Team 2"}, extensions={player: 3})
+
+        assert [t.get_total_salary_used() for t in league.teams] == before
+        assert player.fantasy_team == "Team 1"
+        assert not player.contract.has_been_extended
+
+
+class TestTradeService:
+    """Test trade validation, execution and the trade finder"""
+
+    def build_swap_league(self):
+        """Two teams that each have a spare player the other needs"""
+        league = League(2025)
+        qb_heavy, te_heavy = Team("QB Heavy"), Team("TE Heavy")
+        league.add_team(qb_heavy)
+        league.add_team(te_heavy)
+
+        # The TE heavy team starts two TEs thanks to the WR/TE flex, so it needs a third spare
+        for team, spares, needed in ((qb_heavy, ["QB"] * 2, "TE"), (te_heavy, ["TE"] * 3, "QB")):
+            for i, position in enumerate(spares + [needed, "RB", "RB", "WR", "WR", "WR"]):
+                name = f"{team.name} {position}{i}"
+                player = Player(name, "KC", position, contract=Contract(name, 20.0, 3))
+                player.fantasy_points = 200.0 if position == spares[0] else 50.0
+                team.add_player(player)
+        return league, qb_heavy, te_heavy
+
+    def test_validate(self):
+        league, qb_heavy, te_heavy = self.build_swap_league()
+        service = TradeService(league)
+        qb, te = qb_heavy.roster['active'][1], te_heavy.roster['active'][1]
+
+        assert service.validate(Trade(qb_heavy, te_heavy, [qb], [te])) == []
+        assert "is not on" in service.validate(Trade(qb_heavy, te_heavy, [te], [qb]))[0]
+
+        te_heavy.salary_cap = te_heavy.get_total_salary_used()
+        errors = service.validate(Trade(qb_heavy, te_heavy, [qb], []))
+        assert errors == ["TE Heavy would be $20.00 over the cap"]
+
+    def test_roster_limits(self):
+        league = build_league(num_teams=2, players_per_team=26)
+        service = TradeService(league)
+        team_a, team_b = league.teams
+        player = team_a.roster['active'][0]
+
+        errors = service.validate(Trade(team_a, team_b, [player], []))
+        assert errors == ["Team 2 active roster would be over the limit"]
+        assert service.validate(Trade(team_a, team_b, [player], [team_b.roster['active'][0]])) == []
+
+    def test_execute(self):
+        league, qb_heavy, te_heavy = self.build_swap_league()
+        service = TradeService(league)
+        qb, te = qb_heavy.roster['active'][1], te_heavy.roster['active'][1]
+        salary_before = qb_heavy.get_total_salary_used()
+
+        result = service.execute(Trade(qb_heavy, te_heavy, [qb], [te]))
+
+        assert result['value'] == pytest.approx(150.0)
+        assert qb.fantasy_team == "TE Heavy" and qb in te_heavy.roster['active']
+        assert te.fantasy_team == "QB Heavy" and te in qb_heavy.roster['active']
+        assert qb_heavy.dead_money == 0
+        assert qb_heavy.get_total_salary_used() == pytest.approx(salary_before)
+        assert league.players.query(fantasy_team="TE Heavy", position="QB")[-1] is qb
+
+        with pytest.raises(ValueError, match="Invalid trade"):
+            service.execute(Trade(qb_heavy, te_heavy, [qb], []))
+
+    def test_execute_rolls_back(self, monkeypatch):
+        league, qb_heavy, te_heavy = self.build_swap_league()
+        qb, te = qb_heavy.roster['active'][1], te_heavy.roster['active'][1]
+        rosters = {team.name: {k: list(v) for k, v in team.roster.items()} for team in league.teams}
+        salaries = [team.get_total_salary_used() for team in league.teams]
+
+        receive = Team.receive_traded_player
+        failed = []
+        def fail_second_team(team, player, roster_type):
+            if team is te_heavy and not failed:
+                failed.append(player)
+                raise RuntimeError("boom")
+            receive(team, player, roster_type)
+        monkeypatch.setattr(Team, 'receive_traded_player', fail_second_team)
+
+        with pytest.raises(RuntimeError):
+            TradeService(league).execute(Trade(qb_heavy, te_heavy, [qb], [te]))
+
+        monkeypatch.setattr(Team, 'receive_traded_player', receive)
+        for team in league.teams:
+            assert {k: set(map(id, v)) for k, v in team.roster.items()} == \
+                   {k: set(map(id, v)) for k, v in rosters[team.name].items()}
+        assert [team.get_total_salary_used() for team in league.teams] == pytest.approx(salaries)
+        assert qb.fantasy_team == "QB Heavy" and te.fantasy_team == "TE Heavy"
+
+    def test_evaluate_does_not_mutate(self):
+        league, qb_heavy, te_heavy = self.build_swap_league()
+        qb, te = qb_heavy.roster['active'][1], te_heavy.roster['active'][1]
+
+        results = TradeService(league).evaluate([Trade(qb_heavy, te_heavy, [qb], [te]),
+                                                 Trade(qb_heavy, te_heavy, [te], [])])
+
+        assert results[0]['errors'] == [] and results[0]['score']['value'] == pytest.approx(150.0)
+        assert results[1]['score'] is None
+        assert qb.fantasy_team == "QB Heavy" and te.fantasy_team == "TE Heavy"
+
+    def test_find_trades(self):
+        league, qb_heavy, te_heavy = self.build_swap_league()
+
+        found = TradeService(league).find_trades()
+
+        values = [result['score']['value'] for result in found]
+        assert values == sorted(values, reverse=True) and min(values) > 0
+
+        # Best deals swap either spare QB for any spare TE, helping both teams by 150
+        for result in found[:6]:
+            trade = result['trade']
+            assert [p.position for p in trade.players_a] == ["QB"]
+            assert [p.position for p in trade.players_b] == ["TE"]
+            assert result['score']['value'] == pytest.approx(150.0)
+        assert found[6]['score']['value'] < 150.0
+
+        assert TradeService(league).find_trades(max_players=2, limit=1)[0]['score']['value'] >= 150.0
+
+
+class TestAuctionDraft:
+    """Test the free agent auction engine"""
+
+    def build_auction_league(self, num_teams=4, pool_size=120):
+        league = League(2025)
+        for t in range(num_teams):
+            league.add_team(Team(f"Team {t+1}"))
+
+        positions = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "K"]
+        rng = random.Random(7)
+        players = []
+        for i in range(pool_size):
+            player = Player(f"FA {i}", "KC", positions[i % len(positions)])
+            player.fantasy_points = rng.uniform(20, 350)
+            players.append(player)
+        league.add_free_agents(players)
+        return league
+
+    def test_value_curve(self):
+        league = self.build_auction_league()
+        curve = ValueCurve(league.free_agents, 4, budget=4024, roster_slots=104, min_bid=1.0)
+
+        assert curve.values.min() == 1.0
+        assert curve.values.sum() == pytest.approx(120 * 1.0 + (4024 - 104 * 1.0))
+        kickers = [curve.value_of(p) for p in league.free_agents if p.position == "K"]
+        assert kickers == [1.0] * len(kickers)
+
+    def test_max_bid_reserves_open_slots(self):
+        league = self.build_auction_league()
+        auction = AuctionDraft(league)
+        team = league.teams[0]
+
+        assert auction.max_bid(team) == 1006 - 25 * 1.0
+
+    def test_full_auction(self):
+        league = self.build_auction_league()
+        sales = AuctionDraft(league, seed=1).run()
+
+        assert len(sales) == 104
+        assert len(league.free_agents) == 16
+        for team in league.teams:
+            assert len(team.roster['active']) == 26
+            assert team.is_salary_cap_compliant()
+        sale = sales[0]
+        assert sale['player'].contract.current_salary == sale['price']
+        assert sale['player'].contract.years_remaining == 3
+        assert sale['player'].fantasy_team == sale['team'].name
+
+    def test_apply_is_all_or_nothing(self):
+        league = self.build_auction_league()
+        auction = AuctionDraft(league, seed=1)
+        sales = auction.run(apply=False)
+        league.teams[-1].dead_money = league.teams[-1].get_remaining_cap() - 1.0
+
+        with pytest.raises(ValueError, match="Cannot afford"):
+            auction._apply(sales)
+        assert len(league.free_agents) == 120
+        assert all(p.contract is None and p.fantasy_team is None for p in league.free_agents)
+        assert all(not team.roster['active'] for team in league.teams)
+
+    def test_starter_needs_round_up(self):
+        league = self.build_auction_league()
+        auction = AuctionDraft(league)
+        team = league.teams[0]
+
+        # RB 2 + half a flex, WR 3 + two half flexes, TE 1 + half a flex
+        needs = [auction.starters_needed(team, position) for position in ("QB", "RB", "WR", "TE")]
+        assert needs == [1, 3, 4, 2]
+
+    def test_nomination_order(self):
+        league = self.build_auction_league()
+        league.auction_nomination_order = list(reversed(league.teams))
+
+        sales = AuctionDraft(league, seed=1).run(apply=False, max_lots=5)
+
+        assert [s['nominated_by'].name for s in sales] == ["Team 4", "Team 3", "Team 2", "Team 1", "Team 4"]
+
+    def test_mock_auction_does_not_mutate(self):
+        league = self.build_auction_league()
+        sales = AuctionDraft(league, seed=1).run(apply=False)
+
+        assert len(sales) == 104
+        assert len(league.free_agents) == 120
+        assert all(p.contract is None and p.fantasy_team is None for p in league.free_agents)
+        assert all(team.get_total_salary_used() == 0 for team in league.teams)
+
+    def test_human_bidder(self):
+        league = self.build_auction_league()
+        target = min(league.free_agents, key=lambda p: p.fantasy_points)
+        human = HumanBidder(nominate=lambda auction, team: target,
+                            bid_limit=lambda auction, team, player, max_bid: 500.0 if player is target else 0.0)
+
+        sales = AuctionDraft(league, bidders={"Team 1": human}, seed=1).run(max_lots=1)
+
+        # Bots value the worst player at the minimum, so one increment over it wins
+        assert sales[0]['team'].name == "Team 1"
+        assert sales[0]['price'] == 2.0
+        assert target.fantasy_team == "Team 1"
+
+    def test_mock_auctions(self):
+        league = self.build_auction_league()
+        results = mock_auctions(league, runs=20, seed=3)
+
+        best = max(league.free_agents, key=lambda p: p.fantasy_points if p.position != "K" else 0)
+        assert results[best.name]['sold_rate'] == 1.0
+        assert results[best.name]['avg_price'] > 50
+        assert all(0 <= r['sold_rate'] <= 1 for r in results.values())
+
+
+class TestRookieDraft:
+    """Test the rookie lottery and draft"""
+
+    def build_rookies(self, count):
+        positions = ["QB", "RB", "WR", "TE"]
+        rookies = []
+        for i in range(count):
+            rookie = Player(f"Rookie {i}", "KC", positions[i % len(positions)], rank=i + 1)
+            rookies.append(rookie)
+        return rookies
+
+    def test_exact_lottery_odds(self):
+        odds = lottery_odds([30, 22, 18, 14, 10, 6])
+
+        assert odds[:, 0] == pytest.approx([0.30, 0.22, 0.18, 0.14, 0.10, 0.06])
+        assert odds.sum(axis=0) == pytest.approx([1.0] * 6)
+        assert odds.sum(axis=1) == pytest.approx([1.0] * 6)
+        # Worst seed can't fall past sixth, so it lands there least often
+        assert odds[0, 5] == min(odds[:, 5])
+
+    def test_simulated_lottery_odds(self):
+        simulated = simulate_lottery_odds([30, 22, 18, 14, 10, 6], draws=200_000, seed=1, batch_size=50_000)
+
+        assert simulated.sum(axis=1) == pytest.approx([1.0] * 6)
+        assert np.abs(simulated - lottery_odds([30, 22, 18, 14, 10, 6])).max() < 0.01
+
+    def test_draft_order_small_league(self):
+        teams = [Team(f"Team {i+1}") for i in range(4)]
+        for i, team in enumerate(teams):
+            team.wins = i
+
+        order = determine_draft_order(teams, random.Random(3))
+
+        assert sorted(t.name for t in order) == [t.name for t in teams]
+
+    def test_draft_order_champion_last(self):
+        teams = [Team(f"Team {i+1}") for i in range(12)]
+        for i, team in enumerate(teams):
+            team.wins = i
+
+        order = determine_draft_order(teams, random.Random(3))
+
+        assert [t.wins for t in order[6:]] == [6, 7, 8, 9, 10, 11]
+        assert sorted(t.wins for t in order[:6]) == [0, 1, 2, 3, 4, 5]
+
+    def test_full_draft(self):
+        league = build_league(num_teams=4, players_per_team=9)
+        league._determine_rookie_draft_order()
+        rookies = self.build_rookies(30)
+
+        picks = RookieDraft(league, rookies).run()
+
+        assert len(picks) == 20 # 5 rounds x 4 teams
+        assert [p['player'].name for p in picks[:4]] == ["Rookie 0", "Rookie 1", "Rookie 2", "Rookie 3"]
+        assert [p['team'] for p in picks[:4]] == league.rookie_draft_order
+        first, last = picks[0]['player'], picks[-1]['player']
+        assert first.contract.is_rookie and first.contract.years_remaining == 3
+        assert first.contract.current_salary == 10.0 and last.contract.current_salary == 1.0
+        assert first.fantasy_team == picks[0]['team'].name
+        # Undrafted rookies become free agents
+        assert len(league.free_agents) == 10
+        assert all(p.is_available() for p in league.free_agents)
+
+    def test_full_roster_uses_practice_squad(self):
+        league = build_league(num_teams=2, players_per_team=26)
+        league._determine_rookie_draft_order()
+
+        picks = RookieDraft(league, self.build_rookies(10)).run()
+
+        assert all(p['roster_type'] == 'practice_squad' for p in picks)
+        assert all(len(team.roster['practice_squad']) == 5 for team in league.teams)
+
+    def test_mock_draft_and_pickers(self):
+        league = build_league(num_teams=4, players_per_team=9)
+        league._determine_rookie_draft_order()
+        rookies = self.build_rookies(30)
+        first_team = league.rookie_draft_order[0]
+        wants_te = lambda draft, team: next(p for p in draft.available() if p.position == "TE")
+
+        picks = RookieDraft(league, rookies, pickers={first_team.name: wants_te}).run(apply=False)
+
+        assert picks[0]['player'].name == "Rookie 3"
+        assert picks[1]['player'].name == "Rookie 0"
+        assert all(r.contract is None and r.fantasy_team is None for r in rookies)
+        assert league.free_agents == []
+
+
+class TestOffseasonEngine:
+    """Test the batched offseason against League.advance_season"""
+
+    def build_dynasty(self):
+        """A league with staggered contracts, uneven pay and a retired player"""
+        league = build_league()
+        for t, team in enumerate(league.teams):
+            for i, player in enumerate(team.roster['active']):
+                player.contract = Contract(player.name, 1.0 + 4 * ((7 * t + i) % 9), 1 + (t + i) % 5)
+                if (t + i) % 10 == 0 and t % 3 == 1:
+                    player.contract.apply_tag(30.0, transition=t % 2 == 0)
+            team.rebuild_cap_ledger()
+        league.teams[0].roster['active'][0].retire()
+        return league
+
+    def between_seasons(self, league, season):
+        """New stats, a new free agent class and contracts for everyone who fits"""
+        rng = random.Random(season)
+        for player in league.players:
+            player.fantasy_points = float(rng.randint(0, 30) * 10) # Ties on purpose
+        league.add_free_agents([Player(f"Rookie {season}-{i}", "KC", ["QB", "RB", "WR", "TE"][i % 4])
+                                for i in range(8)])
+
+        for team in league.teams:
+            if len(team.roster['active']) < 9:
+                player = next(p for p in league.free_agents if p.is_available())
+                player.set_contract(Contract(player.name, rng.uniform(1, 30), rng.randint(1, 5)))
+                team.add_player(player)
+                league.free_agents.remove(player)
+
+    def state(self, league):
+        teams = {team.name: (sorted((p.name, p.roster_status, p.contract.years_remaining,
+                                     round(p.contract.current_salary, 9), p.is_holdout, p.holdout_demands)
+                                    for roster_list in team.roster.values() for p in roster_list),
+                             team.salary_cap, round(team.get_total_salary_used(), 9))
+                 for team in league.teams}
+        return (league.season_year, league.current_phase, league.current_salary_cap, teams,
+                [p.name for p in league.free_agents], [t.name for t in league.rookie_draft_order],
+                {p.name: p.position_rank_end_of_season for p in league.players},
+                league.season_rankings.order)
+
+    def test_matches_advance_season(self, capsys):
+        reference, batched = self.build_dynasty(), self.build_dynasty()
+        engine = OffseasonEngine(batched)
+        holdouts = 0
+
+        for season in range(8):
+            self.between_seasons(reference, season)
+            random.seed(season)
+            reference.advance_season()
+            expected_output = capsys.readouterr().out
+
+            self.between_seasons(batched, season)
+            random.seed(season)
+            result = engine.advance_season()
+            assert capsys.readouterr().out == expected_output
+
+            assert self.state(batched) == self.state(reference)
+            assert result['season_year'] == batched.season_year
+            holdouts += len(result['holdouts'])
+
+        assert holdouts > 0
+
+    def test_run_seasons(self):
+        league = self.build_dynasty()
+        seasons = OffseasonEngine(league, verbose=False).run(6, before_offseason=lambda lg: lg.simulate_season_stats())
+
+        assert [s['season_year'] for s in seasons] == list(range(2026, 2032))
+        assert sum(len(s['expired']) for s in seasons) == 12 * 9
+        assert all(not team.roster['active'] for team in league.teams)
+        assert len(league.free_agents) == 12 * 9 - 1 # The retired player doesn't come back
+
+    def test_expired_contract_on_roster(self):
+        league = build_league(num_teams=2)
+        league.teams[0].roster['active'][0].contract.years_remaining = 0
+
+        with pytest.raises(ValueError, match="already expired"):
+            OffseasonEngine(league, verbose=False).advance_season()
+
+
+class TestTagRound:
+    """Test franchise and transition tags and bidding on tagged players"""
+
+    def build(self):
+        league = build_league(num_teams=4)
+        for team in league.teams:
+            for player in team.roster['active'][:3]: # QB, RB, RB
+                player.contract.years_remaining = 1
+        return league, league.teams
+
+    def roll_over(self, league):
+        OffseasonEngine(league, verbose=False).advance_season()
+
+    def test_tag_keeps_player_a_season(self):
+        league, (a, *_) = self.build()
+        qb, rb = a.roster['active'][:2]
+        tags = TagRound(league)
+        used = a.get_total_salary_used()
+
+        franchise = tags.tag(a, qb)
+        transition = tags.tag(a, rb, 'transition')
+
+        qb_avg = tags.position_averages['QB']
+        assert franchise.salary == max(qb_avg, 10.0 * 1.2) == qb.contract.current_salary
+        assert transition.salary == max(tags.position_averages['RB'], 11.0 * 1.2) == rb.contract.current_salary
+        assert qb.contract.is_franchise_tagged and rb.contract.is_transition_tagged
+        assert not qb.contract.is_eligible_for_extension()
+        assert a.get_total_salary_used() == pytest.approx(used + franchise.salary - 10.0 + transition.salary - 11.0)
+
+        self.roll_over(league)
+
+        # The tag salary is the tag season's salary, with no raise on top
+        assert qb.fantasy_team == "Team 1" and qb.contract.years_remaining == 1
+        assert qb.contract.current_salary == franchise.salary
+
+        results = tags.resolve()
+        assert [(r['player'], r['team'], r['salary'], r['offer']) for r in results] == [
+            (qb, a, franchise.salary, None), (rb, a, transition.salary, None)]
+
+    def test_match_and_decline(self):
+        league, (a, b, c, d) = self.build()
+        qb, rb = a.roster['active'][:2]
+        other_qb = b.roster['active'][0]
+        tags = TagRound(league)
+        tags.tag(a, qb)
+        tags.tag(a, rb, 'transition')
+        tags.tag(b, other_qb)
+        self.roll_over(league)
+
+        tags.offer(c, qb, 40.0, 3)
+        tags.offer(d, qb, 45.0, 2)
+        tags.offer(c, rb, 2.0, 4) # Transition tags take any offer
+        tags.offer(c, other_qb, 50.0, 2)
+        dead_money = a.dead_money
+
+        results = tags.resolve(match=lambda tag, offer: tag.team is a and offer.salary >= 40.0)
+        matched, declined, moved = [(r['team'], r['offer'].team, r['matched']) for r in results]
+
+        assert matched == (a, d, True)
+        assert (qb.contract.current_salary, qb.contract.years_remaining) == (45.0, 2)
+        assert not qb.contract.is_franchise_tagged
+        assert declined == (c, c, False) and rb.fantasy_team == "Team 3"
+        assert (rb.contract.current_salary, rb.contract.years_remaining) == (2.0, 4)
+        assert moved == (c, c, False) and other_qb in c.roster['active']
+        assert a.dead_money == dead_money # Tagged players leave without dead money
+        assert all(team.is_salary_cap_compliant() for team in league.teams)
+
+    def test_offer_falls_through_when_bidder_cannot_pay(self):
+        league, (a, b, c, _) = self.build()
+        qb = a.roster['active'][0]
+        tags = TagRound(league)
+        tags.tag(a, qb)
+        self.roll_over(league)
+
+        tags.offer(b, qb, 60.0)
+        tags.offer(c, qb, 30.0)
+        b.dead_money = b.get_remaining_cap() - 1.0
+
+        result, = tags.resolve(match=lambda tag, offer: False)
+
+        assert result['offer'].team is c and result['team'] is c
+
+    def test_invalid_tags_and_offers(self):
+        league, (a, b, _, _) = self.build()
+        qb, rb, other_rb = a.roster['active'][0], a.roster['active'][1], a.roster['active'][2]
+        tags = TagRound(league)
+
+        with pytest.raises(ValueError, match="Only expiring"):
+            tags.tag(a, a.roster['active'][3])
+        with pytest.raises(ValueError, match="not on your team"):
+            tags.tag(b, qb)
+        with pytest.raises(ValueError, match="must be one of"):
+            tags.tag(a, qb, 'exclusive')
+
+        tag = tags.tag(a, qb)
+        tags.tag(a, rb, 'transition')
+        with pytest.raises(ValueError, match="already tagged"):
+            tags.tag(a, qb)
+        with pytest.raises(ValueError, match="no transition tags left"):
+            tags.tag(a, other_rb, 'transition')
+        with pytest.raises(ValueError, match="own tagged player"):
+            tags.offer(a, qb, 50.0)
+        with pytest.raises(ValueError, match="at least"):
+            tags.offer(b, qb, tag.salary - 1)
+        with pytest.raises(ValueError, match="not tagged"):
+            tags.offer(b, other_rb, 50.0)
+        with pytest.raises(ValueError, match="after the season rolls over"):
+            tags.resolve()
+
+        self.roll_over(league)
+        with pytest.raises(ValueError, match="before the season rolls over"):
+            tags.tag(b, b.roster['active'][0])
+
+
+class TestCapComplianceSolver:
+    """Test the cheapest fixes for over-cap teams"""
+
+    def build(self, overages):
+        league = build_league(num_teams=len(overages))
+        for team, overage in zip(league.teams, overages):
+            for i, player in enumerate(team.roster['active']):
+                player.contract.years_remaining = 1 + i % 4
+                player.fantasy_points = float((37 * i) % 50)
+            team.dead_money = team.get_remaining_cap() + overage
+        return league
+
+    def brute_force(self, solver, team):
+        """Least value lost over every combination of moves, one per player"""
+        options = solver.moves(team)
+        players = list({id(p): p for p, _, _, _ in options}.values())
+        overage = team.get_total_salary_used() - team.salary_cap
+        best = None
+        for picks in itertools.product(*[[None] + [o for o in options if o[0] is p] for p in players]):
+            moves = [o for o in picks if o is not None]
+            if sum(o[2] for o in moves) >= overage - 1e-9:
+                value = sum(o[3] for o in moves)
+                best = value if best is None else min(best, value)
+        return best
+
+    def test_cheapest_fix(self):
+        league = self.build([0.0, 15.0, 42.5])
+        solver = CapComplianceSolver(league, resolution=0.01) # Fine enough to match brute force exactly
+
+        plans = solver.solve(workers=1)
+
+        assert [plan['team'].name for plan in plans] == ["Team 2", "Team 3"]
+        for plan in plans:
+            assert plan['feasible'] and plan['savings'] >= plan['overage']
+            assert plan['value_lost'] == pytest.approx(self.brute_force(solver, plan['team']))
+
+            solver.apply(plan)
+            assert plan['team'].is_salary_cap_compliant()
+        cut = [m['player'] for plan in plans for m in plan['moves'] if m['move'] == 'cut']
+        assert all(p in league.free_agents for p in cut)
+
+    def test_moves(self):
+        league = self.build([10.0])
+        team = league.teams[0]
+        qb, rb, rookie = team.roster['active'][:3]
+        rookie.contract.is_rookie = True
+        qb.is_holdout, qb.holdout_demands = True, 30.0
+        team.move_player(rb, 'IR')
+
+        moves = {(p.name, move): savings for p, move, savings, _ in CapComplianceSolver(league).moves(team)}
+
+        assert moves[(qb.name, 'reject_holdout')] == pytest.approx(10.0 * 0.75)
+        assert moves[(rookie.name, 'practice_squad')] == pytest.approx(12.0 * 0.75)
+        assert moves[(qb.name, 'IR')] == pytest.approx(10.0 * 0.5)
+        assert (rb.name, 'IR') not in moves
+        assert (rb.name, 'cut') not in moves # Dead money would cost as much as IR does
+
+        plan, = CapComplianceSolver(league, value=lambda p, move: 0.0 if move == 'reject_holdout' else 100.0).solve()
+        assert any(m['move'] == 'reject_holdout' for m in plan['moves'])
+        CapComplianceSolver(league).apply(plan)
+        assert qb.roster_status == 'practice_squad' and qb in team.roster['practice_squad']
+        assert team.is_salary_cap_compliant()
+
+    def test_large_overage(self):
+        league = build_league(num_teams=1, players_per_team=26)
+        team = league.teams[0]
+        for player in team.roster['active']:
+            player.contract.years_remaining = 1 # Cuts leave no dead money
+        team.dead_money = team.get_remaining_cap() + 300.0
+
+        tracemalloc.start()
+        plan, = CapComplianceSolver(league).solve(workers=1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert plan['feasible'] and plan['savings'] >= plan['overage']
+        assert peak < 2 * 2**20
+        CapComplianceSolver(league).apply(plan)
+        assert team.is_salary_cap_compliant()
+
+    def test_no_fix(self):
+        league = self.build([500.0])
+
+        plan, = CapComplianceSolver(league).solve()
+
+        assert not plan['feasible'] and plan['moves'] == []
+
+    def test_parallel_matches_serial(self):
+        league = self.build([5.0, 20.0, 33.3, 61.0])
+        solver = CapComplianceSolver(league)
+
+        serial = solver.solve(workers=1)
+        parallel = solver.solve(workers=2)
+
+        assert [[(m['player'], m['move']) for m in plan['moves']] for plan in parallel] == \
+            [[(m['player'], m['move']) for m in plan['moves']] for plan in serial]
+
+
+class TestExtensionPlanner:
+    """Test multi-year extension plans"""
+
+    def build_team(self, seed, size=5, dead_money=800.0):
+        rng = random.Random(seed)
+        team = Team("Test Team")
+        for i in range(size):
+            player = Player(f"Player {i}", "KC", "WR",
+                            contract=Contract(f"Player {i}", round(rng.uniform(1, 60), 2), rng.randint(1, 4)))
+            player.fantasy_points = round(rng.uniform(0, 300), 1)
+            team.add_player(player)
+        team.dead_money = dead_money
+        return team
+
+    def test_option_costs_match_projection(self):
+        team = self.build_team(0)
+        planner = ExtensionPlanner(team)
+        projection = CapProjection([team])
+
+        for option in planner.options():
+            player, years = option['player'], option['years']
+            row = projection.players.index(player)
+            extended = projection.salary_schedule({player: years})[:, row]
+            assert option['cost'] == pytest.approx(extended - projection.salary_schedule()[:, row])
+            assert option['points'] == player.fantasy_points * min(years, 5 - player.contract.years_remaining)
+        assert len(planner.options()) == 5 * int(projection.extendable.sum())
+
+    def test_long_contracts_count_seasons_within_horizon(self):
+        team = Team("Test Team")
+        veteran = Player("Veteran", "KC", "QB", contract=Contract("Veteran", 20.0, 4))
+        veteran.fantasy_points = 250.0
+        locked = Player("Locked", "KC", "WR", contract=Contract("Locked", 20.0, 5))
+        locked.fantasy_points = 250.0
+        team.add_player(veteran)
+        team.add_player(locked)
+        planner = ExtensionPlanner(team)
+
+        options = planner.options()
+        assert [o['years'] for o in options if o['player'] is veteran] == [1, 2, 3, 4, 5]
+        assert [o['points'] for o in options if o['player'] is veteran] == [250.0] * 5
+        assert [o['points'] for o in options if o['player'] is locked] == [0.0] * 5
+
+        # Only the fifth season falls inside the horizon, so the shortest extension covers it
+        assert [plan['extensions'] for plan in planner.plan(k=5)] == [{veteran: 1}, {}]
+
+    def test_top_plans_match_brute_force(self):
+        for seed in range(10):
+            team = self.build_team(seed, dead_money=random.Random(seed).uniform(700, 950))
+            planner = ExtensionPlanner(team)
+            space = np.maximum(planner.cap.cap_space()[:, 0], 0.0)
+
+            # Options adding no points, or the same seasons as a shorter one, can't make a new plan
+            by_player = {}
+            for option in planner.options():
+                seen = by_player.setdefault(option['player'].name, [])
+                if option['points'] > 0 and not any(o['points'] == option['points'] and
+                                                    np.allclose(o['cost'], option['cost']) for o in seen):
+                    seen.append(option)
+            totals = []
+            for picks in itertools.product(*[[None] + options for options in by_player.values()]):
+                chosen = [o for o in picks if o is not None]
+                if (sum((o['cost'] for o in chosen), np.zeros(5)) <= space + 1e-9).all():
+                    totals.append(sum(o['points'] for o in chosen))
+
+            plans = planner.plan(k=4)
+            assert [p['points'] for p in plans] == pytest.approx(sorted(totals, reverse=True)[:4])
+            base = planner.cap.cap_space()[:, 0]
+            assert all((base - p['cap_space'] <= space + 1e-9).all() for p in plans)
+
+    def test_future_caps_limit_plans(self):
+        team = Team("Test Team")
+        star = Player("Star", "KC", "QB", contract=Contract("Star", 100.0, 3))
+        star.fantasy_points = 300.0
+        team.add_player(star)
+        team.add_player(Player("Big Deal", "KC", "WR", contract=Contract("Big Deal", 400.0, 5)))
+        # Plenty of room this season, but Big Deal's raises outgrow the cap
+        # and leave $174 in year 4, short of the $207 a kept Star would cost
+        team.dead_money = 300.0
+
+        plans = ExtensionPlanner(team).plan(k=3)
+
+        assert [plan['extensions'] for plan in plans] == [{}]
+        team.dead_money = 200.0 # Room in year 4 but not year 5
+        best, *_ = ExtensionPlanner(team).plan(k=3)
+        assert best['extensions'] == {star: 1}
+        assert best['points_per_dollar'] == pytest.approx(best['points'] / best['cost'])
+
+    def test_apply(self):
+        team = self.build_team(3, dead_money=0.0)
+        planner = ExtensionPlanner(team)
+        best = planner.plan(k=1)[0]
+        years_before = {player: player.contract.years_remaining for player in best['extensions']}
+
+        planner.apply(best)
+
+        assert best['extensions']
+        for player, years in best['extensions'].items():
+            assert player.contract.has_been_extended
+            assert player.contract.years_remaining == years_before[player] + years
+        assert team.get_total_salary_used() == pytest.approx(team._recompute_salary_used())
+
+
+class TestBlindBidding:
+    """Test sealed-bid free agency"""
+
+    def build(self, free_agents=3):
+        league = build_league(num_teams=3)
+        players = [Player(f"Free Agent {i}", "KC", "WR") for i in range(free_agents)]
+        league.add_free_agents(players)
+        return league, league.teams, players
+
+    def test_highest_bid_wins(self):
+        league, (a, b, c), (p1, p2, _) = self.build()
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p1, 20.0, 2)
+        bidding.place_bid(b, p1, 25.0, 1)
+        bidding.place_bid(c, p2, 5.0)
+        bidding.place_bid(a, p2, 5.0) # Tied, but later
+
+        results = bidding.resolve()
+
+        assert [(r['player'], r['team'], r['salary']) for r in results] == [(p1, b, 25.0), (p2, c, 5.0)]
+        assert p1.fantasy_team == "Team 2" and p1.contract.years_remaining == 1
+        assert p1.contract.current_salary == 25.0 and p1.contract.start_year == 2025
+        assert [p.name for p in league.free_agents] == ["Free Agent 2"]
+        assert bidding.bids() == []
+
+    def test_rebid_and_withdraw(self):
+        league, (a, b, _), (p1, _, _) = self.build()
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p1, 30.0)
+        bidding.place_bid(b, p1, 20.0)
+        bidding.place_bid(a, p1, 10.0) # Replaces the $30 bid
+
+        assert len(bidding.bids()) == 2
+        bidding.withdraw_bid(b, p1)
+        with pytest.raises(ValueError, match="has no bid"):
+            bidding.withdraw_bid(b, p1)
+
+        assert bidding.resolve()[0]['salary'] == 10.0
+
+    def test_falls_through_to_next_bidder(self):
+        league, (a, b, c), (p1, p2, _) = self.build()
+        a.dead_money = a.get_remaining_cap() - 50.0 # $50 of room left
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p1, 60.0)
+        bidding.place_bid(b, p1, 40.0)
+        bidding.place_bid(c, p1, 30.0)
+        bidding.place_bid(a, p2, 45.0)
+
+        results = {r['player'].name: r for r in bidding.resolve()}
+
+        assert results["Free Agent 0"]['team'] is b
+        assert results["Free Agent 0"]['passed'] == [a]
+        assert results["Free Agent 1"]['team'] is a # Still fits after losing the bigger bid
+
+    def test_unaffordable_bid_keeps_contract(self):
+        league, (a, _, _), (_, _, p3) = self.build()
+        contract = Contract("Free Agent 2", 5.0, 1)
+        p3.set_contract(contract)
+        a.dead_money = a.get_remaining_cap() - 10.0
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p3, 20.0)
+
+        result, = bidding.resolve()
+
+        assert result['team'] is None and result['passed'] == [a]
+        assert p3.contract is contract and p3 in league.free_agents
+
+    def test_live_cap_across_the_window(self):
+        league, (a, b, _), (p1, p2, _) = self.build()
+        room = a.get_remaining_cap()
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p1, room - 10.0)
+        bidding.place_bid(a, p2, 20.0)
+        bidding.place_bid(b, p2, 15.0)
+
+        results = bidding.resolve()
+
+        # Signing p1 first leaves Team 1 unable to pay p2
+        assert [(r['player'], r['team'], r['passed']) for r in results] == [(p1, a, []), (p2, b, [a])]
+        assert a.is_salary_cap_compliant()
+
+    def test_full_roster_and_unsigned(self):
+        league, (a, _, _), (p1, _, _) = self.build()
+        while len(a.roster['active']) < 26:
+            a.add_player(Player(f"Depth {len(a.roster['active'])}", "KC", "RB",
+                                contract=Contract("Depth", 1.0, 1)))
+        bidding = BlindBidding(league)
+        bidding.place_bid(a, p1, 5.0)
+
+        result, = bidding.resolve()
+
+        assert result['team'] is None and result['passed'] == [a]
+        assert p1.is_available() and p1.contract is None
+        assert p1 in league.free_agents
+
+    def test_invalid_bids(self):
+        league, (a, _, _), (p1, _, _) = self.build()
+        bidding = BlindBidding(league)
+        with pytest.raises(ValueError, match="at least"):
+            bidding.place_bid(a, p1, 0.5)
+        with pytest.raises(ValueError, match="between 1-5 years"):
+            bidding.place_bid(a, p1, 5.0, 6)
+        with pytest.raises(ValueError, match="not in this league"):
+            bidding.place_bid(Team("Outsider"), p1, 5.0)
+        with pytest.raises(ValueError, match="not available"):
+            bidding.place_bid(a, league.teams[1].roster['active'][0], 5.0)
+
+    def test_large_window(self):
+        league = build_league(num_teams=12)
+        pool = [Player(f"Free Agent {i}", "KC", ["QB", "RB", "WR", "TE"][i % 4]) for i in range(400)]
+        league.add_free_agents(pool)
+        rng = random.Random(7)
+        bidding = BlindBidding(league)
+        for team in league.teams:
+            for player in rng.sample(pool, 300):
+                bidding.place_bid(team, player, round(rng.uniform(1, 40), 2), rng.randint(1, 5))
+
+        results = bidding.resolve()
+
+        signed = [r for r in results if r['team'] is not None]
+        assert len(results) == len({id(p) for team in league.teams for p in pool})
+        assert len(signed) == sum(len(team.roster['active']) for team in league.teams) - 12 * 9
+        assert all(len(team.roster['active']) <= 26 and team.is_salary_cap_compliant() for team in league.teams)
+        assert len(league.free_agents) == 400 - len(signed)
+
+
+class TestLeagueFork:
+    """Test copy-on-write league forks"""
+
+    def test_shares_until_touched(self):
+        league = build_league()
+        fork = league.fork()
+        assert fork._copies == {}
+
+        team = fork.team("Team 1")
+        player = team.roster['active'][0]
+        assert team is not league.teams[0] and fork.get_team_by_name("Team 1") is team
+        assert player is not league.teams[0].roster['active'][0]
+        assert player.contract is not league.teams[0].roster['active'][0].contract
+
+        team.remove_player(player)
+        fork.add_free_agent(player)
+        assert len(fork._copies) == 1 + 2 * 9 # Only Team 1, its players and their contracts
+        assert len(league.teams[0].roster['active']) == 9 and league.free_agents == []
+        assert league.teams[0].roster['active'][0].fantasy_team == "Team 1"
+
+        # League-wide reads take ownership of everything first
+        assert not any(a is b for a, b in zip(fork.teams, league.teams))
+        assert fork.free_agents == [player]
+        assert fork.players.get(player.player_id) is player
+        assert league.players.get(player.player_id) is not player
+        assert fork.player(league.teams[0].roster['active'][0]) is player
+
+        with pytest.raises(ValueError, match="Forks can't be forked"):
+            fork.fork()
+
+    def test_diff(self, monkeypatch):
+        monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+        league = build_league()
+        fork = league.fork()
+        team_a, team_b = fork.team("Team 1"), fork.team("Team 2")
+        sent, received = team_a.roster['active'][1], team_b.roster['active'][1]
+        TradeService(fork).execute(Trade(team_a, team_b, [sent], [received]))
+        cut = team_a.roster['active'][0]
+        team_a.remove_player(cut)
+        fork.add_free_agent(cut)
+        team_b.move_player(fork.player(league.teams[1].roster['active'][2]), 'IR')
+
+        diff = fork.diff()
+        assert set(diff['teams']) == {"Team 1", "Team 2"}
+        changes = diff['teams']["Team 1"]
+        assert [p.name for p in changes['added']] == ["Player 1-1"]
+        assert [p.name for p in changes['removed']] == ["Player 0-0", "Player 0-1"]
+        assert changes['dead_money'][0] == 0.0 < changes['dead_money'][1]
+        assert [(p.name, before, after) for p, before, after in diff['teams']["Team 2"]['moved']] == [
+            ("Player 1-2", 'active', 'IR')]
+        assert diff['free_agents'] == {'added': [cut], 'removed': []}
+        assert diff['league'] == {}
+
+        fork.advance_season()
+        assert fork.diff()['league']['season_year'] == (2025, 2026)
+        assert len(fork.diff()['teams']) == 12
+
+    def test_services_leave_parent(self):
+        league = build_league()
+        before = {team.name: sorted((p.name, p.roster_status) for roster in team.roster.values() for p in roster)
+                  for team in league.teams}
+        fork = league.fork()
+
+        team_a, team_b = fork.get_team_by_name("Team 1"), fork.get_team_by_name("Team 2")
+        TradeService(fork).execute(Trade(team_a, team_b, [team_a.roster['active'][1]], [team_b.roster['active'][1]]))
+        over = fork.get_team_by_name("Team 3")
+        over.dead_money = over.get_remaining_cap() + 12.5
+        solver = CapComplianceSolver(fork)
+        plan, = solver.solve(workers=1)
+        solver.apply(plan)
+        assert over.is_salary_cap_compliant()
+
+        assert {team.name: sorted((p.name, p.roster_status) for roster in team.roster.values() for p in roster)
+                for team in league.teams} == before
+        assert league.teams[2].dead_money == 0.0 and league.free_agents == []
+
+        diff = fork.diff()
+        assert [p.name for p in diff['teams']["Team 1"]['added']] == ["Player 1-1"]
+        assert [p.name for p in diff['teams']["Team 2"]['added']] == ["Player 0-1"]
+        changes = diff['teams']["Team 3"]
+        assert ({p.name for p in changes['removed']} | {p.name for p, _, _ in changes['moved']}
+                == {m['player'].name for m in plan['moves']})
+        assert [p.name for p in diff['free_agents']['added']] == [m['player'].name for m in plan['moves']
+                                                                   if m['move'] == 'cut']
+
+    def test_commit(self):
+        league = build_league()
+        originals = {id(p): p for team in league.teams for roster in team.roster.values() for p in roster}
+        team_a = league.teams[0]
+        star = team_a.roster['active'][8]
+
+        fork = league.fork()
+        copy = fork.player(star)
+        fork.team("Team 1").extend_player_contract(copy, 2)
+        cut = fork.team("Team 2").roster['active'][0]
+        fork.team("Team 2").remove_player(cut)
+        fork.add_free_agent(cut)
+        signing = Player("Signing", "BUF", "WR", contract=Contract("Signing", 5.0, 2))
+        fork.team("Team 3").add_player(signing)
+        assert star.contract.years_remaining == 3
+
+        fork.commit()
+        assert league.teams[0] is team_a and star in team_a.roster['active']
+        assert star.contract.years_remaining == 5 and star.contract.current_salary == copy.contract.current_salary
+        assert [p.name for p in league.free_agents] == ["Player 1-0"] and league.free_agents[0] is originals[id(
+            league.free_agents[0])]
+        assert league.free_agents[0].fantasy_team is None and league.teams[1].dead_money > 0
+        assert league.players.get(signing.player_id) is signing and signing.fantasy_team == "Team 3"
+        assert all(p is originals.get(id(p), signing) for team in league.teams
+                   for roster in team.roster.values() for p in roster)
+        assert all(team.get_total_salary_used() == pytest.approx(team._recompute_salary_used())
+                   for team in league.teams)
+
+        # The fork starts over from the committed league
+        assert fork.diff() == {'teams': {}, 'free_agents': {'added': [], 'removed': []}, 'league': {}}
+        assert fork.team("Team 1").roster['active'][8].contract.years_remaining == 5
+
+    def test_advance_season_leaves_parent(self, monkeypatch):
+        monkeypatch.setattr('builtins.print', lambda *args, **kwargs: None)
+        league = build_league()
+        fork = league.fork()
+        fork.advance_season()
+
+        assert (league.season_year, fork.season_year) == (2025, 2026)
+        assert all(p.contract.years_remaining == 3 for team in league.teams
+                   for roster in team.roster.values() for p in roster)
+        assert all(p.contract.years_remaining == 2 for team in fork.teams
+                   for roster in team.roster.values() for p in roster)
+
+        fork.commit()
+        assert league.season_year == 2026
+        assert league.teams[0].roster['active'][0].contract.years_remaining == 2
+
+    def test_forks_are_cheap(self):
+        league = build_league(players_per_team=20)
+        start = time.perf_counter()
+        forks = [league.fork() for _ in range(2000)]
+        assert time.perf_counter() - start < 1.0
+
+        # Touching one team copies only its roster
+        forks[0].team("Team 5")
+        assert len(forks[0]._copies) == 1 + 2 * 20
+
+
+class TestInstrumentation:
+    """Test the opt-in profiling hooks"""
+
+    def test_counts_hooked_calls(self, capsys):
+        league = build_league(num_teams=4)
+        with Profiler() as profiler:
+            league.advance_season()
+            league.get_team_by_name("Team 1")
+
+        stats = {row['name']: row for row in profiler.summary()}
+        assert stats['League.advance_season']['calls'] == 1
+        assert stats['Team.advance_contracts']['calls'] == 4
+        assert stats['League.get_team_by_name']['calls'] == 1
+        assert stats['League.advance_season']['total'] >= stats['League._process_holdouts']['total']
+        assert profiler.summary()[0]['category'] == 'offseason'
+        assert profiler.wall_time > 0
+
+    def test_restores_methods(self):
+        originals = (League.__dict__['advance_season'], Team.__dict__['get_total_salary_used'])
+        with Profiler():
+            assert League.__dict__['advance_season'] is not originals[0]
+        assert (League.__dict__['advance_season'], Team.__dict__['get_total_salary_used']) == originals
+        assert instrumentation.active() is None
+
+    def test_bad_hook_leaves_nothing_patched(self):
+        original = Team.__dict__['add_player']
+        profiler = Profiler({'roster': ['src.models.team:Team.add_player', 'src.models.team:Team.missing']})
+        with pytest.raises(AttributeError):
+            profiler.start()
+        assert Team.__dict__['add_player'] is original
+        assert instrumentation.active() is None
+
+    def test_phase(self):
+        with phase("ignored"):
+            pass
+
+        with Profiler({}) as profiler:
+            with phase("load"):
+                pass
+            with pytest.raises(ValueError, match="already running"):
+                Profiler({}).start()
+
+        assert [(r['name'], r['category'], r['calls']) for r in profiler.summary()] == [("load", "phase", 1)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])